@@ -60,6 +60,89 @@ GOOGLE_API = {
     'token_directory': 'tokens'
 }
 
+# Um banco SQLite por usuário (o banco principal fica só com o catálogo de usuários)
+SHARDING = {
+    'enabled': os.environ.get('ANIMEPRODUCTIVITY_SHARDING', '') not in ('', '0'),
+    'directory': 'users',  # subpasta do diretório de dados
+    'max_engines': 16  # engines de usuários mantidas abertas (LRU)
+}
+
+# Inicialização (tempo máximo da partida a frio até a primeira janela)
+STARTUP = {
+    'budget_ms': 1500,
+    'log_file': 'startup.log'  # no diretório de dados
+}
+
+# Hash de senhas (o custo do bcrypt é calibrado para o tempo alvo)
+PASSWORD_HASHING = {
+    'target_ms': 250,
+    'min_rounds': 10,
+    'max_rounds': 14,
+    'calibration_file': 'bcrypt_cost.json'  # no diretório de dados
+}
+
+# Cópias de segurança dos bancos de dados
+BACKUP = {
+    'enabled': True,
+    'directory': 'backups',  # subpasta do diretório de dados
+    'interval_minutes': 60,
+    'keep': 10,  # cópias mantidas por banco
+    'pages_per_step': 64,  # páginas copiadas por lote
+    'step_sleep_ms': 5  # pausa entre os lotes
+}
+
+# Relógio central das animações
+ANIMATION = {
+    'max_fps': 60,  # limite de quadros por segundo somando todas as animações
+    'max_dt_ms': 100  # maior passo entregue às animações (ex.: após travamento)
+}
+
+# Cache dos quadros das sprite sheets (compartilhado por todas as folhas)
+SPRITES = {
+    'cache_mb': 32,  # orçamento dos quadros decodificados mantidos em memória
+    'memmap': True,  # guardar os quadros em RGBA bruto no disco e mapeá-los
+    'directory': 'sprite_cache'  # subpasta do diretório de dados
+}
+
+# Cache de imagens baixadas (memória + disco) e APIs de onde vêm
+ASSETS = {
+    'memory_mb': 16,  # imagens decodificadas mantidas em memória
+    'directory': 'asset_cache',  # subpasta do diretório de dados
+    'workers': 4,  # downloads simultâneos
+    'timeout_seconds': 10,
+    'failure_ttl_seconds': 60,  # tempo em que uma URL que falhou não é pedida de novo
+    'waifu_url': 'https://api.waifu.pics/sfw/',
+    'icons_url': 'https://img.icons8.com'
+}
+
+# Fila de gravação em segundo plano (eventos de sessões, tarefas e XP)
+WRITE_BEHIND = {
+    'batch_ms': 250,  # tempo máximo que uma gravação espera na fila
+    'batch_size': 100  # gravações que disparam uma transação imediatamente
+}
+
+# Diário do timer Pomodoro (registros de tamanho fixo para retomar após uma falha)
+TIMER_JOURNAL = {
+    'directory': 'journal',  # subpasta do diretório de dados
+    'max_records': 4096  # acima disso o diário é compactado para o último registro
+}
+
+# Manutenção do banco (vacuum incremental, ANALYZE e PRAGMA optimize)
+MAINTENANCE = {
+    'enabled': True,
+    'check_interval_seconds': 60,
+    'idle_seconds': 120,  # tempo sem gravações para considerar o banco ocioso
+    'vacuum_pages': 500,  # páginas liberadas por execução do vacuum incremental
+    'bulk_change_rows': 5000  # linhas alteradas que disparam um novo ANALYZE
+}
+
+# Instrumentação de consultas SQL (habilitada pela variável de ambiente)
+SQL_INSTRUMENTATION = {
+    'env_var': 'ANIMEPRODUCTIVITY_SQL_TRACE',
+    'repeat_threshold': 10,  # execuções do mesmo comando em uma ação
+    'buckets_ms': [1, 5, 10, 50, 100, 500]  # limites do histograma de latência
+}
+
 DISTRACTION_DEFAULTS = {
     "Redes Sociais": [
         "facebook.com",
@@ -0,0 +1,145 @@
+from datetime import datetime, timedelta
+from sqlalchemy import (
+    create_engine, MetaData, Table, Column, Integer, DateTime, select, union_all,
+    delete, and_, literal, inspect, text
+)
+from src.database.database import engine, ARCHIVE_PATH
+from src.database.models import PomodoroSession, StudySession, Task
+import os
+import sys
+import logging
+
+ARCHIVE_SCHEMA = 'archive'
+ARCHIVED_MODELS = (PomodoroSession, StudySession, Task)
+
+_archive_metadata = MetaData()
+_archive_tables = {}
+
+def archive_exists() -> bool:
+    """Indica se o banco de arquivo já foi criado."""
+    return os.path.exists(ARCHIVE_PATH)
+
+def archived_table(model, schema: str = ARCHIVE_SCHEMA) -> Table:
+    """Retorna a tabela equivalente no banco de arquivo anexado.
+
+    As linhas arquivadas têm chave própria (``archive_id``): o ``id``
+    original pode se repetir, pois o SQLite reaproveita ids depois que os
+    maiores são removidos e cada shard de usuário numera os seus.
+    """
+    table = model.__table__
+    key = (schema, table.name)
+    if key not in _archive_tables:
+        metadata = _archive_metadata if schema == ARCHIVE_SCHEMA else MetaData()
+        _archive_tables[key] = Table(
+            table.name,
+            metadata,
+            Column('archive_id', Integer, primary_key=True, autoincrement=True),
+            Column('archived_at', DateTime, nullable=False),
+            *[Column(column.name, column.type) for column in table.columns],
+            schema=schema,
+            sqlite_autoincrement=True
+        )
+    return _archive_tables[key]
+
+def all_time(model):
+    """Retorna as linhas do banco ativo e do arquivo como um único selectable (UNION ALL).
+
+    Sem arquivo, devolve a própria tabela; nos dois casos as colunas ficam em ``.c``.
+    """
+    table = model.__table__
+    if not archive_exists():
+        return table
+
+    archived = archived_table(model)
+    return union_all(
+        select(*table.columns),
+        select(*[archived.c[column.name] for column in table.columns])
+    ).subquery(table.name)
+
+class ArchiveManager:
+    """Move sessões e tarefas concluídas antigas para o banco de arquivo (archive.db)."""
+
+    def __init__(self):
+        self.logger = logging.getLogger('archive_manager')
+
+    def archive(self, months: int = 12) -> dict:
+        """Arquiva os registros com mais de ``months`` meses."""
+        cutoff = datetime.now() - timedelta(days=30 * months)
+        self._ensure_archive()
+
+        conditions = {
+            PomodoroSession: PomodoroSession.start_time < cutoff,
+            StudySession: StudySession.start_time < cutoff,
+            Task: and_(
+                Task.completed == True,
+                Task.completion_date < cutoff
+            )
+        }
+
+        moved = {}
+        archived_at = datetime.now()
+        try:
+            with engine.begin() as conn:
+                for model, condition in conditions.items():
+                    table = model.__table__
+                    archived = archived_table(model)
+                    columns = [column.name for column in table.columns]
+
+                    conn.execute(archived.insert().from_select(
+                        ['archived_at'] + columns,
+                        select(literal(archived_at, DateTime), *table.columns).where(condition)
+                    ))
+                    result = conn.execute(delete(table).where(condition))
+                    moved[table.name] = result.rowcount
+
+            self.logger.info(f"Arquivamento concluído (antes de {cutoff:%d/%m/%Y}): {moved}")
+
+            # Recupera o espaço das linhas removidas e atualiza as estatísticas
+            # (pelo agendador, quando o app está aberto; senão, agora)
+            from src.database.maintenance import DatabaseMaintenance, notify_bulk_change
+            if not notify_bulk_change():
+                maintenance = DatabaseMaintenance()
+                maintenance.incremental_vacuum()
+                maintenance.analyze()
+            return moved
+
+        except Exception as e:
+            self.logger.error(f"Erro ao arquivar registros: {e}")
+            raise
+
+    def _ensure_archive(self):
+        """Cria (ou atualiza) o banco de arquivo e faz as conexões o anexarem."""
+        created = not archive_exists()
+        archive_engine = create_engine(f"sqlite:///{ARCHIVE_PATH}")
+        try:
+            with archive_engine.begin() as conn:
+                existing = inspect(conn)
+                for model in ARCHIVED_MODELS:
+                    table = archived_table(model, schema=None)
+                    if not existing.has_table(table.name):
+                        table.create(conn)
+                    elif 'archive_id' not in [c['name'] for c in existing.get_columns(table.name)]:
+                        self._upgrade_table(conn, model, table)
+        finally:
+            archive_engine.dispose()
+
+        if created:
+            # Conexões abertas antes da criação do arquivo não o têm anexado
+            engine.dispose()
+
+    def _upgrade_table(self, conn, model, table):
+        """Converte uma tabela do formato antigo (chave = id original)."""
+        old_name = f"{table.name}_old"
+        columns = ", ".join(column.name for column in model.__table__.columns)
+        conn.execute(text(f"ALTER TABLE {table.name} RENAME TO {old_name}"))
+        table.create(conn)
+        conn.execute(text(
+            f"INSERT INTO {table.name} (archived_at, {columns}) "
+            f"SELECT CURRENT_TIMESTAMP, {columns} FROM {old_name}"
+        ))
+        conn.execute(text(f"DROP TABLE {old_name}"))
+        self.logger.info(f"Tabela {table.name} do arquivo convertida para chave própria")
+
+if __name__ == "__main__":
+    months = int(sys.argv[1]) if len(sys.argv) > 1 else 12
+    print(ArchiveManager().archive(months))
@@ -1,44 +1,92 @@
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.ext.declarative import declarative_base
+from datetime import datetime
 import os
 import sys
 
 def get_data_dir():
     """Retorna o diretório de dados da aplicação."""
     # Usar diretório na pasta do usuário para garantir permissões de escrita
+    # (ANIMEPRODUCTIVITY_DATA_DIR permite isolar dados, ex.: em benchmarks)
     home = os.path.expanduser("~")
-    data_dir = os.path.join(home, ".matematica_em_evidencia")
+    data_dir = os.environ.get("ANIMEPRODUCTIVITY_DATA_DIR") or os.path.join(home, ".matematica_em_evidencia")
     os.makedirs(data_dir, exist_ok=True)
     return data_dir
 
 # Configurar banco de dados
 DATA_DIR = get_data_dir()
 DATABASE_URL = f"sqlite:///{os.path.join(DATA_DIR, 'animeproductivity.db')}"
+ARCHIVE_PATH = os.path.join(DATA_DIR, 'archive.db')
 engine = create_engine(DATABASE_URL)
+
+@event.listens_for(engine, "connect")
+def _attach_archive(dbapi_connection, connection_record):
+    """Anexa o banco de arquivo (sessões antigas) a cada nova conexão."""
+    if os.path.exists(ARCHIVE_PATH):
+        dbapi_connection.execute("ATTACH DATABASE ? AS archive", (ARCHIVE_PATH,))
+
+from src.database import instrumentation
+if instrumentation.is_enabled():
+    instrumentation.instrument(engine)
+
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 Base = declarative_base()
 
 def init_db():
-    """Inicializa o banco de dados."""
-    from src.database.models import Base, User
+    """Inicializa o banco de dados.
+
+    Após a primeira execução só cria tabelas novas e confere os marcadores
+    em app_meta; migrações e o usuário de teste não são refeitos.
+    """
+    from src.database.models import Base, AppMeta
+    from src.database.migrations import upgrade_database, SCHEMA_VERSION
     Base.metadata.create_all(bind=engine)
     
-    # Criar usuário de teste se não existir
     session = get_session()
     try:
-        if not session.query(User).filter_by(username="test").first():
-            User.create(
-                username="test",
-                password="test123",
-                email="test@example.com"
-            )
-            print("Usuário de teste criado com sucesso")
+        meta = {row.key: row.value for row in session.query(AppMeta).all()}
+        
+        if int(meta.get('schema_version', 0)) < SCHEMA_VERSION:
+            upgrade_database()
+            session.merge(AppMeta(key='schema_version', value=str(SCHEMA_VERSION)))
+            session.commit()
+        
+        if 'first_run_completed' not in meta:
+            _first_run_setup(session)
+            session.merge(AppMeta(key='first_run_completed', value=datetime.now().isoformat()))
+            session.commit()
     except Exception as e:
-        print(f"Erro ao criar usuário de teste: {e}")
+        session.rollback()
+        print(f"Erro ao inicializar o banco de dados: {e}")
     finally:
         session.close()
 
-def get_session():
-    """Retorna uma nova sessão do banco de dados."""
+def _first_run_setup(session):
+    """Configuração feita uma única vez, na primeira execução.
+
+    Erros sobem para ``init_db``: o marcador first_run_completed só é
+    gravado se tudo der certo, e a configuração é refeita na próxima vez.
+    """
+    from src.database.models import User
+    
+    # Criar usuário de teste se não existir
+    if not session.query(User).filter_by(username="test").first():
+        User.create(
+            username="test",
+            password="test123",
+            email="test@example.com"
+        )
+        print("Usuário de teste criado com sucesso")
+
+def get_session(user_id=None):
+    """Retorna uma nova sessão do banco de dados.
+
+    Com SHARDING habilitado e ``user_id`` informado, a sessão aponta para o
+    banco do próprio usuário; sem ``user_id``, para o banco principal.
+    """
+    from src.config.settings import SHARDING
+    if user_id is not None and SHARDING['enabled']:
+        from src.database.sharding import get_router
+        return get_router().session_for(user_id)
     return SessionLocal() 
\ No newline at end of file
@@ -0,0 +1,189 @@
+from contextlib import contextmanager
+from collections import defaultdict
+import atexit
+import bisect
+import os
+import re
+import threading
+import time
+import logging
+from src.config.settings import SQL_INSTRUMENTATION
+
+_WHITESPACE = re.compile(r'\s+')
+
+class _StatementStats:
+    """Latências acumuladas de um comando SQL."""
+
+    def __init__(self, buckets):
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+        self.histogram = [0] * (len(buckets) + 1)
+
+class QueryInstrumentation:
+    """Registra os comandos SQL executados pela engine e detecta padrões N+1.
+
+    Cada comando (o texto com parâmetros, sem os valores) ganha um
+    histograma de latência. Dentro de uma ação (``with action("nome")``),
+    comandos repetidos mais de ``repeat_threshold`` vezes são registrados
+    como suspeitos de N+1.
+    """
+
+    def __init__(self, buckets_ms=None, repeat_threshold=None):
+        self.buckets_ms = list(buckets_ms or SQL_INSTRUMENTATION['buckets_ms'])
+        self.repeat_threshold = repeat_threshold or SQL_INSTRUMENTATION['repeat_threshold']
+        self.logger = logging.getLogger('sql_instrumentation')
+        self.stats = {}
+        self.repeats = []
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._engines = []
+
+    def install(self, engine):
+        """Registra os eventos de execução na engine."""
+        from sqlalchemy import event
+        event.listen(engine, "before_cursor_execute", self._before_execute)
+        event.listen(engine, "after_cursor_execute", self._after_execute)
+        self._engines.append(engine)
+
+    def uninstall(self):
+        """Remove os eventos de todas as engines instrumentadas."""
+        from sqlalchemy import event
+        for engine in self._engines:
+            event.remove(engine, "before_cursor_execute", self._before_execute)
+            event.remove(engine, "after_cursor_execute", self._after_execute)
+        self._engines.clear()
+
+    def _before_execute(self, conn, cursor, statement, parameters, context, executemany):
+        # No contexto da execução, e não em uma pilha na conexão: um comando
+        # que falha não chega a after_cursor_execute e desalinharia a pilha
+        context._query_start = time.perf_counter()
+
+    def _after_execute(self, conn, cursor, statement, parameters, context, executemany):
+        start = getattr(context, '_query_start', None)
+        if start is None:
+            return
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        key = _WHITESPACE.sub(' ', statement).strip()
+
+        with self._lock:
+            stats = self.stats.get(key)
+            if stats is None:
+                stats = self.stats[key] = _StatementStats(self.buckets_ms)
+            stats.count += 1
+            stats.total_ms += elapsed_ms
+            stats.max_ms = max(stats.max_ms, elapsed_ms)
+            stats.histogram[bisect.bisect_left(self.buckets_ms, elapsed_ms)] += 1
+
+        actions = getattr(self._local, 'actions', None)
+        if actions:
+            actions[-1]['counts'][key] += 1
+
+    @contextmanager
+    def action(self, name: str):
+        """Agrupa os comandos executados por uma ação da interface."""
+        actions = getattr(self._local, 'actions', None)
+        if actions is None:
+            actions = self._local.actions = []
+
+        current = {'name': name, 'counts': defaultdict(int)}
+        actions.append(current)
+        try:
+            yield
+        finally:
+            actions.pop()
+            for key, count in current['counts'].items():
+                if count > self.repeat_threshold:
+                    with self._lock:
+                        self.repeats.append((name, count, key))
+                    self.logger.warning(
+                        f"Possível N+1 em '{name}': comando executado {count} vezes: {key[:120]}"
+                    )
+
+    def reset(self):
+        """Descarta as medições acumuladas."""
+        with self._lock:
+            self.stats.clear()
+            self.repeats.clear()
+
+    def summary(self, limit: int = 20) -> str:
+        """Retorna um relatório com os comandos mais custosos e as repetições."""
+        with self._lock:
+            items = sorted(self.stats.items(), key=lambda item: item[1].total_ms, reverse=True)
+            repeats = list(self.repeats)
+
+        labels = [f"<{bucket:g}ms" for bucket in self.buckets_ms] + [f">={self.buckets_ms[-1]:g}ms"]
+        lines = [
+            f"Comandos SQL distintos: {len(items)}, "
+            f"execuções: {sum(stats.count for _, stats in items)}",
+            ""
+        ]
+        for key, stats in items[:limit]:
+            histogram = " ".join(
+                f"{label}:{count}" for label, count in zip(labels, stats.histogram) if count
+            )
+            lines.append(
+                f"{stats.count:>7}x  total {stats.total_ms:>9.1f}ms  "
+                f"média {stats.total_ms / stats.count:>7.2f}ms  máx {stats.max_ms:>7.2f}ms"
+            )
+            lines.append(f"         {histogram}")
+            lines.append(f"         {key[:160]}")
+
+        if repeats:
+            lines.append("")
+            lines.append("Possíveis N+1 (comandos repetidos em uma ação):")
+            for name, count, key in repeats:
+                lines.append(f"  {name}: {count}x {key[:120]}")
+
+        return "\n".join(lines)
+
+    def dump(self):
+        """Registra o relatório no log."""
+        self.logger.info("Resumo da instrumentação SQL:\n" + self.summary())
+
+_instrumentation = None
+
+def is_enabled() -> bool:
+    """Indica se a instrumentação foi habilitada pela variável de ambiente."""
+    return os.environ.get(SQL_INSTRUMENTATION['env_var'], '') not in ('', '0')
+
+def _log_to_stderr(logger):
+    """Mostra o log da instrumentação no terminal.
+
+    O app não configura o logging (e o SessionManager manda a raiz para
+    um arquivo), então o resumo em INFO não apareceria em lugar nenhum.
+    """
+    if not logger.handlers:
+        handler = logging.StreamHandler()
+        handler.setFormatter(logging.Formatter('%(asctime)s [%(name)s] %(levelname)s: %(message)s'))
+        logger.addHandler(handler)
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+
+def instrument(engine) -> QueryInstrumentation:
+    """Instrumenta a engine e agenda o resumo para o encerramento do processo."""
+    global _instrumentation
+    if _instrumentation is None:
+        _instrumentation = QueryInstrumentation()
+        _log_to_stderr(_instrumentation.logger)
+        atexit.register(_instrumentation.dump)
+    _instrumentation.install(engine)
+    return _instrumentation
+
+def get_instrumentation():
+    """Retorna a instrumentação ativa (ou None se estiver desabilitada)."""
+    return _instrumentation
+
+@contextmanager
+def action(name: str):
+    """Marca uma ação da interface; não faz nada com a instrumentação desabilitada."""
+    if _instrumentation is None:
+        yield
+        return
+    with _instrumentation.action(name):
+        yield
+
+def dump_summary():
+    """Registra o resumo sob demanda."""
+    if _instrumentation is not None:
+        _instrumentation.dump()
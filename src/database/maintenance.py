@@ -0,0 +1,182 @@
+from sqlalchemy import event
+import sys
+import threading
+import time
+import logging
+from src.database.database import engine
+from src.config.settings import MAINTENANCE
+
+# Consultas frequentes dos serviços, usadas para comparar os planos de execução
+REPRESENTATIVE_QUERIES = [
+    ("SELECT * FROM pomodoro_sessions WHERE user_id = ? AND start_time >= ? AND completed = 1",
+     (1, '2000-01-01')),
+    ("SELECT * FROM study_sessions WHERE user_id = ? AND start_time >= ?",
+     (1, '2000-01-01')),
+    ("SELECT * FROM tasks WHERE user_id = ? AND created_at >= ? AND created_at < ?",
+     (1, '2000-01-01', '2000-01-02')),
+    ("SELECT * FROM tasks WHERE user_id = ? AND completed = 1 AND completion_date >= ?",
+     (1, '2000-01-01')),
+    ("SELECT * FROM daily_stats WHERE user_id = ? AND day >= ?",
+     (1, '2000-01-01'))
+]
+
+class DatabaseMaintenance:
+    """Manutenção do banco: vacuum incremental, ANALYZE e PRAGMA optimize."""
+
+    def __init__(self, db_engine=None):
+        self.engine = db_engine or engine
+        self.logger = logging.getLogger('database_maintenance')
+
+    def _connect(self):
+        return self.engine.connect().execution_options(isolation_level="AUTOCOMMIT")
+
+    def incremental_vacuum(self, pages: int = None) -> int:
+        """Libera até ``pages`` páginas livres; retorna os bytes recuperados."""
+        pages = pages or MAINTENANCE['vacuum_pages']
+        with self._connect() as connection:
+            page_size = connection.exec_driver_sql("PRAGMA page_size").scalar()
+            before = connection.exec_driver_sql("PRAGMA freelist_count").scalar()
+            if not before:
+                return 0
+
+            # O pragma libera uma página a cada passo da instrução, e o módulo
+            # sqlite3 dá um só passo em instruções sem colunas (mesmo com
+            # fetchall); executescript roda a instrução até o fim
+            connection.connection.driver_connection.executescript(
+                f"PRAGMA incremental_vacuum({int(pages)});"
+            )
+            after = connection.exec_driver_sql("PRAGMA freelist_count").scalar()
+
+        reclaimed = (before - after) * page_size
+        self.logger.info(f"Vacuum incremental: {reclaimed} bytes recuperados ({before - after} páginas)")
+        return reclaimed
+
+    def query_plans(self) -> dict:
+        """Retorna o EXPLAIN QUERY PLAN de cada consulta representativa."""
+        plans = {}
+        with self._connect() as connection:
+            for sql, params in REPRESENTATIVE_QUERIES:
+                try:
+                    rows = connection.exec_driver_sql(f"EXPLAIN QUERY PLAN {sql}", params).fetchall()
+                    plans[sql] = [row[-1] for row in rows]
+                except Exception as e:
+                    plans[sql] = [f"erro: {e}"]
+        return plans
+
+    def analyze(self) -> dict:
+        """Atualiza as estatísticas do planejador; retorna os planos que mudaram."""
+        before = self.query_plans()
+        with self._connect() as connection:
+            connection.exec_driver_sql("ANALYZE")
+            connection.exec_driver_sql("PRAGMA optimize")
+        after = self.query_plans()
+
+        changes = {
+            sql: {'before': before[sql], 'after': after[sql]}
+            for sql in after
+            if before.get(sql) != after[sql]
+        }
+        for sql, change in changes.items():
+            self.logger.info(f"Plano alterado: {sql}\n  antes: {change['before']}\n  depois: {change['after']}")
+        self.logger.info(f"ANALYZE concluído: {len(changes)} plano(s) alterado(s)")
+        return changes
+
+class MaintenanceScheduler:
+    """Executa a manutenção em segundo plano quando o banco fica ocioso.
+
+    A atividade é acompanhada pelos eventos da engine: o vacuum incremental
+    roda após ``idle_seconds`` sem gravações, e o ANALYZE roda quando o
+    número de linhas alteradas desde a última análise passa de
+    ``bulk_change_rows``.
+    """
+
+    def __init__(self, db_engine=None):
+        self.engine = db_engine or engine
+        self.maintenance = DatabaseMaintenance(self.engine)
+        self.logger = logging.getLogger('maintenance_scheduler')
+        self.last_write = time.monotonic()
+        self.changed_rows = 0
+        self._lock = threading.Lock()  # changed_rows é alterado por várias threads
+        self._stop = threading.Event()
+        self._thread = None
+
+    def start(self):
+        """Passa a observar o banco e inicia a thread de manutenção."""
+        if self._thread and self._thread.is_alive():
+            return
+
+        event.listen(self.engine, "after_cursor_execute", self._on_execute)
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name='maintenance', daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """Interrompe a manutenção agendada."""
+        self._stop.set()
+        event.remove(self.engine, "after_cursor_execute", self._on_execute)
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive() and not self._stop.is_set()
+
+    def notify_bulk_change(self):
+        """Registra o fim de uma alteração em massa (importação, arquivamento).
+
+        As linhas já foram contadas por ``_on_execute``; aqui só se adia a
+        manutenção até o banco ficar ocioso de novo.
+        """
+        with self._lock:
+            self.last_write = time.monotonic()
+
+    def _on_execute(self, conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip()[:6].upper() in ('INSERT', 'UPDATE', 'DELETE'):
+            with self._lock:
+                self.last_write = time.monotonic()
+                self.changed_rows += max(cursor.rowcount, 0)
+
+    def _run(self):
+        while not self._stop.wait(MAINTENANCE['check_interval_seconds']):
+            if time.monotonic() - self.last_write < MAINTENANCE['idle_seconds']:
+                continue
+            with self._lock:
+                bulk_change = self.changed_rows >= MAINTENANCE['bulk_change_rows']
+                if bulk_change:
+                    self.changed_rows = 0
+            try:
+                if bulk_change:
+                    self.maintenance.analyze()
+                self.maintenance.incremental_vacuum()
+            except Exception as e:
+                self.logger.error(f"Erro na manutenção do banco: {e}")
+
+_scheduler = None
+_scheduler_lock = threading.Lock()
+
+def get_scheduler() -> MaintenanceScheduler:
+    """Retorna o agendador de manutenção compartilhado pelo processo."""
+    global _scheduler
+    with _scheduler_lock:
+        if _scheduler is None:
+            _scheduler = MaintenanceScheduler()
+        return _scheduler
+
+def notify_bulk_change() -> bool:
+    """Avisa o agendador de uma carga ou remoção em massa.
+
+    Retorna False quando não há agendador rodando (ex.: linha de comando);
+    nesse caso o chamador deve rodar a manutenção ele mesmo.
+    """
+    if _scheduler is None or not _scheduler.running:
+        return False
+    _scheduler.notify_bulk_change()
+    return True
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    maintenance = DatabaseMaintenance()
+    pages = int(sys.argv[1]) if len(sys.argv) > 1 else None
+    print(f"Bytes recuperados: {maintenance.incremental_vacuum(pages)}")
+    for sql, change in maintenance.analyze().items():
+        print(sql)
+        print(f"  antes:  {change['before']}")
+        print(f"  depois: {change['after']}")
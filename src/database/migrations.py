@@ -1,31 +1,49 @@
-from sqlalchemy import create_engine, MetaData, Table, Column, Boolean, DateTime
+from sqlalchemy import create_engine, MetaData, Table, Column, Boolean, DateTime, text
 from src.database.database import DATABASE_URL
+import logging
+
+logger = logging.getLogger('migrations')
+
+# Incrementar ao adicionar uma nova migração em upgrade_database
+SCHEMA_VERSION = 2
 
 def upgrade_database():
     """Executa as migrações necessárias."""
     engine = create_engine(DATABASE_URL)
     metadata = MetaData()
-    
+
     # Obter a tabela tasks
     tasks = Table('tasks', metadata, autoload_with=engine)
-    
+
     # Adicionar novas colunas se não existirem
     with engine.begin() as connection:
         # Verificar se a coluna completed existe
         if 'completed' not in tasks.columns:
-            connection.execute('''
-                ALTER TABLE tasks 
+            connection.execute(text('''
+                ALTER TABLE tasks
                 ADD COLUMN completed BOOLEAN DEFAULT FALSE
-            ''')
-            
+            '''))
+
         # Verificar se a coluna completion_date existe
         if 'completion_date' not in tasks.columns:
-            connection.execute('''
-                ALTER TABLE tasks 
+            connection.execute(text('''
+                ALTER TABLE tasks
                 ADD COLUMN completion_date DATETIME
-            ''')
-            
-        connection.commit()
+            '''))
+
+    enable_incremental_vacuum(engine)
+    engine.dispose()
+
+def enable_incremental_vacuum(engine):
+    """Muda o banco para auto_vacuum=INCREMENTAL (exige um VACUUM completo, uma única vez)."""
+    with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as connection:
+        mode = connection.exec_driver_sql("PRAGMA auto_vacuum").scalar()
+        if mode == 2:  # 2 = INCREMENTAL
+            return
+
+        logger.info("Convertendo o banco para auto_vacuum=INCREMENTAL...")
+        connection.exec_driver_sql("PRAGMA auto_vacuum = INCREMENTAL")
+        connection.exec_driver_sql("VACUUM")
 
 if __name__ == "__main__":
-    upgrade_database() 
\ No newline at end of file
+    upgrade_database()
@@ -1,10 +1,10 @@
 from datetime import datetime
-from sqlalchemy import create_engine, Column, Integer, String, DateTime, Boolean, ForeignKey
+from sqlalchemy import create_engine, Column, Integer, String, DateTime, Date, Boolean, ForeignKey, UniqueConstraint
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import relationship
 from enum import Enum
-import bcrypt
 from src.database.database import get_session
+from src.utils import password_hasher
 
 Base = declarative_base()
 
@@ -30,23 +30,21 @@ class User(Base):
     @staticmethod
     def authenticate(username: str, password: str) -> 'User':
         """Autentica um usuário."""
-        session = get_session()
-        user = session.query(User).filter_by(username=username).first()
-        
-        if user and User.verify_password(password, user.password_hash):
-            return user
-        return None
+        from src.services.auth import AuthService  # Importação local para evitar circular
+        return AuthService().authenticate(username, password)
     
     @staticmethod
-    def create(username: str, password: str, email: str = None) -> 'User':
-        """Cria um novo usuário com senha criptografada."""
+    def create(username: str, password: str = None, email: str = None, password_hash: str = None) -> 'User':
+        """Cria um novo usuário com senha criptografada.
+
+        Aceita um ``password_hash`` já calculado (por exemplo, em uma thread
+        de trabalho) no lugar da senha.
+        """
         session = get_session()
         try:
             # Gerar hash da senha
-            password_hash = bcrypt.hashpw(
-                password.encode('utf-8'), 
-                bcrypt.gensalt()
-            ).decode('utf-8')
+            if password_hash is None:
+                password_hash = password_hasher.hash_password(password)
             
             # Criar usuário
             user = User(
@@ -65,14 +63,7 @@ class User(Base):
     
     def verify_password(self, password: str) -> bool:
         """Verifica se a senha está correta."""
-        try:
-            return bcrypt.checkpw(
-                password.encode('utf-8'),
-                self.password_hash.encode('utf-8')
-            )
-        except Exception as e:
-            print(f"Erro ao verificar senha: {e}")
-            return False
+        return password_hasher.verify_password(password, self.password_hash)
 
 class Task(Base):
     __tablename__ = 'tasks'
@@ -174,5 +165,26 @@ class StudySession(Base):
     
     user = relationship("User", back_populates="study_sessions")
 
+class DailyStats(Base):
+    """Resumo diário por usuário, derivado das sessões e tarefas."""
+    __tablename__ = 'daily_stats'
+    
+    id = Column(Integer, primary_key=True)
+    user_id = Column(Integer, ForeignKey('users.id'), index=True)
+    day = Column(Date, nullable=False)
+    pomodoros = Column(Integer, default=0)        # Pomodoros completos
+    focus_minutes = Column(Integer, default=0)    # Minutos em pomodoros completos
+    study_minutes = Column(Integer, default=0)    # Minutos em sessões de estudo
+    tasks_completed = Column(Integer, default=0)
+    
+    __table_args__ = (UniqueConstraint('user_id', 'day'),)
+
+class AppMeta(Base):
+    """Marcadores da aplicação (ex.: primeira execução concluída, versão do esquema)."""
+    __tablename__ = 'app_meta'
+    
+    key = Column(String, primary_key=True)
+    value = Column(String)
+
 # Adicionar relação na classe User
 User.pomodoro_sessions = relationship("PomodoroSession", back_populates="user") 
\ No newline at end of file
@@ -0,0 +1,151 @@
+from collections import OrderedDict
+from sqlalchemy import create_engine, event, select, insert
+from sqlalchemy.orm import sessionmaker
+from src.database.database import engine, get_data_dir, _attach_archive
+from src.database.models import Base, User
+from src.config.settings import SHARDING
+import os
+import sys
+import threading
+import logging
+
+def shard_path(user_id: int) -> str:
+    """Caminho do banco de um usuário."""
+    return os.path.join(get_data_dir(), SHARDING['directory'], f"{int(user_id)}.db")
+
+class ShardRouter:
+    """Distribui as sessões de cada usuário para o seu próprio banco SQLite.
+
+    O banco principal continua sendo o catálogo de usuários; cada shard
+    guarda os dados do usuário e cópias da própria linha de ``users`` e das
+    tabelas globais, como as conquistas (para as chaves estrangeiras e
+    relacionamentos). As engines abertas
+    ficam em um pool LRU limitado a ``max_engines``.
+    """
+
+    def __init__(self, max_engines: int = None):
+        self.max_engines = max_engines or SHARDING['max_engines']
+        self.logger = logging.getLogger('shard_router')
+        self._engines = OrderedDict()
+        self._lock = threading.Lock()
+        os.makedirs(os.path.join(get_data_dir(), SHARDING['directory']), exist_ok=True)
+
+    def engine_for(self, user_id: int):
+        """Retorna (abrindo se necessário) a engine do banco do usuário."""
+        return self._entry(user_id)[0]
+
+    def session_for(self, user_id: int):
+        """Retorna uma nova sessão no banco do usuário."""
+        return self._entry(user_id)[1]()
+
+    def _entry(self, user_id: int):
+        """Par (engine, sessionmaker) do usuário, obtido sob uma única trava."""
+        with self._lock:
+            if user_id in self._engines:
+                self._engines.move_to_end(user_id)
+                return self._engines[user_id]
+
+            shard_engine = self._open(user_id)
+            entry = (shard_engine, sessionmaker(
+                autocommit=False, autoflush=False, bind=shard_engine
+            ))
+            self._engines[user_id] = entry
+
+            while len(self._engines) > self.max_engines:
+                evicted_id, (evicted, _) = self._engines.popitem(last=False)
+                evicted.dispose()
+                self.logger.debug(f"Engine do usuário {evicted_id} fechada (LRU)")
+
+            return entry
+
+    def _open(self, user_id: int):
+        """Cria a engine do shard, criando o banco na primeira vez."""
+        path = shard_path(user_id)
+        created = not os.path.exists(path)
+
+        shard_engine = create_engine(f"sqlite:///{path}")
+        event.listen(shard_engine, "connect", _attach_archive)
+
+        if created:
+            Base.metadata.create_all(shard_engine)
+            self._copy_shared_rows(user_id, shard_engine)
+            self.logger.info(f"Banco do usuário {user_id} criado em {path}")
+
+        return shard_engine
+
+    def _copy_shared_rows(self, user_id, shard_engine):
+        """Copia a linha do usuário e as tabelas globais (ex.: conquistas) para o shard."""
+        users = User.__table__
+        shared = [
+            table for table in Base.metadata.sorted_tables
+            if 'user_id' not in table.c and table is not users
+        ]
+
+        with engine.connect() as conn:
+            user_row = conn.execute(select(users).where(users.c.id == user_id)).mappings().first()
+            shared_rows = {
+                table: [dict(row) for row in conn.execute(select(table)).mappings()]
+                for table in shared
+            }
+
+        if user_row is None:
+            self.logger.warning(f"Usuário {user_id} não existe no catálogo principal")
+
+        with shard_engine.begin() as conn:
+            if user_row is not None:
+                conn.execute(insert(users), [dict(user_row)])
+            for table, rows in shared_rows.items():
+                if rows:
+                    conn.execute(insert(table), rows)
+
+    def migrate_user(self, user_id: int) -> dict:
+        """Move os dados de um usuário do banco principal para o seu shard."""
+        shard_engine = self.engine_for(user_id)
+        tables = [
+            table for table in Base.metadata.sorted_tables
+            if 'user_id' in table.c and table.name != User.__tablename__
+        ]
+
+        moved = {}
+        try:
+            with engine.begin() as source, shard_engine.begin() as target:
+                for table in tables:
+                    rows = [
+                        dict(row) for row in
+                        source.execute(select(table).where(table.c.user_id == user_id)).mappings()
+                    ]
+                    if rows:
+                        target.execute(insert(table), rows)
+                        source.execute(table.delete().where(table.c.user_id == user_id))
+                    moved[table.name] = len(rows)
+
+            self.logger.info(f"Dados do usuário {user_id} movidos para o shard: {moved}")
+            return moved
+
+        except Exception as e:
+            self.logger.error(f"Erro ao migrar usuário {user_id}: {e}")
+            raise
+
+    def dispose(self):
+        """Fecha todas as engines abertas."""
+        with self._lock:
+            for shard_engine, _ in self._engines.values():
+                shard_engine.dispose()
+            self._engines.clear()
+
+_router = None
+_router_lock = threading.Lock()
+
+def get_router() -> ShardRouter:
+    """Retorna o roteador compartilhado pelo processo."""
+    global _router
+    with _router_lock:
+        if _router is None:
+            _router = ShardRouter()
+        return _router
+
+if __name__ == "__main__":
+    # Uso: python -m src.database.sharding <user_id> [<user_id> ...]
+    router = get_router()
+    for arg in sys.argv[1:]:
+        print(arg, router.migrate_user(int(arg)))
@@ -0,0 +1,196 @@
+from collections import defaultdict
+from concurrent.futures import Future
+import atexit
+import threading
+import time
+import logging
+from src.database.database import get_session
+from src.config.settings import WRITE_BEHIND
+
+class WriteBehindQueue:
+    """Fila de gravações executadas por uma única thread em segundo plano.
+
+    ``submit(fn, user_id)`` enfileira ``fn(session)``; a thread agrupa as
+    gravações que chegam em ``batch_ms`` (ou até ``batch_size`` delas) em
+    uma transação por banco de usuário. Se uma gravação falhar, a
+    transação é desfeita e o lote é refeito sem ela, então um erro descarta
+    só a gravação que falhou. Quem precisa ler o que acabou de gravar usa
+    ``flush()``/``barrier()`` fora da thread da interface; nela, lê o
+    banco e soma o que ainda está em ``pending()``.
+    """
+
+    def __init__(self, batch_ms: int = None, batch_size: int = None):
+        self.batch_ms = batch_ms or WRITE_BEHIND['batch_ms']
+        self.batch_size = batch_size or WRITE_BEHIND['batch_size']
+        self.logger = logging.getLogger('write_behind')
+        self._pending = []
+        self._condition = threading.Condition()
+        self._flush_requested = False
+        self._closed = False
+        self._described = {}  # Future -> (user_id, tipo, valor), até o commit
+        self._described_lock = threading.Lock()
+        self.commits = 0
+        self._thread = threading.Thread(target=self._run, name='write-behind', daemon=True)
+        self._thread.start()
+
+    def submit(self, fn, user_id=None, pending=None) -> Future:
+        """Enfileira ``fn(session)``; o Future é resolvido após o commit.
+
+        ``pending`` descreve a gravação como ``(tipo, valor)`` e fica em
+        ``pending(user_id, tipo)`` até o Future ser resolvido.
+        """
+        future = Future()
+        with self._condition:
+            if self._closed:
+                raise RuntimeError("Fila de gravação encerrada")
+            if pending is not None:
+                with self._described_lock:
+                    self._described[future] = (user_id, *pending)
+                future.add_done_callback(self._forget)
+            self._pending.append((user_id, fn, future))
+            if len(self._pending) >= self.batch_size:
+                self._condition.notify()
+        return future
+
+    def pending(self, user_id, kind: str) -> list:
+        """Valores das gravações de ``kind`` do usuário ainda não confirmadas.
+
+        Inclui as que a thread já está gravando; uma gravação some daqui
+        quando o commit termina (ou quando ela falha).
+        """
+        with self._described_lock:
+            return [
+                value for owner, described_kind, value in self._described.values()
+                if owner == user_id and described_kind == kind
+            ]
+
+    def _forget(self, future):
+        with self._described_lock:
+            self._described.pop(future, None)
+
+    def barrier(self) -> Future:
+        """Future resolvido quando tudo o que foi enfileirado até agora estiver gravado."""
+        future = Future()
+        with self._condition:
+            if self._closed:
+                future.set_result(None)
+                return future
+            self._pending.append((None, None, future))
+            self._flush_requested = True
+            self._condition.notify()
+        return future
+
+    def flush(self, timeout: float = None):
+        """Grava imediatamente as pendências e espera o commit."""
+        if threading.current_thread() is self._thread:
+            return
+        self.barrier().result(timeout)
+
+    def close(self):
+        """Grava as pendências e encerra a thread (chamado na saída)."""
+        with self._condition:
+            if self._closed:
+                return
+            self._closed = True
+            self._condition.notify()
+        self._thread.join()
+
+    def _run(self):
+        while True:
+            with self._condition:
+                deadline = None
+                while True:
+                    if self._closed or self._flush_requested:
+                        break
+                    if len(self._pending) >= self.batch_size:
+                        break
+                    if self._pending:
+                        # Esperar o restante da janela a partir da primeira pendência
+                        deadline = deadline or time.monotonic() + self.batch_ms / 1000
+                        remaining = deadline - time.monotonic()
+                        if remaining <= 0:
+                            break
+                        self._condition.wait(remaining)
+                    else:
+                        self._condition.wait()
+                batch, self._pending = self._pending, []
+                self._flush_requested = False
+                closed = self._closed
+
+            if batch:
+                self._write(batch)
+            if closed:
+                return
+
+    def _write(self, batch):
+        """Aplica o lote com uma transação por banco (principal ou de cada usuário)."""
+        groups = defaultdict(list)
+        barriers = []
+        for user_id, fn, future in batch:
+            if fn is None:
+                barriers.append(future)
+            else:
+                groups[user_id].append((fn, future))
+
+        for user_id, items in groups.items():
+            self._write_group(user_id, items)
+
+        for future in barriers:
+            future.set_result(None)
+
+    def _write_group(self, user_id, items):
+        """Grava os itens de um banco em um único commit.
+
+        Não há savepoints (no pysqlite cada RELEASE de um savepoint de topo
+        já é um commit): cada gravação é enviada com ``flush`` e, se uma
+        falhar, a transação inteira é desfeita e refeita sem ela.
+        """
+        pending = list(items)
+        while pending:
+            session = get_session(user_id)
+            results = []
+            failed = None
+            try:
+                for index, (fn, future) in enumerate(pending):
+                    try:
+                        results.append((future, fn(session)))
+                        session.flush()
+                    except Exception as e:
+                        self.logger.error(f"Erro em gravação enfileirada: {e}")
+                        failed = (index, e)
+                        break
+
+                if failed is None:
+                    session.commit()
+                    self.commits += 1
+                else:
+                    session.rollback()
+            except Exception as e:
+                session.rollback()
+                self.logger.error(f"Erro ao gravar lote de {len(pending)} itens: {e}")
+                for _, future in pending:
+                    future.set_exception(e)
+                return
+            finally:
+                session.close()
+
+            if failed is None:
+                for future, result in results:
+                    future.set_result(result)
+                return
+
+            index, error = failed
+            pending[index][1].set_exception(error)
+            del pending[index]
+
+_queue = None
+_queue_lock = threading.Lock()
+
+def get_write_queue() -> WriteBehindQueue:
+    """Retorna a fila compartilhada pelo processo (gravada também na saída)."""
+    global _queue
+    with _queue_lock:
+        if _queue is None:
+            _queue = WriteBehindQueue()
+            atexit.register(_queue.close)
+        return _queue
@@ -1,8 +1,10 @@
 import customtkinter as ctk
-from PIL import Image, ImageTk
+from src.gui.sprite_cache import SpriteSheet
 import os
 from typing import Callable
+from src.utils.frame_governor import governor_for_tk
 import math
+import random
 
 class AnimeAnimations:
     def __init__(self):
@@ -10,17 +12,15 @@ class AnimeAnimations:
         self.loaded_sprites = {}
         
     def load_sprite_sheet(self, name: str, path: str, sprite_width: int, sprite_height: int):
-        """Carrega uma sprite sheet e divide em frames individuais."""
+        """Registra uma sprite sheet; os quadros são recortados na primeira exibição."""
         if name not in self.loaded_sprites:
-            sheet = Image.open(path)
-            frames = []
+            self.loaded_sprites[name] = SpriteSheet(path, sprite_width, sprite_height)
             
-            for y in range(0, sheet.height, sprite_height):
-                for x in range(0, sheet.width, sprite_width):
-                    frame = sheet.crop((x, y, x + sprite_width, y + sprite_height))
-                    frames.append(ImageTk.PhotoImage(frame))
-                    
-            self.loaded_sprites[name] = frames
+    def unload_sprite_sheet(self, name: str):
+        """Libera os quadros em cache de uma sprite sheet."""
+        sheet = self.loaded_sprites.pop(name, None)
+        if sheet is not None:
+            sheet.release()
             
     def animate_label(self, label: ctk.CTkLabel, sprite_name: str, 
                      frame_duration: int = 100, loop: bool = True):
@@ -29,32 +29,38 @@ class AnimeAnimations:
             return
             
         frames = self.loaded_sprites[sprite_name]
-        current_frame = 0
+        state = {'frame': 0, 'elapsed': 0.0}
         
-        def update_frame():
-            nonlocal current_frame
-            if label.winfo_exists():
-                label.configure(image=frames[current_frame])
-                current_frame = (current_frame + 1) % len(frames)
-                if loop or current_frame > 0:
-                    label.after(frame_duration, update_frame)
+        def update_frame(dt):
+            if not label.winfo_exists():
+                return False
+            state['elapsed'] += dt * 1000
+            if state['elapsed'] < frame_duration and state['frame'] > 0:
+                return True
+            state['elapsed'] = 0.0
+            # Manter a referência: o cache pode descartar o quadro exibido
+            state['image'] = frames[state['frame']]
+            label.configure(image=state['image'])
+            state['frame'] = (state['frame'] + 1) % len(frames)
+            return loop or state['frame'] > 0
                     
-        update_frame()
+        governor_for_tk(label).subscribe('animate_label', update_frame, visible=label.winfo_viewable)
         
     def floating_effect(self, widget: ctk.CTkBaseClass, amplitude: float = 10, 
                        period: float = 2000):
         """Aplica um efeito flutuante suave ao widget."""
         start_y = widget.winfo_y()
-        start_time = widget.winfo_toplevel().winfo_id()  # Usar como referência de tempo
+        state = {'elapsed': 0.0}
         
-        def update_position():
-            if widget.winfo_exists():
-                current_time = widget.winfo_toplevel().winfo_id() - start_time
-                offset = amplitude * math.sin(2 * math.pi * current_time / period)
-                widget.place(y=start_y + offset)
-                widget.after(16, update_position)  # ~60 FPS
+        def update_position(dt):
+            if not widget.winfo_exists():
+                return False
+            state['elapsed'] += dt * 1000
+            offset = amplitude * math.sin(2 * math.pi * state['elapsed'] / period)
+            widget.place(y=start_y + offset)
+            return True
                 
-        update_position()
+        governor_for_tk(widget).subscribe('floating_effect', update_position, visible=widget.winfo_viewable)
         
     def particle_effect(self, canvas: ctk.CTkCanvas, x: int, y: int, 
                        particle_type: str = "sparkle"):
@@ -70,39 +76,39 @@ class AnimeAnimations:
                 self.alpha = 1.0
                 self.size = random.randint(3, 8)
                 
-            def update(self):
-                self.x += self.vx
-                self.y += self.vy
-                self.vy += 0.2  # Gravidade
-                self.alpha -= 0.02
+            def update(self, steps):
+                # Valores calibrados para quadros de 16ms
+                self.x += self.vx * steps
+                self.y += self.vy * steps
+                self.vy += 0.2 * steps  # Gravidade
+                self.alpha -= 0.02 * steps
                 return self.alpha > 0
                 
         def create_particles():
             for _ in range(20):
                 particles.append(Particle(x, y))
                 
-        def update_particles():
-            if canvas.winfo_exists():
-                canvas.delete("particle")
-                
-                remaining_particles = []
-                for p in particles:
-                    if p.update():
-                        color = self._get_particle_color(particle_type, p.alpha)
-                        canvas.create_oval(
-                            p.x - p.size, p.y - p.size,
-                            p.x + p.size, p.y + p.size,
-                            fill=color, tags="particle"
-                        )
-                        remaining_particles.append(p)
-                        
-                particles[:] = remaining_particles
-                
-                if particles:
-                    canvas.after(16, update_particles)
+        def update_particles(dt):
+            if not canvas.winfo_exists():
+                return False
+            canvas.delete("particle")
+            
+            remaining_particles = []
+            for p in particles:
+                if p.update(dt / 0.016):
+                    color = self._get_particle_color(particle_type, p.alpha)
+                    canvas.create_oval(
+                        p.x - p.size, p.y - p.size,
+                        p.x + p.size, p.y + p.size,
+                        fill=color, tags="particle"
+                    )
+                    remaining_particles.append(p)
+                    
+            particles[:] = remaining_particles
+            return bool(particles)
                     
         create_particles()
-        update_particles()
+        governor_for_tk(canvas).subscribe('particle_effect', update_particles, visible=canvas.winfo_viewable)
         
     def _get_particle_color(self, particle_type: str, alpha: float) -> str:
         """Retorna a cor da partícula baseada no tipo e alpha."""
@@ -120,17 +126,18 @@ class AnimeAnimations:
         """Aplica um efeito de tremor ao widget."""
         start_x = widget.winfo_x()
         start_y = widget.winfo_y()
-        start_time = widget.winfo_toplevel().winfo_id()
+        state = {'elapsed': 0.0}
         
-        def update_shake():
-            if widget.winfo_exists():
-                current_time = widget.winfo_toplevel().winfo_id() - start_time
-                if current_time < duration:
-                    offset_x = random.uniform(-intensity, intensity)
-                    offset_y = random.uniform(-intensity, intensity)
-                    widget.place(x=start_x + offset_x, y=start_y + offset_y)
-                    widget.after(16, update_shake)
-                else:
-                    widget.place(x=start_x, y=start_y)
+        def update_shake(dt):
+            if not widget.winfo_exists():
+                return False
+            state['elapsed'] += dt * 1000
+            if state['elapsed'] < duration:
+                offset_x = random.uniform(-intensity, intensity)
+                offset_y = random.uniform(-intensity, intensity)
+                widget.place(x=start_x + offset_x, y=start_y + offset_y)
+                return True
+            widget.place(x=start_x, y=start_y)
+            return False
                     
-        update_shake() 
\ No newline at end of file
+        governor_for_tk(widget).subscribe('shake_effect', update_shake, visible=widget.winfo_viewable)
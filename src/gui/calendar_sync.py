@@ -50,7 +50,7 @@ class CalendarSyncWindow(QDialog):
         
         # Serviços
         self.calendar_service = GoogleCalendarService(self.user_id)
-        self.session = get_session()
+        self.session = get_session(self.user_id)
         
         # Layout
         self.create_status_frame()
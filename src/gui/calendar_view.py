@@ -5,13 +5,16 @@ from src.database.models import Task
 from src.database.database import get_session
 from datetime import datetime
 from src.services.task_manager import TaskManager
+from src.gui.data_loader import DataLoader
 
 class CalendarWindow(QDialog):
     def __init__(self, parent):
         super().__init__(parent)
         self.user_id = parent.user_id
-        self.session = get_session()
+        self.session = get_session(self.user_id)
         self.task_manager = TaskManager(self.user_id)
+        self.data_loader = DataLoader(self)
+        self.data_loader.loaded.connect(self.mark_deadlines)
         self.setup_ui()
         self.load_tasks()
         
@@ -66,16 +69,29 @@ class CalendarWindow(QDialog):
         layout.addWidget(controls)
         
     def load_tasks(self):
-        """Carrega todas as tarefas do usuário e marca no calendário."""
-        tasks = self.session.query(Task).filter_by(user_id=self.user_id).all()
-        
-        # Marcar datas com tarefas
-        for task in tasks:
-            if task.deadline:
-                date = QDate(task.deadline.year, task.deadline.month, task.deadline.day)
-                format = self.calendar.dateTextFormat(date)
-                format.setBackground(Qt.cyan)
-                self.calendar.setDateTextFormat(date, format)
+        """Solicita as datas com tarefas do usuário para marcar no calendário."""
+        self.data_loader.request('deadlines', self.fetch_deadlines, self.user_id)
+    
+    @staticmethod
+    def fetch_deadlines(user_id):
+        """Busca as datas distintas de deadline (executado fora da thread da interface)."""
+        session = get_session(user_id)
+        try:
+            deadlines = session.query(Task.deadline).filter(
+                Task.user_id == user_id,
+                Task.deadline.isnot(None)
+            ).all()
+            return sorted({deadline.date() for deadline, in deadlines})
+        finally:
+            session.close()
+    
+    def mark_deadlines(self, key, deadlines):
+        """Marca no calendário as datas com tarefas."""
+        for deadline in deadlines:
+            date = QDate(deadline.year, deadline.month, deadline.day)
+            format = self.calendar.dateTextFormat(date)
+            format.setBackground(Qt.cyan)
+            self.calendar.setDateTextFormat(date, format)
                 
     def show_tasks_for_date(self, date):
         """Mostra as tarefas para a data selecionada."""
@@ -39,9 +39,10 @@ class CircularProgress(QWidget):
         self.update()
 
 class PomodoroWidget(QFrame):
-    def __init__(self, parent=None):
+    def __init__(self, user_id=None, parent=None):
         super().__init__(parent)
         self.setObjectName("card")
+        self.service = None
         
         layout = QVBoxLayout(self)
         
@@ -72,4 +73,31 @@ class PomodoroWidget(QFrame):
         controls.addWidget(self.pause_btn)
         controls.addWidget(self.reset_btn)
         
-        layout.addLayout(controls) 
\ No newline at end of file
+        layout.addLayout(controls)
+        
+        if user_id is not None:
+            from src.gui.timer_service import get_timer_service
+            self.bind(get_timer_service(user_id))
+    
+    def bind(self, service):
+        """Passa a exibir e controlar o timer compartilhado ``service``."""
+        self.service = service
+        service.tick.connect(self.update_display)
+        service.phaseChanged.connect(self.show_phase)
+        service.watch(self)
+        
+        self.start_btn.clicked.connect(service.start)
+        self.pause_btn.clicked.connect(service.pause)
+        self.reset_btn.clicked.connect(service.reset)
+        
+        self.update_display(service.remaining_seconds())
+    
+    def show_phase(self, mode):
+        """Atualiza o display ao trocar de ciclo."""
+        self.update_display(self.service.remaining_seconds())
+    
+    def update_display(self, remaining):
+        """Atualiza o texto e o progresso circular."""
+        minutes, seconds = divmod(remaining, 60)
+        self.time_label.setText(f"{minutes:02d}:{seconds:02d}")
+        self.progress.set_value(self.service.progress())
@@ -4,6 +4,7 @@ from PySide6.QtGui import *
 from src.services.study_recommender import StudyRecommender
 from src.services.achievement_manager import AchievementManager
 from src.gui.timer_widget import AdvancedTimerWidget
+from src.gui.data_loader import DataLoader
 from datetime import datetime, timedelta
 import random
 
@@ -15,6 +16,9 @@ class DashboardWidget(QWidget):
         self.user_id = user_id
         self.recommender = StudyRecommender(user_id)
         self.achievement_manager = AchievementManager(user_id)
+        self.data_loader = DataLoader(self)
+        self.data_loader.loaded.connect(self.on_data_loaded)
+        self.data_loader.failed.connect(self.on_data_failed)
         self.setup_ui()
         self.load_data()
     
@@ -223,31 +227,46 @@ class DashboardWidget(QWidget):
                 widget.deleteLater()
     
     def load_data(self):
-        """Carrega os dados para exibição no dashboard."""
+        """Solicita os dados do dashboard sem bloquear a interface."""
+        self.load_random_tip()
+        self.data_loader.request('dashboard', self.fetch_data, self.user_id)
+    
+    @staticmethod
+    def fetch_data(user_id):
+        """Busca os dados do dashboard (executado fora da thread da interface)."""
+        recommender = StudyRecommender(user_id)
+        achievement_manager = AchievementManager(user_id)
+        return {
+            'level_info': achievement_manager.get_user_level_info(),
+            'recommendations': recommender.get_daily_recommendation(),
+            'trending': recommender.get_trending_topics(),
+            'achievements': achievement_manager.get_recent_achievements(3)
+        }
+    
+    def on_data_loaded(self, key, data):
+        """Exibe os dados carregados em segundo plano."""
         try:
-            # Carregar informações de nível
-            level_info = self.achievement_manager.get_user_level_info()
+            # Informações de nível
+            level_info = data['level_info']
             self.level_value.setText(str(level_info['level']))
             self.level_progress.setValue(level_info['progress_percent'])
             
-            # Carregar recomendações de estudo
-            recommendations = self.recommender.get_daily_recommendation()
-            self.display_recommendations(recommendations)
+            # Recomendações de estudo
+            self.display_recommendations(data['recommendations'])
             
-            # Carregar tópicos em destaque
-            trending = self.recommender.get_trending_topics()
-            self.display_trending_topics(trending)
+            # Tópicos em destaque
+            self.display_trending_topics(data['trending'])
             
-            # Carregar conquistas recentes
-            achievements = self.achievement_manager.get_recent_achievements(3)
-            self.display_achievements(achievements)
-            
-            # Carregar dica aleatória
-            self.load_random_tip()
+            # Conquistas recentes
+            self.display_achievements(data['achievements'])
         except Exception as e:
             # Lidar com erros de carregamento
             print(f"Erro ao carregar dados do dashboard: {e}")
     
+    def on_data_failed(self, key, message):
+        """Informa falhas no carregamento dos dados."""
+        print(f"Erro ao carregar dados do dashboard: {message}")
+    
     def get_user_name(self):
         """Obtém o nome do usuário atual."""
         # Implementar lógica para buscar o nome do usuário
@@ -0,0 +1,69 @@
+from PySide6.QtCore import QObject, QRunnable, QThreadPool, Signal, Slot
+from src.database.instrumentation import action
+import logging
+
+class _LoaderSignals(QObject):
+    """Sinais emitidos pela tarefa em segundo plano."""
+    finished = Signal(str, int, object)
+    failed = Signal(str, int, str)
+
+class _LoadTask(QRunnable):
+    """Executa uma função de consulta em uma thread do pool."""
+
+    def __init__(self, key, generation, fn, args, kwargs):
+        super().__init__()
+        self.key = key
+        self.generation = generation
+        self.fn = fn
+        self.args = args
+        self.kwargs = kwargs
+        self.signals = _LoaderSignals()
+
+    def run(self):
+        try:
+            with action(self.key):
+                result = self.fn(*self.args, **self.kwargs)
+        except Exception as e:
+            self.signals.failed.emit(self.key, self.generation, str(e))
+        else:
+            self.signals.finished.emit(self.key, self.generation, result)
+
+class DataLoader(QObject):
+    """Executa consultas ao banco fora da thread da interface.
+
+    As funções passadas para ``request`` rodam em uma thread do pool e devem
+    abrir a própria sessão do banco (por exemplo, instanciando um serviço) e
+    retornar dados simples. O resultado chega na thread da interface pelo
+    sinal ``loaded``; resultados de pedidos substituídos por um mais novo
+    com a mesma chave são descartados.
+    """
+
+    loaded = Signal(str, object)
+    failed = Signal(str, str)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.pool = QThreadPool.globalInstance()
+        self.logger = logging.getLogger('data_loader')
+        self._generations = {}
+
+    def request(self, key: str, fn, *args, **kwargs):
+        """Agenda ``fn(*args, **kwargs)`` em segundo plano."""
+        generation = self._generations.get(key, 0) + 1
+        self._generations[key] = generation
+
+        task = _LoadTask(key, generation, fn, args, kwargs)
+        task.signals.finished.connect(self._on_finished)
+        task.signals.failed.connect(self._on_failed)
+        self.pool.start(task)
+
+    @Slot(str, int, object)
+    def _on_finished(self, key, generation, result):
+        if self._generations.get(key) == generation:
+            self.loaded.emit(key, result)
+
+    @Slot(str, int, str)
+    def _on_failed(self, key, generation, message):
+        self.logger.error(f"Erro ao carregar '{key}': {message}")
+        if self._generations.get(key) == generation:
+            self.failed.emit(key, message)
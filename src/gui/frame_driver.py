@@ -0,0 +1,58 @@
+from PySide6.QtCore import QObject, QTimer, QEvent, Qt
+from PySide6.QtWidgets import QApplication
+from src.utils.frame_governor import FrameGovernor
+
+class QtFrameDriver(QObject):
+    """Driver do FrameGovernor para o Qt: um único QTimer de disparo único.
+
+    Quando nenhuma janela está visível, passa a observar as janelas de
+    topo para acordar o governador assim que uma delas for restaurada.
+    """
+
+    WAKE_EVENTS = (QEvent.Show, QEvent.WindowStateChange)
+
+    def __init__(self):
+        super().__init__()
+        self.governor = None
+        self.callback = None
+        self.timer = QTimer(self)
+        self.timer.setSingleShot(True)
+        self.timer.setTimerType(Qt.PreciseTimer)
+        self.timer.timeout.connect(self._fire)
+
+    def schedule(self, delay_ms: int, fn):
+        self.callback = fn
+        self.timer.start(delay_ms)
+
+    def _fire(self):
+        if self.callback is not None:
+            self.callback()
+
+    def is_visible(self) -> bool:
+        windows = QApplication.topLevelWidgets()
+        if any(window.isVisible() and not window.isMinimized() for window in windows):
+            return True
+        # Nada visível: esperar uma janela reaparecer em vez de agendar quadros
+        for window in windows:
+            window.installEventFilter(self)
+        return False
+
+    def eventFilter(self, obj, event):
+        if event.type() in self.WAKE_EVENTS and self.governor is not None:
+            QTimer.singleShot(0, self.governor.wake)
+        return False
+
+_governor = None
+
+def get_governor() -> FrameGovernor:
+    """Governador de quadros compartilhado pelas animações Qt."""
+    global _governor
+    if _governor is None:
+        driver = QtFrameDriver()
+        _governor = FrameGovernor(driver)
+        driver.governor = _governor
+    return _governor
+
+def widget_visible(widget):
+    """Função de visibilidade para ``subscribe``: pula quadros de widgets ocultos."""
+    return lambda: widget.isVisible() and not widget.window().isMinimized()
@@ -5,6 +5,7 @@ from src.services.auth_manager import AuthManager
 from src.gui.themes import Theme
 import os
 from src.database.database import get_data_dir
+from src.gui.data_loader import DataLoader
 
 class LoginWindow(QWidget):
     def __init__(self, parent=None):
@@ -14,6 +15,9 @@ class LoginWindow(QWidget):
         self.setWindowIcon(icon)
         self.theme = Theme()
         self.auth_manager = AuthManager()
+        self.data_loader = DataLoader(self)
+        self.data_loader.loaded.connect(self.on_login_finished)
+        self.data_loader.failed.connect(self.on_login_failed)
         self.setup_ui()
         
     def setup_ui(self):
@@ -82,10 +86,10 @@ class LoginWindow(QWidget):
         form_layout.addWidget(self.password_input)
         
         # Login button
-        login_btn = QPushButton("Login")
-        login_btn.setObjectName("primaryButton")
-        login_btn.clicked.connect(self.handle_login)
-        form_layout.addWidget(login_btn)
+        self.login_btn = QPushButton("Login")
+        self.login_btn.setObjectName("primaryButton")
+        self.login_btn.clicked.connect(self.handle_login)
+        form_layout.addWidget(self.login_btn)
         
         # Register link
         register_btn = QPushButton("Criar nova conta")
@@ -109,18 +113,10 @@ class LoginWindow(QWidget):
                 )
                 return
             
-            user = self.auth_manager.login(username, password)
-            if user:
-                self.show_main_window(user.id)
-            else:
-                QMessageBox.warning(
-                    self,
-                    "Erro",
-                    "Usuário ou senha inválidos!\n\n"
-                    "Use as credenciais de teste:\n"
-                    "Usuário: test\n"
-                    "Senha: test123"
-                )
+            # A verificação do bcrypt roda fora da thread da interface
+            self.login_btn.setEnabled(False)
+            self.login_btn.setText("Entrando...")
+            self.data_loader.request('login', self.authenticate, username, password)
                 
         except Exception as e:
             QMessageBox.critical(
@@ -128,6 +124,39 @@ class LoginWindow(QWidget):
                 "Erro",
                 f"Erro ao fazer login: {str(e)}"
             )
+    
+    @staticmethod
+    def authenticate(username, password):
+        """Autentica o usuário (executado fora da thread da interface)."""
+        user = AuthManager().login(username, password)
+        return user.id if user else None
+    
+    def on_login_finished(self, key, user_id):
+        """Trata o resultado da autenticação."""
+        self.login_btn.setEnabled(True)
+        self.login_btn.setText("Login")
+        
+        if user_id:
+            self.show_main_window(user_id)
+        else:
+            QMessageBox.warning(
+                self,
+                "Erro",
+                "Usuário ou senha inválidos!\n\n"
+                "Use as credenciais de teste:\n"
+                "Usuário: test\n"
+                "Senha: test123"
+            )
+    
+    def on_login_failed(self, key, message):
+        """Trata erros na autenticação."""
+        self.login_btn.setEnabled(True)
+        self.login_btn.setText("Login")
+        QMessageBox.critical(
+            self,
+            "Erro",
+            f"Erro ao fazer login: {message}"
+        )
             
     def show_main_window(self, user_id):
         """Mostra a janela principal."""
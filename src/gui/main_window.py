@@ -2,7 +2,6 @@ from PySide6.QtWidgets import *
 from PySide6.QtCore import *
 from PySide6.QtGui import *
 from src.config.settings import THEMES, POMODORO_DEFAULTS
-from src.services.pomodoro import PomodoroTimer
 from src.services.task_manager import TaskManager
 from src.services.report_generator import ReportGenerator
 from src.gui.visual_effects import SimpleEffects, AnimatedTabWidget
@@ -12,14 +11,16 @@ from tkinter import filedialog
 import os
 from src.gui.calendar_view import CalendarWindow
 from src.gui.distraction_manager import DistractionManagerWindow
-from src.gui.themes import Theme
+from src.gui.themes import DynamicTheme
 from PySide6.QtCore import QTimer
 from src.services.session_manager import SessionManager
 from src.gui.login import LoginWindow
 from src.services.auth_manager import AuthManager
 from src.gui.method_widget import MethodWidget
+from src.gui.data_loader import DataLoader
+from src.database.write_behind import get_write_queue
+from src.gui.timer_service import get_timer_service, release_timer_service
 from src.gui.dashboard import DashboardWidget
-from qt_material import apply_stylesheet
 
 class MainWindow(QMainWindow):
     def __init__(self, user_id):
@@ -28,11 +29,18 @@ class MainWindow(QMainWindow):
         icon = QIcon(os.path.join(os.path.dirname(__file__), '..', 'img', 'app.ico'))
         self.setWindowIcon(icon)
         self.user_id = user_id
-        self.theme = Theme()
-        self.pomodoro_timer = PomodoroTimer(user_id)
+        self.theme = DynamicTheme()
+        # Timer compartilhado com as demais views de Pomodoro
+        self.timer_service = get_timer_service(user_id)
+        self.timer_service.tick.connect(self.update_timer_display)
+        self.timer_service.runningChanged.connect(self.update_pomodoro_buttons)
+        self.timer_service.timerFinished.connect(self.on_timer_finished)
+        self.pomodoro_timer = self.timer_service.pomodoro
         self.task_manager = TaskManager(user_id)
         self.effects = SimpleEffects()
         self.auth_manager = AuthManager()
+        self.data_loader = DataLoader(self)
+        self.data_loader.loaded.connect(self.on_data_loaded)
         self.setup_ui()
         
     def setup_ui(self):
@@ -40,7 +48,9 @@ class MainWindow(QMainWindow):
         # Configuração da janela
         self.setWindowTitle("Matemática em Evidência - Study Style")
         self.setMinimumSize(1200, 800)
-        self.setStyleSheet(self.theme.get_main_style())
+        # Base do qt_material na janela, uma única vez; o estilo do tema vai
+        # só na área de conteúdo (abaixo), a única parte que muda com ele
+        self.theme.apply_material_base(self)
         
         # Adicionar efeito de sombra à janela principal
         shadow = QGraphicsDropShadowEffect()
@@ -66,6 +76,9 @@ class MainWindow(QMainWindow):
         # Área de conteúdo
         content_area = QWidget()
         content_area.setObjectName("contentArea")
+        self.content_area = content_area
+        self.applied_style = self.theme.get_main_style()
+        content_area.setStyleSheet(self.applied_style)
         content_layout = QVBoxLayout(content_area)
         content_layout.setContentsMargins(20, 20, 20, 20)
         
@@ -84,9 +97,7 @@ class MainWindow(QMainWindow):
         
         # Verificar e mostrar conquistas pendentes
         QTimer.singleShot(1000, self.check_pending_achievements)
-        
-        # Aplicando um tema moderno
-        apply_stylesheet(self, theme='dark_blue')
+
         
         # Melhorias na sidebar
         self.sidebar.setStyleSheet("""
@@ -111,42 +122,56 @@ class MainWindow(QMainWindow):
                 """)
         
     def setup_tabs(self):
-        """Configura as abas do aplicativo."""
-        # Tab Dashboard
-        dashboard = DashboardWidget(self.user_id, self)
-        self.tab_widget.addTab(dashboard, "Dashboard")
-        
-        # Tab Método Logan
-        method_widget = MethodWidget(self.user_id)
-        self.tab_widget.addTab(method_widget, "Método Logan")
-        
-        # Tab Timer Avançado
+        """Configura as abas do aplicativo.
+        
+        Cada aba é criada na primeira vez em que é exibida; as leves são
+        construídas antes, quando a janela já está aberta e ociosa. As
+        estatísticas (matplotlib) só são montadas quando abertas.
+        """
+        self.tab_widget.add_lazy_tab(self.create_dashboard_tab, "Dashboard")
+        self.tab_widget.add_lazy_tab(self.create_method_tab, "Método Logan", prefetch=True)
+        self.tab_widget.add_lazy_tab(self.create_timer_tab, "Pomodoro", prefetch=True)
+        self.tab_widget.add_lazy_tab(self.create_learning_tab, "Progresso", prefetch=True)
+        self.tab_widget.add_lazy_tab(self.create_statistics_tab, "Estatísticas")
+        self.tab_widget.add_lazy_tab(self.create_calendar_tab, "Calendário", prefetch=True)
+        
+        self.tab_widget.start_prefetch(delay_ms=1000)
+    
+    def create_dashboard_tab(self):
+        """Tab Dashboard."""
+        return DashboardWidget(self.user_id, self)
+    
+    def create_method_tab(self):
+        """Tab Método Logan."""
+        return MethodWidget(self.user_id)
+    
+    def create_timer_tab(self):
+        """Tab Timer Avançado."""
         from src.gui.timer_widget import AdvancedTimerWidget
         timer_container = QWidget()
         timer_layout = QVBoxLayout(timer_container)
         timer_layout.setAlignment(Qt.AlignCenter)
         
         timer_widget = AdvancedTimerWidget(user_id=self.user_id, parent=self)
-        timer_widget.timerFinished.connect(self.on_timer_finished)
         timer_layout.addWidget(timer_widget, alignment=Qt.AlignCenter)
-        
-        self.tab_widget.addTab(timer_container, "Pomodoro")
-        
-        # Tab Progresso de Aprendizagem
+        return timer_container
+    
+    def create_learning_tab(self):
+        """Tab Progresso de Aprendizagem."""
         from src.gui.learning_progress import LearningProgressWidget
-        learning_widget = LearningProgressWidget(self.user_id)
-        self.tab_widget.addTab(learning_widget, "Progresso")
-        
-        # Tab Estatísticas
+        return LearningProgressWidget(self.user_id)
+    
+    def create_statistics_tab(self):
+        """Tab Estatísticas."""
         from src.gui.statistics import StatisticsPanel
-        stats_panel = StatisticsPanel(self.user_id)
-        self.tab_widget.addTab(stats_panel, "Estatísticas")
-        
-        # Tab Calendário
+        return StatisticsPanel(self.user_id)
+    
+    def create_calendar_tab(self):
+        """Tab Calendário."""
         calendar_widget = QScrollArea()
         calendar_widget.setWidgetResizable(True)
         calendar_widget.setWidget(self.create_calendar_widget())
-        self.tab_widget.addTab(calendar_widget, "Calendário")
+        return calendar_widget
         
     def create_sidebar(self):
         """Cria a barra lateral com navegação."""
@@ -265,6 +290,7 @@ class MainWindow(QMainWindow):
         
         pomodoro_layout.addWidget(controls_frame)
         layout.addWidget(self.pomodoro_frame)
+        self.timer_service.watch(self.pomodoro_frame)
         
         # Atualizar display inicial
         self.update_timer_display()
@@ -345,38 +371,23 @@ class MainWindow(QMainWindow):
         
     def start_pomodoro(self):
         """Inicia o timer Pomodoro."""
-        self.pomodoro_timer.start()
-        self.start_button.setEnabled(False)
-        self.pause_button.setEnabled(True)
-        self.reset_button.setEnabled(True)
-        QTimer.singleShot(1000, self.update_timer)  # Importante: iniciar o timer
+        self.timer_service.start()
         
     def pause_pomodoro(self):
         """Pausa o timer Pomodoro."""
-        self.pomodoro_timer.pause()
-        self.start_button.setEnabled(True)
-        self.pause_button.setEnabled(False)
+        self.timer_service.pause()
         
     def reset_pomodoro(self):
         """Reseta o timer Pomodoro."""
-        self.pomodoro_timer.reset()
-        self.start_button.setEnabled(True)
-        self.pause_button.setEnabled(False)
-        self.timer_label.setText("25:00")
-        
-    def update_timer(self):
-        """Atualiza o display do timer."""
-        if self.pomodoro_timer.is_running:
-            remaining = self.pomodoro_timer.get_remaining_time()
-            if remaining > 0:
-                minutes = remaining // 60
-                seconds = remaining % 60
-                self.timer_label.setText(f"{minutes:02d}:{seconds:02d}")
-                self.pomodoro_timer.time_remaining -= 1
-                QTimer.singleShot(1000, self.update_timer)
-            else:
-                self.show_break_notification()
-                self.reset_pomodoro()
+        self.timer_service.reset()
+        
+    def update_pomodoro_buttons(self, running):
+        """Habilita os controles conforme o estado do timer compartilhado."""
+        if not hasattr(self, 'start_button'):
+            return
+        self.start_button.setEnabled(not running)
+        self.pause_button.setEnabled(running)
+        self.reset_button.setEnabled(True)
                 
     def show_break_notification(self):
         """Mostra notificação de intervalo."""
@@ -388,16 +399,42 @@ class MainWindow(QMainWindow):
         )
         
     def load_tasks(self):
-        """Carrega e exibe as tarefas do usuário."""
+        """Solicita as tarefas do dia; a lista é preenchida em render_tasks."""
+        self.data_loader.request('tasks', self.fetch_today_tasks, self.user_id)
+    
+    @staticmethod
+    def fetch_today_tasks(user_id):
+        """Busca as tarefas do dia (executado fora da thread da interface)."""
+        # Esperar as gravações enfileiradas (ex.: tarefa recém-concluída)
+        get_write_queue().flush()
+        # Dicionários simples: a sessão do worker já estará fechada na interface
+        manager = TaskManager(user_id)
+        try:
+            return [
+                {
+                    'id': task.id,
+                    'title': task.title,
+                    'completed': task.completed,
+                    'deadline': task.deadline
+                }
+                for task in manager.get_today_tasks()
+            ]
+        finally:
+            manager.session.close()
+    
+    def on_data_loaded(self, key, data):
+        """Distribui os dados carregados em segundo plano."""
+        if key == 'tasks':
+            self.render_tasks(data)
+    
+    def render_tasks(self, tasks):
+        """Exibe as tarefas do usuário."""
         # Limpar lista atual
         while self.tasks_list.layout().count():
             child = self.tasks_list.layout().takeAt(0)
             if child.widget():
                 child.widget().deleteLater()
         
-        # Carregar tarefas do dia
-        tasks = self.task_manager.get_today_tasks()
-        
         for task in tasks:
             self.add_task_to_list(task)
             
@@ -409,20 +446,20 @@ class MainWindow(QMainWindow):
         
         checkbox = QCheckBox()
         checkbox.setObjectName("taskCheckbox")
-        checkbox.setText(task.title)
-        checkbox.setChecked(task.completed)  # Definir estado inicial
-        checkbox.stateChanged.connect(lambda state, t=task.id: self.toggle_task(t))
+        checkbox.setText(task['title'])
+        checkbox.setChecked(task['completed'])  # Definir estado inicial
+        checkbox.stateChanged.connect(lambda state, t=task['id']: self.toggle_task(t))
         task_layout.addWidget(checkbox)
         
         # Adicionar deadline se existir
-        if task.deadline:
-            deadline_label = QLabel(task.deadline.strftime("%d/%m/%Y %H:%M"))
+        if task['deadline']:
+            deadline_label = QLabel(task['deadline'].strftime("%d/%m/%Y %H:%M"))
             deadline_label.setStyleSheet("color: gray;")
             task_layout.addWidget(deadline_label)
         
         delete_button = QPushButton("🗑️")
         delete_button.setObjectName("deleteButton")
-        delete_button.clicked.connect(lambda _, t=task.id: self.delete_task(t))
+        delete_button.clicked.connect(lambda _, t=task['id']: self.delete_task(t))
         task_layout.addWidget(delete_button)
         
         self.tasks_list.layout().addWidget(task_frame)
@@ -467,25 +504,17 @@ class MainWindow(QMainWindow):
         
     def apply_theme(self, theme_name: str):
         """Aplica o tema selecionado à interface."""
-        self.theme = THEMES[theme_name]
-        
-        # Atualizar estilos da janela principal
-        self.setStyleSheet(self.theme.get_main_style())
-        
-        # Atualizar estilos da sidebar
-        self.sidebar.setStyleSheet(self.theme.get_sidebar_style())
-        
-        # Atualizar estilos dos widgets
-        self.pomodoro_frame.setStyleSheet(self.theme.get_pomodoro_style())
-        self.tasks_frame.setStyleSheet(self.theme.get_tasks_style())
-        self.stats_frame.setStyleSheet(self.theme.get_stats_style())
-        
-        # Atualizar estilos dos textos
-        self.timer_label.setStyleSheet(self.theme.get_timer_style())
-        
-        # Atualizar estilos dos botões
-        for button in self.sidebar.findChildren(QPushButton):
-            button.setStyleSheet(self.theme.get_button_style())
+        if not self.theme.set_theme(theme_name):
+            print(f"Tema desconhecido: {theme_name}")
+            return
+        
+        # Só a área de conteúdo usa as cores do tema: a sidebar e a base do
+        # qt_material não são repolidas. A folha vem do cache, então
+        # reaplicar o tema atual não faz nada
+        style = self.theme.get_main_style()
+        if style is not self.applied_style:
+            self.applied_style = style
+            self.content_area.setStyleSheet(style)
 
     def generate_report(self):
         """Gera e salva um relatório semanal em PDF."""
@@ -568,6 +597,11 @@ class MainWindow(QMainWindow):
         # Implementar atualização das estatísticas aqui
         pass
 
+    def closeEvent(self, event):
+        """Encerra o timer do usuário junto com a janela principal."""
+        release_timer_service(self.user_id)
+        super().closeEvent(event)
+        
     def handle_logout(self):
         """Processa o logout do usuário."""
         confirm = QMessageBox.question(
@@ -585,11 +619,10 @@ class MainWindow(QMainWindow):
             login = LoginWindow()
             login.show()
 
-    def update_timer_display(self):
+    def update_timer_display(self, *args):
         """Atualiza o display do timer com o tempo atual."""
-        minutes = self.pomodoro_timer.time_remaining // 60
-        seconds = self.pomodoro_timer.time_remaining % 60
-        self.timer_label.setText(f"{minutes:02d}:{seconds:02d}")
+        if hasattr(self, 'timer_label'):
+            self.timer_label.setText(self.timer_service.time_text())
 
     def on_timer_finished(self, mode):
         """Manipula o evento de término do timer."""
@@ -597,6 +630,7 @@ class MainWindow(QMainWindow):
             # Registrar sessão de estudo concluída
             # Verificar conquistas
             self.check_achievements()
+            self.show_break_notification()
             
             # Mostrar notificação
             self.effects.show_notification(
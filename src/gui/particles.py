@@ -0,0 +1,178 @@
+from PySide6.QtWidgets import QWidget
+from PySide6.QtCore import Qt, QRectF
+from PySide6.QtGui import QPainter, QPixmap, QColor
+from src.utils.lazy_import import lazy_import
+from src.gui.frame_driver import get_governor, widget_visible
+import math
+
+np = lazy_import('numpy')
+
+# Velocidades originais eram por quadro de 30ms; convertidas para por segundo
+FRAME_RATE_BASE = 1 / 0.03
+
+CONFETTI_COLORS = [
+    QColor(255, 0, 0),    # Vermelho
+    QColor(0, 255, 0),    # Verde
+    QColor(0, 0, 255),    # Azul
+    QColor(255, 255, 0),  # Amarelo
+    QColor(255, 0, 255),  # Magenta
+    QColor(0, 255, 255),  # Ciano
+    QColor(255, 165, 0),  # Laranja
+    QColor(128, 0, 128)   # Roxo
+]
+
+class ParticleSystem:
+    """Estado das partículas em arrays NumPy (uma coluna por atributo).
+
+    A integração é vetorizada: o custo por quadro quase não depende do
+    número de partículas, ao contrário de um laço Python sobre dicionários.
+    """
+
+    def __init__(self, count: int, width: int, height: int,
+                 color_count: int, size_count: int, seed=None):
+        self.count = count
+        self.width = width
+        self.height = height
+        self.rng = np.random.default_rng(seed)
+        self.x = self.rng.uniform(0, width, count)
+        self.y = self.rng.uniform(-50, 0, count)
+        self.speed = self.rng.uniform(1, 5, count) * FRAME_RATE_BASE      # px/s
+        self.angle = self.rng.uniform(0, 360, count)                       # graus
+        self.spin = self.rng.uniform(-5, 5, count) * FRAME_RATE_BASE       # graus/s
+        self.color = self.rng.integers(0, color_count, count)
+        self.size = self.rng.integers(0, size_count, count)
+
+    def step(self, dt: float):
+        """Avança a simulação ``dt`` segundos."""
+        self.y += self.speed * dt
+        self.x += np.sin(np.radians(self.angle)) * (2 * FRAME_RATE_BASE * dt)
+        self.angle += self.spin * dt
+        np.mod(self.angle, 360, out=self.angle)
+
+        # Partículas que saíram por baixo voltam ao topo
+        fallen = self.y > self.height
+        count = int(fallen.sum())
+        if count:
+            self.y[fallen] = self.rng.uniform(-50, 0, count)
+            self.x[fallen] = self.rng.uniform(0, self.width, count)
+
+    def resize(self, width: int, height: int):
+        self.width = width
+        self.height = height
+
+class SpriteAtlas:
+    """Sprites dos confetes pré-renderizados em todas as rotações, em um único pixmap.
+
+    Linhas: cor x tamanho; colunas: ângulo quantizado em ``rotation_steps``
+    passos de 0 a 180 graus (o retângulo é simétrico a cada meia volta).
+    """
+
+    SIZES = (6, 10, 14)
+
+    def __init__(self, colors, rotation_steps: int = 32):
+        self.colors = colors
+        self.rotation_steps = rotation_steps
+        self.cell = int(math.ceil(max(self.SIZES) * 1.2)) + 2
+        self.pixmap = QPixmap(self.cell * rotation_steps, self.cell * len(colors) * len(self.SIZES))
+        self.pixmap.fill(Qt.transparent)
+
+        painter = QPainter(self.pixmap)
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.setPen(Qt.NoPen)
+        for color_index, color in enumerate(colors):
+            painter.setBrush(color)
+            for size_index, size in enumerate(self.SIZES):
+                row = color_index * len(self.SIZES) + size_index
+                for step in range(rotation_steps):
+                    painter.save()
+                    painter.translate((step + 0.5) * self.cell, (row + 0.5) * self.cell)
+                    painter.rotate(step * 180 / rotation_steps)
+                    painter.drawRect(QRectF(-size / 2, -size / 4, size, size / 2))
+                    painter.restore()
+        painter.end()
+
+    def source_offsets(self, system: ParticleSystem):
+        """Posição (x, y) no atlas do sprite de cada partícula."""
+        steps = self.rotation_steps
+        column = (np.mod(system.angle, 180) * (steps / 180)).astype(np.int32) % steps
+        row = system.color * len(self.SIZES) + system.size
+        return column * self.cell, row * self.cell
+
+_atlases = {}
+
+def get_atlas(colors=None) -> SpriteAtlas:
+    """Atlas compartilhado por todos os efeitos com as mesmas cores."""
+    colors = colors or CONFETTI_COLORS
+    key = tuple(color.rgba() for color in colors)
+    if key not in _atlases:
+        _atlases[key] = SpriteAtlas(colors)
+    return _atlases[key]
+
+class ParticleWidget(QWidget):
+    """Widget transparente que anima um ParticleSystem pelo relógio central de quadros."""
+
+    def __init__(self, parent=None, count: int = 100, duration: float = 5, colors=None):
+        super().__init__(parent)
+        self.particle_count = count
+        self.duration = duration
+        self.colors = colors or CONFETTI_COLORS
+        self.system = None
+        self.atlas = None
+        self.elapsed = 0.0
+        self.subscription = None
+
+        # Tornar o widget transparente
+        self.setAttribute(Qt.WA_TransparentForMouseEvents)
+        self.setAttribute(Qt.WA_NoSystemBackground)
+        self.setAttribute(Qt.WA_TranslucentBackground)
+
+    def start(self):
+        """Cria as partículas e inicia a animação."""
+        self.atlas = get_atlas(self.colors)
+        self.system = ParticleSystem(
+            self.particle_count, self.width(), self.height(),
+            len(self.colors), len(SpriteAtlas.SIZES)
+        )
+        self.elapsed = 0.0
+        self.subscription = get_governor().subscribe(
+            type(self).__name__, self.advance, visible=widget_visible(self)
+        )
+
+    def advance(self, dt):
+        """Integra a simulação pelo tempo do quadro e agenda a repintura."""
+        self.system.step(dt)
+        self.update()
+
+        self.elapsed += dt
+        if self.elapsed > self.duration:
+            self.finished()
+            return False
+        return True
+
+    def finished(self):
+        """Chamado ao fim da animação."""
+        self.hide()
+
+    def resizeEvent(self, event):
+        if self.system is not None:
+            self.system.resize(self.width(), self.height())
+        super().resizeEvent(event)
+
+    def paintEvent(self, event):
+        """Copia do atlas o sprite já rotacionado de cada partícula."""
+        if self.system is None:
+            return
+        painter = QPainter(self)
+        cell = self.atlas.cell
+        source_x, source_y = self.atlas.source_offsets(self.system)
+        target_x = (self.system.x - cell / 2).astype(np.int32)
+        target_y = (self.system.y - cell / 2).astype(np.int32)
+
+        # Descartar as que estão fora da área visível antes do laço de desenho
+        visible = (target_y > -cell) & (target_y < self.height()) & \
+                  (target_x > -cell) & (target_x < self.width())
+        pixmap = self.atlas.pixmap
+        draw = painter.drawPixmap
+        for x, y, sx, sy in zip(target_x[visible].tolist(), target_y[visible].tolist(),
+                                source_x[visible].tolist(), source_y[visible].tolist()):
+            draw(x, y, pixmap, sx, sy, cell, cell)
@@ -3,6 +3,8 @@ from PySide6.QtCore import *
 from PySide6.QtGui import *
 from src.database.models import User
 from src.gui.themes import Theme
+from src.gui.data_loader import DataLoader
+from sqlalchemy.exc import IntegrityError
 import os
 
 class RegisterWindow(QMainWindow):
@@ -12,6 +14,9 @@ class RegisterWindow(QMainWindow):
         icon = QIcon(os.path.join(os.path.dirname(__file__), '..', 'img', 'logo.png'))
         self.setWindowIcon(icon)
         self.theme = Theme()
+        self.data_loader = DataLoader(self)
+        self.data_loader.loaded.connect(self.on_register_finished)
+        self.data_loader.failed.connect(self.on_register_failed)
         self.setup_ui()
         
     def setup_ui(self):
@@ -75,10 +80,10 @@ class RegisterWindow(QMainWindow):
         form_layout.addWidget(self.confirm_password_input)
         
         # Register button
-        register_btn = QPushButton("Criar Conta")
-        register_btn.setObjectName("primaryButton")
-        register_btn.clicked.connect(self.handle_register)
-        form_layout.addWidget(register_btn)
+        self.register_btn = QPushButton("Criar Conta")
+        self.register_btn.setObjectName("primaryButton")
+        self.register_btn.clicked.connect(self.handle_register)
+        form_layout.addWidget(self.register_btn)
         
         # Login link
         login_btn = QPushButton("Já tem uma conta? Faça login")
@@ -108,8 +113,23 @@ class RegisterWindow(QMainWindow):
             self.show_error("A senha deve ter pelo menos 6 caracteres!")
             return
             
-        # Criar usuário
-        user = User.create(username=username, password=password, email=email)
+        # Criar usuário (o hash da senha é gerado fora da thread da interface)
+        self.register_btn.setEnabled(False)
+        self.data_loader.request(
+            'register', self.create_user, username=username, password=password, email=email
+        )
+    
+    @staticmethod
+    def create_user(username, password, email):
+        """Cria o usuário (fora da thread da interface); None se o nome já existir."""
+        try:
+            return User.create(username=username, password=password, email=email)
+        except IntegrityError:
+            return None
+    
+    def on_register_finished(self, key, user):
+        """Trata o resultado do registro."""
+        self.register_btn.setEnabled(True)
         
         if user:
             QMessageBox.information(
@@ -122,6 +142,11 @@ class RegisterWindow(QMainWindow):
         else:
             self.show_error("Nome de usuário já existe!")
             
+    def on_register_failed(self, key, message):
+        """Trata erros inesperados no registro (banco, hash da senha etc.)."""
+        self.register_btn.setEnabled(True)
+        self.show_error(f"Erro ao criar a conta: {message}")
+            
     def show_error(self, message):
         """Mostra uma mensagem de erro."""
         QMessageBox.critical(self, "Erro", message, QMessageBox.Ok)
@@ -11,7 +11,7 @@ class SettingsWindow(QDialog):
         self.parent = parent  # Guardar referência à janela principal
         self.user_id = parent.user_id
         self.theme = Theme()
-        self.session = get_session()
+        self.session = get_session(self.user_id)
         self.setup_ui()
         self.load_settings()
         
@@ -132,7 +132,7 @@ class SettingsWindow(QDialog):
             long_break_time = self.long_break_spin.value()
             
             # Atualizar configurações do timer
-            self.parent.pomodoro_timer.update_config(
+            self.parent.timer_service.update_config(
                 work_time=work_time,
                 break_time=break_time,
                 long_break_time=long_break_time
@@ -172,5 +172,8 @@ class SettingsWindow(QDialog):
         self.session.commit()
         
         # Atualizar timer
-        self.parent().pomodoro_timer.total_time = work_time * 60
-        self.parent().pomodoro_timer.reset() 
\ No newline at end of file
+        self.parent().timer_service.update_config(
+            work_time=work_time,
+            break_time=break_time,
+            long_break_time=long_break_time
+        ) 
\ No newline at end of file
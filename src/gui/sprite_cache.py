@@ -0,0 +1,222 @@
+from collections import OrderedDict
+import hashlib
+import logging
+import mmap
+import os
+import shutil
+import sys
+from PIL import Image, ImageTk
+from src.database.database import get_data_dir
+from src.config.settings import SPRITES
+
+class SpriteCache:
+    """LRU com orçamento em bytes compartilhado por todas as sprite sheets.
+
+    Guarda quadros já convertidos em ``PhotoImage`` (e, sem o cache em
+    disco, as folhas decodificadas). Ao passar do orçamento, descarta os
+    itens usados há mais tempo; um quadro descartado é recortado de novo
+    na próxima exibição.
+    """
+
+    def __init__(self, budget_bytes: int = None):
+        self.budget = budget_bytes or SPRITES['cache_mb'] * 1024 * 1024
+        self.entries = OrderedDict()
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key):
+        entry = self.entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        self.entries.move_to_end(key)
+        self.hits += 1
+        return entry[0]
+
+    def put(self, key, value, nbytes: int):
+        """Guarda ``value``; itens maiores que o orçamento não são guardados."""
+        self.discard(key)
+        if nbytes > self.budget:
+            return
+        self.entries[key] = (value, nbytes)
+        self.bytes += nbytes
+        while self.bytes > self.budget:
+            _, (_, size) = self.entries.popitem(last=False)
+            self.bytes -= size
+            self.evictions += 1
+
+    def discard(self, key):
+        entry = self.entries.pop(key, None)
+        if entry is not None:
+            self.bytes -= entry[1]
+
+    def discard_sheet(self, sheet_key):
+        """Remove todos os itens de uma folha."""
+        for key in [k for k in self.entries if k[0] == sheet_key]:
+            self.discard(key)
+
+    def stats(self) -> dict:
+        return {
+            'entries': len(self.entries),
+            'bytes': self.bytes,
+            'budget': self.budget,
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions
+        }
+
+class FrameStore:
+    """Quadros de uma folha em RGBA bruto, em disco e mapeados em memória.
+
+    O quadro ``i`` ocupa ``frame_bytes`` a partir de ``i * frame_bytes``;
+    ler um quadro não decodifica a folha e as páginas ficam no cache do
+    sistema operacional, não no heap do processo. O nome do arquivo
+    inclui tamanho e data de modificação da imagem, então uma folha
+    alterada gera um novo arquivo (e o antigo é apagado).
+    """
+
+    def __init__(self, sheet: 'SpriteSheet', directory: str = None):
+        self.sheet = sheet
+        self.directory = directory or os.path.join(get_data_dir(), SPRITES['directory'])
+        self.frame_bytes = sheet.frame_width * sheet.frame_height * 4
+        stat = os.stat(sheet.path)
+        # Prefixo = imagem e tamanho do quadro; versões antigas do mesmo prefixo são apagadas
+        source = hashlib.sha1(os.path.abspath(sheet.path).encode()).hexdigest()[:12]
+        frame = f"{sheet.frame_width}x{sheet.frame_height}"
+        version = hashlib.sha1(f"{stat.st_size}:{stat.st_mtime_ns}".encode()).hexdigest()[:12]
+        self.prefix = f"{source}-{frame}-"
+        self.path = os.path.join(self.directory, f"{self.prefix}{version}.rgba")
+        self._file = None
+        self._map = None
+
+    def open(self):
+        """Mapeia o arquivo, gerando-o a partir da folha se necessário."""
+        expected = self.frame_bytes * len(self.sheet)
+        if not os.path.exists(self.path) or os.path.getsize(self.path) != expected:
+            self._build()
+        self._file = open(self.path, 'rb')
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+
+    def _build(self):
+        os.makedirs(self.directory, exist_ok=True)
+        for name in os.listdir(self.directory):
+            if name.startswith(self.prefix):
+                try:
+                    os.remove(os.path.join(self.directory, name))
+                except OSError:
+                    pass  # Ainda mapeado por outra folha (ex.: no Windows); fica para depois
+
+        temp_path = self.path + '.tmp'
+        with Image.open(self.sheet.path) as image:
+            sheet = image.convert('RGBA')
+        with open(temp_path, 'wb') as f:
+            for index in range(len(self.sheet)):
+                f.write(sheet.crop(self.sheet.box(index)).tobytes())
+        os.replace(temp_path, self.path)
+
+    def frame(self, index: int) -> Image.Image:
+        offset = index * self.frame_bytes
+        size = (self.sheet.frame_width, self.sheet.frame_height)
+        return Image.frombuffer('RGBA', size, self._map[offset:offset + self.frame_bytes], 'raw', 'RGBA', 0, 1)
+
+    def close(self):
+        if self._map is not None:
+            self._map.close()
+            self._file.close()
+            self._map = None
+            self._file = None
+
+class SpriteSheet:
+    """Sequência de quadros de uma sprite sheet, recortados sob demanda.
+
+    ``sheet[i]`` devolve o ``PhotoImage`` do quadro ``i``, recortando-o na
+    primeira exibição. Os quadros ficam no ``SpriteCache`` global, que
+    limita a memória somando todas as folhas carregadas.
+    """
+
+    def __init__(self, path: str, frame_width: int, frame_height: int,
+                 cache: SpriteCache = None, memmap: bool = None):
+        self.path = path
+        self.frame_width = frame_width
+        self.frame_height = frame_height
+        self.cache = cache or get_sprite_cache()
+        self.memmap = SPRITES['memmap'] if memmap is None else memmap
+        self.key = (os.path.abspath(path), frame_width, frame_height)
+        self.logger = logging.getLogger('sprites')
+        self.store = None
+
+        # Só o cabeçalho é lido aqui; a imagem é decodificada no primeiro quadro
+        with Image.open(path) as image:
+            self.width, self.height = image.size
+        self.columns = -(-self.width // frame_width)
+        self.rows = -(-self.height // frame_height)
+
+    def __len__(self) -> int:
+        return self.columns * self.rows
+
+    def __getitem__(self, index: int):
+        if not 0 <= index < len(self):
+            raise IndexError(index)
+        key = (self.key, index)
+        photo = self.cache.get(key)
+        if photo is None:
+            photo = ImageTk.PhotoImage(self._decode(index))
+            self.cache.put(key, photo, self.frame_width * self.frame_height * 4)
+        return photo
+
+    def box(self, index: int):
+        """Retângulo do quadro ``index`` na folha (linha a linha)."""
+        row, column = divmod(index, self.columns)
+        x, y = column * self.frame_width, row * self.frame_height
+        return (x, y, x + self.frame_width, y + self.frame_height)
+
+    def _decode(self, index: int) -> Image.Image:
+        if self.memmap and self.store is None:
+            try:
+                self.store = FrameStore(self)
+                self.store.open()
+            except OSError as e:
+                self.logger.error(f"Erro ao criar o cache em disco de {self.path}: {e}")
+                self.store = None
+                self.memmap = False
+        if self.store is not None:
+            return self.store.frame(index)
+
+        sheet_key = (self.key, 'sheet')
+        sheet = self.cache.get(sheet_key)
+        if sheet is None:
+            with Image.open(self.path) as image:
+                sheet = image.convert('RGBA')
+            self.cache.put(sheet_key, sheet, self.width * self.height * 4)
+        return sheet.crop(self.box(index))
+
+    def release(self):
+        """Libera os quadros em memória e o mapeamento do cache em disco."""
+        self.cache.discard_sheet(self.key)
+        if self.store is not None:
+            self.store.close()
+            self.store = None
+
+_cache = None
+
+def get_sprite_cache() -> SpriteCache:
+    """Cache de quadros compartilhado por todas as sprite sheets."""
+    global _cache
+    if _cache is None:
+        _cache = SpriteCache()
+    return _cache
+
+if __name__ == "__main__":
+    directory = os.path.join(get_data_dir(), SPRITES['directory'])
+    command = sys.argv[1] if len(sys.argv) > 1 else 'info'
+    if command == 'clear':
+        shutil.rmtree(directory, ignore_errors=True)
+        print(f"Cache de sprites removido: {directory}")
+    elif command == 'info':
+        files = os.listdir(directory) if os.path.isdir(directory) else []
+        total = sum(os.path.getsize(os.path.join(directory, name)) for name in files)
+        print(f"{directory}: {len(files)} arquivos, {total / 1024 / 1024:.1f} MB")
+    else:
+        print("Uso: python -m src.gui.sprite_cache [info|clear]")
@@ -1,26 +1,39 @@
-from PySide6.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QLabel, 
+from PySide6.QtWidgets import (QWidget, QDialog, QVBoxLayout, QHBoxLayout, QLabel, 
                               QFrame, QScrollArea, QPushButton, QComboBox, QFileDialog, QMessageBox)
 from PySide6.QtCore import Qt
 from PySide6.QtGui import QPixmap
-import pandas as pd
-import numpy as np
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
-from matplotlib.figure import Figure
 from datetime import datetime, timedelta
+from functools import lru_cache
+from src.utils.lazy_import import lazy_import
 from src.database.models import PomodoroSession, Task
-from src.database.database import get_session
+from src.services.statistics_service import StatisticsService
 from src.services.pomodoro import PomodoroTimer
 from src.services.task_manager import TaskManager
 from src.services.achievement_manager import AchievementManager
+from src.gui.data_loader import DataLoader
 
-class MplCanvas(FigureCanvas):
-    """Canvas para gráficos do Matplotlib."""
+# Importados no primeiro gráfico desenhado
+np = lazy_import('numpy')
+plt = lazy_import('matplotlib.pyplot')
+backend_qtagg = lazy_import('matplotlib.backends.backend_qt5agg')
+figure = lazy_import('matplotlib.figure')
+
+@lru_cache(maxsize=None)
+def _canvas_class():
+    """Monta a classe do canvas (exige o matplotlib já importado)."""
+    class _MplCanvas(backend_qtagg.FigureCanvasQTAgg):
+        """Canvas para gráficos do Matplotlib."""
+        
+        def __init__(self, parent=None, width=5, height=4, dpi=100):
+            self.fig = figure.Figure(figsize=(width, height), dpi=dpi)
+            self.axes = self.fig.add_subplot(111)
+            super().__init__(self.fig)
     
-    def __init__(self, parent=None, width=5, height=4, dpi=100):
-        self.fig = Figure(figsize=(width, height), dpi=dpi)
-        self.axes = self.fig.add_subplot(111)
-        super().__init__(self.fig)
+    return _MplCanvas
+
+def MplCanvas(parent=None, width=5, height=4, dpi=100):
+    """Cria um canvas para gráficos do Matplotlib."""
+    return _canvas_class()(parent, width=width, height=height, dpi=dpi)
 
 class StatisticsPanel(QWidget):
     """Painel de estatísticas completo."""
@@ -31,6 +44,9 @@ class StatisticsPanel(QWidget):
         self.pomodoro_timer = PomodoroTimer(user_id)
         self.task_manager = TaskManager(user_id)
         self.achievement_manager = AchievementManager(user_id)
+        self.data_loader = DataLoader(self)
+        self.data_loader.loaded.connect(self.on_data_loaded)
+        self.data_loader.failed.connect(self.on_data_failed)
         
         self.setup_ui()
         self.load_data()
@@ -220,19 +236,10 @@ class StatisticsPanel(QWidget):
     
     def load_data(self):
         """Carrega os dados para as estatísticas."""
-        try:
-            # Período padrão (últimos 7 dias)
-            start_date = datetime.now() - timedelta(days=7)
-            end_date = datetime.now()
-            
-            self.update_study_time_chart(start_date, end_date)
-            self.update_productivity_chart(start_date, end_date)
-            self.update_tasks_chart(start_date, end_date)
-            self.update_logan_chart(start_date, end_date)
-            self.update_summary_stats(start_date, end_date)
-            
-        except Exception as e:
-            print(f"Erro ao carregar dados: {e}")
+        # Período padrão (últimos 7 dias)
+        start_date = datetime.now() - timedelta(days=7)
+        end_date = datetime.now()
+        self.request_period(start_date, end_date)
     
     def change_period(self, period):
         """Muda o período das estatísticas."""
@@ -249,17 +256,42 @@ class StatisticsPanel(QWidget):
         else:
             start_date = end_date - timedelta(days=7)
         
-        self.update_study_time_chart(start_date, end_date)
-        self.update_productivity_chart(start_date, end_date)
-        self.update_tasks_chart(start_date, end_date)
-        self.update_logan_chart(start_date, end_date)
-        self.update_summary_stats(start_date, end_date)
+        self.request_period(start_date, end_date)
+    
+    def request_period(self, start_date, end_date):
+        """Busca os dados do período em segundo plano."""
+        self.data_loader.request(
+            'statistics', self.fetch_period_data, self.user_id, start_date, end_date
+        )
     
-    def update_study_time_chart(self, start_date, end_date):
+    @staticmethod
+    def fetch_period_data(user_id, start_date, end_date):
+        """Consulta os dados do período (executado fora da thread da interface)."""
+        data = StatisticsService(user_id).get_period_data(start_date, end_date)
+        data['start_date'] = start_date
+        data['end_date'] = end_date
+        return data
+    
+    def on_data_loaded(self, key, data):
+        """Redesenha os gráficos com os dados carregados."""
+        try:
+            start_date, end_date = data['start_date'], data['end_date']
+            
+            self.update_study_time_chart(start_date, end_date, data['study_sessions'])
+            self.update_productivity_chart(data['study_sessions'])
+            self.update_tasks_chart(data['tasks'])
+            self.update_logan_chart(start_date, end_date)
+            self.update_summary_stats(data)
+            
+        except Exception as e:
+            print(f"Erro ao carregar dados: {e}")
+    
+    def on_data_failed(self, key, message):
+        """Informa falhas no carregamento dos dados."""
+        print(f"Erro ao carregar dados: {message}")
+    
+    def update_study_time_chart(self, start_date, end_date, study_sessions):
         """Atualiza o gráfico de tempo de estudo."""
-        # Obter dados do pomodoro
-        study_sessions = self.pomodoro_timer.get_study_sessions(start_date, end_date)
-        
         # Preparar dados para o gráfico
         dates = []
         minutes = []
@@ -288,11 +320,8 @@ class StatisticsPanel(QWidget):
         self.study_time_chart.fig.tight_layout()
         self.study_time_chart.draw()
     
-    def update_productivity_chart(self, start_date, end_date):
+    def update_productivity_chart(self, study_sessions):
         """Atualiza o gráfico de produtividade por horário."""
-        # Obter dados do pomodoro
-        study_sessions = self.pomodoro_timer.get_study_sessions(start_date, end_date)
-        
         # Preparar dados para o gráfico
         hours = list(range(24))
         productivity = [0] * 24
@@ -314,15 +343,13 @@ class StatisticsPanel(QWidget):
         self.productivity_chart.fig.tight_layout()
         self.productivity_chart.draw()
     
-    def update_tasks_chart(self, start_date, end_date):
+    def update_tasks_chart(self, tasks):
         """Atualiza o gráfico de tarefas."""
-        # Obter dados de tarefas
-        tasks = self.task_manager.get_tasks(start_date, end_date)
-        
-        # Contar tarefas por status
+        # Contar tarefas por status (sem deadline conta como pendente)
+        now = datetime.now()
         completed = len([t for t in tasks if t['completed']])
-        pending = len([t for t in tasks if not t['completed'] and t['deadline'] > datetime.now()])
-        overdue = len([t for t in tasks if not t['completed'] and t['deadline'] <= datetime.now()])
+        pending = len([t for t in tasks if not t['completed'] and (t['deadline'] is None or t['deadline'] > now)])
+        overdue = len([t for t in tasks if not t['completed'] and t['deadline'] is not None and t['deadline'] <= now])
         
         # Criar gráfico
         ax = self.tasks_chart.axes
@@ -374,10 +401,10 @@ class StatisticsPanel(QWidget):
         self.logan_chart.fig.tight_layout()
         self.logan_chart.draw()
     
-    def update_summary_stats(self, start_date, end_date):
+    def update_summary_stats(self, data):
         """Atualiza as estatísticas resumidas."""
         # Total de tempo estudado
-        study_sessions = self.pomodoro_timer.get_study_sessions(start_date, end_date)
+        study_sessions = data['study_sessions']
         total_minutes = sum([session['duration'] for session in study_sessions])
         hours = total_minutes // 60
         minutes = total_minutes % 60
@@ -386,17 +413,14 @@ class StatisticsPanel(QWidget):
         total_pomodoros = len(study_sessions)
         
         # Total de tarefas
-        tasks = self.task_manager.get_tasks(start_date, end_date)
-        completed_tasks = len([t for t in tasks if t['completed']])
-        
-        # Nível atual
-        user_level = self.achievement_manager.get_user_level()
+        completed_tasks = len([t for t in data['tasks'] if t['completed']])
         
         # Atualizar valores
-        self.findChild(QLabel, "statValue", Qt.FindChildrenRecursively)[0].setText(f"{hours}h {minutes}m")
-        self.findChild(QLabel, "statValue", Qt.FindChildrenRecursively)[1].setText(str(total_pomodoros))
-        self.findChild(QLabel, "statValue", Qt.FindChildrenRecursively)[2].setText(str(completed_tasks))
-        self.findChild(QLabel, "statValue", Qt.FindChildrenRecursively)[3].setText(str(user_level['level']))
+        values = self.findChildren(QLabel, "statValue", Qt.FindChildrenRecursively)
+        values[0].setText(f"{hours}h {minutes}m")
+        values[1].setText(str(total_pomodoros))
+        values[2].setText(str(completed_tasks))
+        values[3].setText(str(data['level']))
     
     def export_as_pdf(self):
         """Exporta as estatísticas como PDF."""
@@ -514,7 +538,7 @@ class StatisticsWindow(QDialog):
     def __init__(self, parent):
         super().__init__(parent)
         self.user_id = parent.user_id
-        self.session = get_session()
+        self.statistics = StatisticsService(self.user_id)
         self.setup_ui()
         
     def setup_ui(self):
@@ -535,37 +559,21 @@ class StatisticsWindow(QDialog):
         stats_frame = QFrame()
         stats_layout = QVBoxLayout(stats_frame)
         
+        snapshot = self.statistics.get_snapshot()
+        
         # Pomodoros completados hoje
-        today = datetime.now().date()
-        pomodoros_today = self.session.query(PomodoroSession).filter(
-            PomodoroSession.user_id == self.user_id,
-            PomodoroSession.start_time >= today,
-            PomodoroSession.completed == True
-        ).count()
-        
-        pomodoro_label = QLabel(f"Pomodoros Completados Hoje: {pomodoros_today}")
+        pomodoro_label = QLabel(f"Pomodoros Completados Hoje: {snapshot['pomodoros_today']}")
         pomodoro_label.setStyleSheet("font-size: 16pt;")
         stats_layout.addWidget(pomodoro_label)
         
         # Tarefas completadas hoje
-        tasks_today = self.session.query(Task).filter(
-            Task.user_id == self.user_id,
-            Task.completed == True,
-            Task.completion_date >= today
-        ).count()
-        
-        tasks_label = QLabel(f"Tarefas Completadas Hoje: {tasks_today}")
+        tasks_label = QLabel(f"Tarefas Completadas Hoje: {snapshot['tasks_today']}")
         tasks_label.setStyleSheet("font-size: 16pt;")
         stats_layout.addWidget(tasks_label)
         
         # Tempo total focado
-        total_time = self.session.query(PomodoroSession).filter(
-            PomodoroSession.user_id == self.user_id,
-            PomodoroSession.completed == True
-        ).count() * 25  # 25 minutos por pomodoro
-        
-        hours = total_time // 60
-        minutes = total_time % 60
+        hours = snapshot['total_minutes'] // 60
+        minutes = snapshot['total_minutes'] % 60
         time_label = QLabel(f"Tempo Total Focado: {hours}h {minutes}m")
         time_label.setStyleSheet("font-size: 16pt;")
         stats_layout.addWidget(time_label)
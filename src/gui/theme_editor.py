@@ -8,12 +8,45 @@ from src.database.database import get_data_dir
 class ThemeEditorDialog(QDialog):
     """Diálogo para edição de temas personalizados."""
     
+    # Intervalo para agrupar mudanças de cor antes de atualizar o preview
+    PREVIEW_DEBOUNCE_MS = 40
+    
+    # Cor do tema -> (objectName dos widgets do preview, papel da paleta afetado)
+    PREVIEW_ROLES = {
+        'bg_dark': [('previewContent', QPalette.Window)],
+        'bg_darker': [('previewCard', QPalette.Window)],
+        'fg': [
+            ('cardTitle', QPalette.WindowText),
+            ('cardContent', QPalette.WindowText),
+            ('primaryButton', QPalette.ButtonText),
+            ('secondaryButton', QPalette.ButtonText),
+            ('accentButton', QPalette.ButtonText)
+        ],
+        'accent': [('primaryButton', QPalette.Button), ('studyBox', QPalette.Highlight)],
+        'bg_light': [('secondaryButton', QPalette.Button), ('studyBox', QPalette.Button)],
+        'secondary': [('accentButton', QPalette.Button)]
+    }
+    
     def __init__(self, theme_manager, parent=None):
         super().__init__(parent)
         self.theme_manager = theme_manager
         self.current_theme = theme_manager.get_current_theme()
         self.theme_colors = theme_manager.colors.copy()
         
+        # Cores alteradas desde a última atualização do preview
+        self.pending_colors = set()
+        self.preview_timer = QTimer(self)
+        self.preview_timer.setSingleShot(True)
+        self.preview_timer.setInterval(self.PREVIEW_DEBOUNCE_MS)
+        self.preview_timer.timeout.connect(self.apply_preview)
+        
+        # Seletor de cores não modal, reaproveitado entre os campos
+        self.editing_color = None
+        self.original_color = None
+        self.color_dialog = QColorDialog(self)
+        self.color_dialog.currentColorChanged.connect(self.on_color_changed)
+        self.color_dialog.rejected.connect(self.on_color_rejected)
+        
         self.setWindowTitle("Editor de Temas")
         self.setMinimumSize(800, 600)
         self.setup_ui()
@@ -50,7 +83,6 @@ class ThemeEditorDialog(QDialog):
         
         for color_name, color_value in self.theme_colors.items():
             label = QLabel(color_name)
-            picker = QColorDialog.getColor(QColor(color_value))
             picker_btn = QPushButton()
             picker_btn.setStyleSheet(f"background-color: {color_value}; min-width: 100px; min-height: 30px;")
             picker_btn.clicked.connect(lambda checked=False, name=color_name: self.pick_color(name))
@@ -106,6 +138,7 @@ class ThemeEditorDialog(QDialog):
         card_layout.addWidget(card_title)
         
         card_content = QLabel("Este é um exemplo de conteúdo em um card, usando as cores do tema selecionado.")
+        card_content.setObjectName("cardContent")
         card_content.setWordWrap(True)
         card_layout.addWidget(card_content)
         
@@ -144,6 +177,13 @@ class ThemeEditorDialog(QDialog):
         
         preview_layout.addWidget(preview_content)
         
+        # O estilo do preview é fixo e lê as cores da paleta de cada widget
+        preview_content.setStyleSheet(self.generate_preview_style())
+        self.preview_widgets = {}
+        for widget in [preview_content] + preview_content.findChildren(QWidget):
+            if widget.objectName():
+                self.preview_widgets.setdefault(widget.objectName(), []).append(widget)
+        
         # Adicionar painéis ao splitter
         editor_area.addWidget(color_panel)
         editor_area.addWidget(preview_panel)
@@ -161,77 +201,106 @@ class ThemeEditorDialog(QDialog):
         self.update_preview()
     
     def pick_color(self, color_name):
-        """Abre o seletor de cores para um campo específico."""
-        current_color = QColor(self.color_pickers[color_name]['color'])
-        color = QColorDialog.getColor(current_color, self)
-        
-        if color.isValid():
-            self.color_pickers[color_name]['color'] = color.name()
-            self.color_pickers[color_name]['button'].setStyleSheet(
-                f"background-color: {color.name()}; min-width: 100px; min-height: 30px;"
-            )
-            self.theme_colors[color_name] = color.name()
-            self.update_preview()
+        """Abre o seletor de cores (não modal) para um campo específico."""
+        self.editing_color = color_name
+        self.original_color = self.theme_colors[color_name]
+        
+        self.color_dialog.blockSignals(True)
+        self.color_dialog.setCurrentColor(QColor(self.original_color))
+        self.color_dialog.blockSignals(False)
+        self.color_dialog.setWindowTitle(f"Cor: {color_name}")
+        self.color_dialog.show()
+        self.color_dialog.raise_()
+    
+    def on_color_changed(self, color):
+        """Acompanha a cor enquanto o usuário arrasta no seletor."""
+        if self.editing_color and color.isValid():
+            self.set_color(self.editing_color, color.name())
+    
+    def on_color_rejected(self):
+        """Cancelar no seletor devolve a cor original."""
+        if self.editing_color:
+            self.set_color(self.editing_color, self.original_color)
+        self.editing_color = None
+    
+    def set_color(self, color_name, color_value):
+        """Registra a nova cor e agenda a atualização do preview."""
+        if self.theme_colors.get(color_name) == color_value:
+            return
+        
+        self.theme_colors[color_name] = color_value
+        self.color_pickers[color_name]['color'] = color_value
+        self.color_pickers[color_name]['button'].setStyleSheet(
+            f"background-color: {color_value}; min-width: 100px; min-height: 30px;"
+        )
+        self.pending_colors.add(color_name)
+        self.preview_timer.start()
     
     def update_preview(self):
-        """Atualiza a visualização do tema."""
-        style = self.generate_preview_style()
-        self.findChild(QWidget, "previewContent").setStyleSheet(style)
+        """Atualiza a visualização do tema inteira, sem esperar o debounce."""
+        self.pending_colors.update(self.theme_colors)
+        self.preview_timer.stop()
+        self.apply_preview()
+    
+    def apply_preview(self):
+        """Aplica ao preview só as cores alteradas, via paleta dos widgets afetados."""
+        changed = {}
+        for color_name in self.pending_colors:
+            if color_name not in self.theme_colors:
+                continue
+            color = QColor(self.theme_colors[color_name])
+            for object_name, role in self.PREVIEW_ROLES.get(color_name, []):
+                for widget in self.preview_widgets.get(object_name, []):
+                    palette = changed.get(widget, widget.palette())
+                    palette.setColor(role, color)
+                    changed[widget] = palette
+        self.pending_colors.clear()
+        
+        # Repolir apenas os widgets cuja paleta mudou
+        for widget, palette in changed.items():
+            widget.setPalette(palette)
+            widget.style().unpolish(widget)
+            widget.style().polish(widget)
+            widget.update()
     
     def generate_preview_style(self):
-        """Gera o CSS para o preview com as cores atuais."""
-        return f"""
-            #previewContent {{
-                background-color: {self.theme_colors['bg_dark']};
+        """Gera o CSS do preview; as cores vêm da paleta de cada widget."""
+        return """
+            #previewContent {
+                background-color: palette(window);
                 padding: 20px;
                 border-radius: 10px;
-            }}
+            }
             
-            #previewCard {{
-                background-color: {self.theme_colors['bg_darker']};
+            #previewCard {
+                background-color: palette(window);
                 border-radius: 8px;
                 padding: 15px;
                 margin-bottom: 15px;
-            }}
+            }
             
-            #cardTitle {{
-                color: {self.theme_colors['fg']};
+            #cardTitle {
+                color: palette(window-text);
                 font-size: 16px;
                 font-weight: bold;
                 margin-bottom: 10px;
-            }}
-            
-            QLabel {{
-                color: {self.theme_colors['fg']};
-            }}
-            
-            #primaryButton {{
-                background-color: {self.theme_colors['accent']};
-                color: {self.theme_colors['fg']};
-                border: none;
-                padding: 8px 16px;
-                border-radius: 4px;
-            }}
+            }
             
-            #secondaryButton {{
-                background-color: {self.theme_colors['bg_light']};
-                color: {self.theme_colors['fg']};
-                border: none;
-                padding: 8px 16px;
-                border-radius: 4px;
-            }}
+            QLabel {
+                color: palette(window-text);
+            }
             
-            #accentButton {{
-                background-color: {self.theme_colors['secondary']};
-                color: {self.theme_colors['fg']};
+            #primaryButton, #secondaryButton, #accentButton {
+                background-color: palette(button);
+                color: palette(button-text);
                 border: none;
                 padding: 8px 16px;
                 border-radius: 4px;
-            }}
+            }
             
-            #studyBox {{
-                background-color: {self.theme_colors['bg_light']};
-                border: 2px solid {self.theme_colors['accent']};
+            #studyBox {
+                background-color: palette(button);
+                border: 2px solid palette(highlight);
                 border-radius: 6px;
                 padding: 8px;
                 margin: 2px;
@@ -239,11 +308,11 @@ class ThemeEditorDialog(QDialog):
                 min-height: 30px;
                 max-width: 30px;
                 max-height: 30px;
-            }}
+            }
             
-            #studyBox:checked {{
-                background-color: {self.theme_colors['accent']};
-            }}
+            #studyBox:checked {
+                background-color: palette(highlight);
+            }
         """
     
     def change_theme(self, theme_name):
@@ -252,6 +321,10 @@ class ThemeEditorDialog(QDialog):
             self.current_theme = theme_name
             self.theme_colors = self.theme_manager.themes[theme_name].copy()
             
+            # A edição em andamento pertence ao tema anterior
+            self.editing_color = None
+            self.color_dialog.hide()
+            
             # Atualizar botões de cores
             for color_name, color_value in self.theme_colors.items():
                 self.color_pickers[color_name]['color'] = color_value
@@ -1,5 +1,80 @@
-from PySide6.QtGui import QPixmap
+from PySide6.QtGui import QPixmap, QColor, QFontDatabase, QPalette
+from PySide6.QtCore import QDir
+from src.database.database import get_data_dir
+from src.utils.lazy_import import lazy_import
+from importlib import metadata
+import hashlib
+import json
+import marshal
 import os
+import logging
+
+qt_material = lazy_import('qt_material')
+
+_material_version = None
+
+# Fontes do qt_material já registradas no processo
+_loaded_fonts = set()
+
+def material_version() -> str:
+    """Versão do qt_material ('' se não estiver instalado), lida uma só vez.
+
+    Vem dos metadados do pacote, sem importar o qt_material: a versão faz
+    parte da chave do cache, que precisa ser montada antes de saber se o
+    módulo será usado.
+    """
+    global _material_version
+    if _material_version is None:
+        try:
+            _material_version = metadata.version('qt-material')
+        except metadata.PackageNotFoundError:
+            _material_version = ''
+    return _material_version
+
+class StyleSheetCache:
+    """Cache das folhas de estilo geradas, em memória e em disco.
+    
+    Cada entrada é um dicionário (a folha de estilo e dados auxiliares),
+    gravado como JSON em ``<diretório de dados>/stylesheets``.
+    """
+    
+    def __init__(self, directory: str = None):
+        self.directory = directory or os.path.join(get_data_dir(), 'stylesheets')
+        self.logger = logging.getLogger('stylesheet_cache')
+        self._memory = {}
+    
+    def _path(self, key):
+        digest = hashlib.sha1(key.encode('utf-8')).hexdigest()[:16]
+        return os.path.join(self.directory, f"{digest}.json")
+    
+    def get(self, key: str, builder, validate=None) -> dict:
+        """Retorna a entrada de ``key``, gerando-a com ``builder()`` se preciso."""
+        entry = self._memory.get(key)
+        if entry is not None:
+            return entry
+        
+        path = self._path(key)
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                entry = json.load(f)
+            if validate and not validate(entry):
+                entry = None
+        except (OSError, ValueError):
+            entry = None
+        
+        if entry is None:
+            entry = builder()
+            try:
+                os.makedirs(self.directory, exist_ok=True)
+                with open(path, 'w', encoding='utf-8') as f:
+                    json.dump(entry, f)
+            except OSError as e:
+                self.logger.warning(f"Não foi possível gravar o cache de estilo: {e}")
+        
+        self._memory[key] = entry
+        return entry
+
+_style_cache = StyleSheetCache()
 
 class ThemeManager:
     THEMES = {
@@ -68,9 +143,6 @@ class Theme:
             'secondary': '#7289da'      # Azul secundário
         }
         
-        # Debug da estrutura de diretórios
-        self._check_directory_structure()
-        
         # Carregar recursos
         self.logo = self._load_logo()
         
@@ -94,20 +166,85 @@ class Theme:
         
         return None
 
-    def _check_directory_structure(self):
-        """Verifica e imprime a estrutura de diretórios para debug."""
-        current_dir = os.getcwd()
-        print(f"Diretório atual: {current_dir}")
-        print(f"Conteúdo do diretório:")
-        for root, dirs, files in os.walk(current_dir):
-            level = root.replace(current_dir, '').count(os.sep)
-            indent = ' ' * 4 * level
-            print(f"{indent}{os.path.basename(root)}/")
-            subindent = ' ' * 4 * (level + 1)
-            for f in files:
-                print(f"{subindent}{f}")
-
+    # Tema do qt_material usado como base do estilo da janela principal
+    MATERIAL_THEME = 'dark_blue.xml'
+    
+    def _colors_key(self):
+        return json.dumps(self.colors, sort_keys=True)
+    
+    @classmethod
+    def _template_key(cls):
+        """Hash do código de ``_build_main_style``: mudou o modelo, muda a chave."""
+        if '_template_digest' not in cls.__dict__:
+            code = marshal.dumps(cls._build_main_style.__code__)
+            cls._template_digest = hashlib.sha1(code).hexdigest()[:12]
+        return cls._template_digest
+    
     def get_main_style(self):
+        """Retorna o estilo principal do tema atual (gerado uma vez por paleta)."""
+        return _style_cache.get(
+            f"main:{self._template_key()}:{self._colors_key()}",
+            lambda: {'stylesheet': self._build_main_style()}
+        )['stylesheet']
+    
+    def apply_material_base(self, window):
+        """Aplica a base do qt_material na janela (não depende da paleta).
+        
+        Faz o mesmo que ``qt_material.apply_stylesheet`` a partir do cache:
+        caminhos dos ícones, fontes Roboto, cor do texto de exemplo na
+        paleta e a folha de estilo. Trocar de tema não passa por aqui.
+        """
+        entry = self._material_base()
+        
+        # Os ícones do tema são referenciados como "icon:" na folha de estilo
+        if entry['icon_paths']:
+            QDir.setSearchPaths('icon', entry['icon_paths'])
+        for font in entry['fonts']:
+            if font not in _loaded_fonts:
+                QFontDatabase.addApplicationFont(font)
+                _loaded_fonts.add(font)
+        if entry['placeholder']:
+            palette = window.palette()
+            palette.setColor(QPalette.ColorGroup.All, QPalette.ColorRole.PlaceholderText,
+                             QColor(*entry['placeholder']))
+            window.setPalette(palette)
+        window.setStyleSheet(entry['stylesheet'])
+    
+    def _material_base(self) -> dict:
+        """Folha de estilo do qt_material e recursos dela (a parte cara de gerar)."""
+        version = material_version()
+        
+        def build():
+            try:
+                stylesheet = qt_material.build_stylesheet(theme=self.MATERIAL_THEME) or ''
+                theme = qt_material.get_theme(self.MATERIAL_THEME) or {}
+            except ImportError:
+                return {'stylesheet': '', 'icon_paths': [], 'fonts': [], 'placeholder': None}
+            
+            fonts_dir = os.path.join(os.path.dirname(qt_material.__file__), 'fonts', 'roboto')
+            fonts = [
+                os.path.join(fonts_dir, name) for name in sorted(os.listdir(fonts_dir))
+                if name.endswith('.ttf')
+            ] if os.path.isdir(fonts_dir) else []
+            
+            # Texto de exemplo na cor secundária do tema, translúcido
+            color = theme.get('secondaryTextColor', '').lstrip('#')
+            placeholder = [int(color[i:i + 2], 16) for i in (0, 2, 4)] + [92] if len(color) == 6 else None
+            return {
+                'stylesheet': stylesheet,
+                'icon_paths': QDir.searchPaths('icon'),
+                'fonts': fonts,
+                'placeholder': placeholder
+            }
+        
+        def valid(entry):
+            if 'fonts' not in entry:
+                return False
+            return all(os.path.exists(path) for path in entry['icon_paths'] + entry['fonts'])
+        
+        return _style_cache.get(f"material:{self.MATERIAL_THEME}:{version}", build, valid)
+    
+    def _build_main_style(self):
         return f"""
             /* Títulos e Textos */
             #pageTitle {{
@@ -0,0 +1,100 @@
+from PySide6.QtCore import QObject, QTimer, QEvent, Qt, Signal
+from src.services.timer_engine import TimerEngine
+
+class TimerClock(QObject):
+    """Agenda as atualizações de um TimerEngine no loop de eventos do Qt.
+
+    Usa um único QTimer de disparo único, programado para o instante em
+    que o valor exibido muda. Quando nenhuma das views observadas está
+    visível (aba oculta ou janela minimizada), agenda um único despertar
+    no fim da contagem.
+    """
+
+    tick = Signal(int)   # Segundos restantes, emitido só quando o valor exibido muda
+    finished = Signal()
+
+    # Folga para acordar logo depois da virada do segundo, e não logo antes
+    WAKE_SLACK_MS = 2
+
+    def __init__(self, engine: TimerEngine = None, parent=None):
+        super().__init__(parent)
+        self.engine = engine or TimerEngine()
+        self.views = []
+        self.last_value = None
+        self.timer = QTimer(self)
+        self.timer.setSingleShot(True)
+        self.timer.setTimerType(Qt.PreciseTimer)
+        self.timer.timeout.connect(self.wake)
+
+    def start(self):
+        self.engine.start()
+        self.wake()
+
+    def pause(self):
+        self.engine.pause()
+        self.timer.stop()
+
+    def stop(self):
+        """Para os despertares sem mexer no engine (o prazo continua valendo)."""
+        self.timer.stop()
+
+    def reset(self, duration: float = None):
+        self.engine.reset(duration)
+        self.timer.stop()
+        self.last_value = None
+        self.emit_tick()
+
+    def wake(self):
+        """Atualiza a tela (se o valor mudou) e agenda o próximo despertar."""
+        if self.engine.is_running and self.engine.is_finished():
+            self.engine.pause()
+            self.emit_tick()
+            self.finished.emit()
+            return
+
+        if self.is_visible():
+            self.emit_tick()
+        self.schedule()
+
+    def emit_tick(self):
+        value = self.engine.remaining_seconds()
+        if value != self.last_value:
+            self.last_value = value
+            self.tick.emit(value)
+
+    def schedule(self):
+        if not self.engine.is_running:
+            self.timer.stop()
+            return
+        if self.is_visible():
+            delay = self.engine.ms_until_change()
+        else:
+            delay = self.engine.ms_until_finish()
+        self.timer.start(delay + self.WAKE_SLACK_MS)
+
+    def watch(self, widget):
+        """Passa a considerar ``widget`` ao decidir entre despertares finos e grossos."""
+        if widget in self.views:
+            return
+        self.views.append(widget)
+        widget.installEventFilter(self)
+        widget.destroyed.connect(lambda *_: self.views.remove(widget) if widget in self.views else None)
+
+    def is_visible(self) -> bool:
+        """Alguma view observada está na tela? Sem views, considera visível."""
+        if not self.views:
+            return True
+        return any(view.isVisible() and not view.window().isMinimized() for view in self.views)
+
+    def eventFilter(self, obj, event):
+        if event.type() == QEvent.Show and obj in self.views:
+            # A janela de topo só é conhecida depois que a view é exibida
+            obj.window().installEventFilter(self)
+        if event.type() in (QEvent.Show, QEvent.Hide, QEvent.WindowStateChange):
+            # Reprogramar: ao voltar a ser visível, atualiza a tela imediatamente
+            QTimer.singleShot(0, self.refresh)
+        return False
+
+    def refresh(self):
+        if self.engine.is_running:
+            self.wake()
@@ -0,0 +1,225 @@
+from PySide6.QtCore import QObject, Signal
+from datetime import datetime
+from src.config.settings import POMODORO_DEFAULTS
+from src.services.pomodoro import PomodoroTimer
+from src.services import timer_journal
+from src.services.timer_journal import TimerJournal
+from src.gui.timer_clock import TimerClock
+import time
+import logging
+
+class TimerService(QObject):
+    """Timer Pomodoro único de um usuário, observado por todas as views.
+
+    Mantém a máquina de estados (work -> break/long_break -> work) e um
+    único TimerClock; as views apenas se conectam aos sinais, de modo que
+    um só timer dispara por atualização, quantas views estiverem abertas.
+    Cada mudança de estado vai para o TimerJournal, de onde o timer é
+    restaurado se a aplicação for encerrada no meio de um ciclo.
+    """
+
+    tick = Signal(int)            # Segundos restantes
+    phaseChanged = Signal(str)    # Novo modo: work, break ou long_break
+    runningChanged = Signal(bool)
+    timerFinished = Signal(str)   # Modo do ciclo que terminou
+    countChanged = Signal(int)    # Pomodoros concluídos
+
+    PHASE_LABELS = {
+        'work': "Pomodoro",
+        'break': "Pausa Curta",
+        'long_break': "Pausa Longa"
+    }
+
+    def __init__(self, user_id, parent=None):
+        super().__init__(parent)
+        self.user_id = user_id
+        self.logger = logging.getLogger('timer_service')
+        self.pomodoro = PomodoroTimer(user_id)
+        self.mode = "work"
+        self.pomodoro_count = 0
+        self.long_break_interval = POMODORO_DEFAULTS['long_break_interval']
+
+        self.phase_started_at = None  # time.time() do início do ciclo atual
+
+        self.clock = TimerClock(self.pomodoro.engine, self)
+        self.clock.tick.connect(self.tick)
+        self.clock.finished.connect(self.complete_phase)
+
+        self.journal = TimerJournal(user_id)
+        self.restore()
+
+    def record(self, event: int, sync: bool = False):
+        """Registra o estado atual no diário."""
+        self.journal.append(
+            event, self.mode, self.pomodoro_count, self.phase_started_at or 0.0,
+            self.clock.engine.remaining(), self.clock.engine.duration, sync=sync
+        )
+
+    def restore(self):
+        """Retoma o estado do último registro do diário."""
+        record = self.journal.last()
+        if record is None:
+            return
+        self.pomodoro_count = record.count
+        if record.event in ('end', 'abort'):
+            return
+
+        self.mode = record.mode
+        self.phase_started_at = record.started_at
+        if record.event == 'pause':
+            self.clock.engine.reset(record.duration, record.remaining)
+            return
+
+        remaining = record.remaining - (time.time() - record.event_at)
+        if remaining > 0:
+            self.clock.engine.reset(record.duration, remaining)
+            self.clock.start()
+            self.logger.info(f"Timer restaurado: {self.mode}, {remaining:.0f}s restantes")
+            return
+
+        # O ciclo terminou com a aplicação fechada: gravar e deixar o próximo parado
+        self.finish_phase(completed=True, ended_at=record.event_at + record.remaining)
+        self.clock.reset(self.phase_duration(self.mode))
+        self.logger.info(f"Ciclo {record.mode} concluído com a aplicação fechada")
+
+    @property
+    def is_running(self) -> bool:
+        return self.clock.engine.is_running
+
+    def phase_duration(self, mode: str) -> int:
+        """Duração do modo em segundos, segundo a configuração do usuário."""
+        config = self.pomodoro.config
+        minutes = {
+            'work': config.work_time,
+            'break': config.break_time,
+            'long_break': config.long_break_time
+        }[mode]
+        return minutes * 60
+
+    def phase_label(self) -> str:
+        return self.PHASE_LABELS[self.mode]
+
+    def remaining_seconds(self) -> int:
+        return self.clock.engine.remaining_seconds()
+
+    def progress(self) -> float:
+        return self.clock.engine.progress()
+
+    def time_text(self) -> str:
+        return self.clock.engine.format()
+
+    def start(self):
+        if not self.is_running:
+            if self.phase_started_at is None:
+                self.phase_started_at = time.time()
+                self.record(timer_journal.START, sync=True)
+            else:
+                self.record(timer_journal.RESUME)
+            self.clock.start()
+            self.runningChanged.emit(True)
+
+    def pause(self):
+        if self.is_running:
+            self.clock.pause()
+            self.record(timer_journal.PAUSE)
+            self.runningChanged.emit(False)
+
+    def toggle(self):
+        if self.is_running:
+            self.pause()
+        else:
+            self.start()
+
+    def reset(self):
+        """Volta ao início do modo atual, parado."""
+        self.clock.reset(self.phase_duration(self.mode))
+        if self.phase_started_at is not None:
+            self.phase_started_at = None
+            self.record(timer_journal.ABORT, sync=True)
+        self.runningChanged.emit(False)
+
+    def skip(self):
+        """Encerra o ciclo atual e passa para o próximo."""
+        self.clock.pause()
+        self.complete_phase(completed=False)
+
+    def finish_phase(self, completed: bool, ended_at: float = None):
+        """Grava o ciclo encerrado e avança a máquina de estados."""
+        finished = self.mode
+        ended_at = ended_at or time.time()
+        if finished == "work" and self.phase_started_at:
+            self.pomodoro.save_session(
+                datetime.fromtimestamp(self.phase_started_at),
+                datetime.fromtimestamp(ended_at),
+                completed
+            )
+        self.record(timer_journal.END)
+
+        if finished == "work":
+            self.pomodoro_count += 1
+            if self.pomodoro_count % self.long_break_interval == 0:
+                self.mode = "long_break"
+            else:
+                self.mode = "break"
+        else:
+            self.mode = "work"
+        self.phase_started_at = None
+        return finished
+
+    def complete_phase(self, completed: bool = True):
+        """Fecha o ciclo atual e inicia automaticamente o próximo."""
+        finished = self.finish_phase(completed)
+        self.timerFinished.emit(finished)
+        if finished == "work":
+            self.countChanged.emit(self.pomodoro_count)
+
+        self.logger.debug(f"Ciclo {finished} concluído, iniciando {self.mode}")
+        self.clock.reset(self.phase_duration(self.mode))
+        self.phaseChanged.emit(self.mode)
+        self.phase_started_at = time.time()
+        self.record(timer_journal.START, sync=True)
+        self.clock.start()
+        self.runningChanged.emit(True)
+
+    def update_config(self, work_time=None, break_time=None, long_break_time=None,
+                      long_break_interval=None):
+        """Atualiza as durações (em minutos) e o intervalo das pausas longas."""
+        self.pomodoro.update_config(
+            work_time=work_time,
+            break_time=break_time,
+            long_break_time=long_break_time
+        )
+        if long_break_interval is not None:
+            self.long_break_interval = long_break_interval
+        if self.phase_started_at is None:
+            self.clock.reset(self.phase_duration(self.mode))
+
+    def watch(self, view):
+        """Registra uma view para decidir entre atualizações finas e grossas."""
+        self.clock.watch(view)
+
+    def shutdown(self):
+        """Para o relógio e fecha o diário (logout ou janela fechada).
+
+        O ciclo não é pausado: o diário continua registrando o prazo, e o
+        próximo ``restore()`` retoma o timer de onde o relógio real estiver.
+        """
+        self.clock.stop()
+        self.journal.close()
+
+_services = {}
+
+def get_timer_service(user_id) -> TimerService:
+    """Retorna o timer compartilhado do usuário, criando-o no primeiro uso."""
+    service = _services.get(user_id)
+    if service is None:
+        service = TimerService(user_id)
+        _services[user_id] = service
+    return service
+
+def release_timer_service(user_id):
+    """Encerra o timer compartilhado do usuário (ex.: ao fazer logout)."""
+    service = _services.pop(user_id, None)
+    if service is not None:
+        service.shutdown()
+        service.deleteLater()
@@ -2,10 +2,16 @@ from PySide6.QtWidgets import *
 from PySide6.QtCore import *
 from PySide6.QtGui import *
 from datetime import datetime, timedelta
+from src.gui.timer_service import get_timer_service
 import math
 
 class CircularProgressBar(QWidget):
-    """Widget de progresso circular para o timer."""
+    """Widget de progresso circular para o timer.
+    
+    O anel de fundo fica em um QPixmap, refeito só ao redimensionar ou
+    mudar o tema. Cada mudança de valor repinta apenas o trecho do arco
+    que mudou e o texto; enquanto o widget está encoberto nada é repintado.
+    """
     
     def __init__(self, parent=None):
         super().__init__(parent)
@@ -18,44 +24,135 @@ class CircularProgressBar(QWidget):
         self.progress_color = QColor("#4169E1")  # Azul royal
         self.bg_color = QColor(50, 50, 50, 100)
         self.progress_width = 15
+        self._time_text = ""
+        self._background = None
+        self._needs_repaint = False
         self.setMinimumSize(200, 200)
     
+    @property
+    def time_text(self):
+        return self._time_text
+    
+    @time_text.setter
+    def time_text(self, text):
+        if text != self._time_text:
+            self._time_text = text
+            self.request_update(self.text_rect())
+    
     def set_value(self, value):
-        self.value = max(self.min_value, min(self.max_value, value))
-        self.update()
+        value = max(self.min_value, min(self.max_value, value))
+        if value == self.value:
+            return
+        old_angle = self.angle_for(self.value)
+        self.value = value
+        self.request_update(self.arc_rect(old_angle, self.angle_for(value)))
         
     def set_progress_color(self, color):
         self.progress_color = color
-        self.update()
+        self.request_update(self.arc_rect(0, self.angle_for(self.value)))
     
-    def paintEvent(self, event):
-        width = self.width()
-        height = self.height()
+    def angle_for(self, value):
+        return value * 360 / (self.max_value - self.min_value)
+    
+    def ring_geometry(self):
+        """Retorna (margem, diâmetro) do anel."""
         margin = self.progress_width / 2
-        size = min(width, height) - 2 * margin
-        
+        size = min(self.width(), self.height()) - 2 * margin
+        return margin, size
+    
+    def arc_rect(self, start_angle, end_angle):
+        """Retângulo que cobre o arco entre dois ângulos (em graus, sentido horário)."""
+        margin, size = self.ring_geometry()
+        radius = size / 2
+        center = QPointF(margin + radius, margin + radius)
+        low, high = sorted((start_angle, end_angle))
+        
+        # Pontos extremos do trecho: as pontas e os quadrantes cruzados
+        angles = [low, high] + [a for a in (0, 90, 180, 270, 360) if low < a < high]
+        points = [
+            center + QPointF(radius * math.sin(math.radians(a)), -radius * math.cos(math.radians(a)))
+            for a in angles
+        ]
+        rect = QRectF(points[0], points[0])
+        for point in points[1:]:
+            rect = rect.united(QRectF(point, point))
+        pad = self.progress_width
+        return rect.adjusted(-pad, -pad, pad, pad).toAlignedRect()
+    
+    def text_rect(self):
+        """Área ocupada pelo texto central."""
+        metrics = QFontMetrics(self.font)
+        width = metrics.horizontalAdvance("000:00") + 8
+        height = metrics.height() + 4
+        return QRect(
+            (self.width() - width) // 2, (self.height() - height) // 2, width, height
+        )
+    
+    def request_update(self, rect):
+        """Repinta só ``rect``, ou adia a pintura se o widget estiver encoberto."""
+        if not self.isVisible() or self.visibleRegion().isEmpty():
+            self._needs_repaint = True
+            return
+        self.update(rect)
+    
+    def background(self):
+        """Pixmap com o anel de fundo, refeito só quando invalidado."""
+        ratio = self.devicePixelRatioF()
+        if self._background is None or self._background.size() != self.size() * ratio:
+            pixmap = QPixmap(self.size() * ratio)
+            pixmap.setDevicePixelRatio(ratio)
+            pixmap.fill(Qt.transparent)
+            
+            painter = QPainter(pixmap)
+            painter.setRenderHint(QPainter.Antialiasing)
+            margin, size = self.ring_geometry()
+            pen = QPen()
+            pen.setWidth(self.progress_width)
+            pen.setColor(self.bg_color)
+            painter.setPen(pen)
+            painter.drawEllipse(QRectF(margin, margin, size, size))
+            painter.end()
+            self._background = pixmap
+        return self._background
+    
+    def resizeEvent(self, event):
+        self._background = None
+        super().resizeEvent(event)
+    
+    def changeEvent(self, event):
+        if event.type() in (QEvent.PaletteChange, QEvent.StyleChange):
+            self._background = None
+            self.update()
+        super().changeEvent(event)
+    
+    def showEvent(self, event):
+        if self._needs_repaint:
+            self._needs_repaint = False
+            self.update()
+        super().showEvent(event)
+    
+    def paintEvent(self, event):
         painter = QPainter(self)
         painter.setRenderHint(QPainter.Antialiasing)
         
-        # Desenhar círculo de fundo
+        # Fundo em cache
+        painter.drawPixmap(0, 0, self.background())
+        
+        # Desenhar arco de progresso (o clip do evento limita ao trecho alterado)
+        margin, size = self.ring_geometry()
+        angle = self.angle_for(self.value)
         pen = QPen()
         pen.setWidth(self.progress_width)
-        pen.setColor(self.bg_color)
-        painter.setPen(pen)
-        painter.drawEllipse(margin, margin, size, size)
-        
-        # Calcular progresso
-        angle = self.value * 360 / (self.max_value - self.min_value)
-        
-        # Desenhar arco de progresso
         pen.setColor(self.progress_color)
         painter.setPen(pen)
-        painter.drawArc(margin, margin, size, size, 90 * 16, -angle * 16)
+        painter.drawArc(QRectF(margin, margin, size, size), 90 * 16, int(-angle * 16))
         
         # Desenhar valor
-        painter.setPen(self.text_color)
-        painter.setFont(self.font)
-        painter.drawText(0, 0, width, height, Qt.AlignCenter, self.time_text)
+        text_rect = self.text_rect()
+        if event.rect().intersects(text_rect):
+            painter.setPen(self.text_color)
+            painter.setFont(self.font)
+            painter.drawText(text_rect, Qt.AlignCenter, self.time_text)
 
 class AdvancedTimerWidget(QWidget):
     """Widget de cronômetro avançado com estimativa de término e recursos visuais."""
@@ -66,26 +163,24 @@ class AdvancedTimerWidget(QWidget):
         super().__init__(parent)
         self.user_id = user_id
         self.setup_ui()
-        self.timer = QTimer(self)
-        self.timer.timeout.connect(self.update_timer)
-        self.time_remaining = 0
-        self.total_time = 0
-        self.completion_time = None
-        self.pomodoro_count = 0
-        self.mode = "work"  # work, break, long_break
-        
-        # Configurações padrão
-        self.work_time = 25 * 60  # 25 minutos em segundos
-        self.break_time = 5 * 60  # 5 minutos em segundos
-        self.long_break_time = 15 * 60  # 15 minutos em segundos
-        self.long_break_interval = 4  # A cada 4 pomodoros
+        
+        # Timer compartilhado: todas as views do usuário observam o mesmo serviço
+        self.service = get_timer_service(user_id)
+        self.service.tick.connect(self.update_timer)
+        self.service.phaseChanged.connect(self.show_phase)
+        self.service.runningChanged.connect(self.show_running)
+        self.service.countChanged.connect(self.show_count)
+        self.service.timerFinished.connect(self.timerFinished)
+        self.service.watch(self)
         
         # Carregar configurações do usuário
         self.load_settings()
         
-        # Inicializar timer para iniciar com modo "work"
-        self.reset_timer()
-    
+        # Exibir o estado atual do serviço
+        self.show_phase(self.service.mode)
+        self.show_count(self.service.pomodoro_count)
+        self.show_running(self.service.is_running)
+        
     def setup_ui(self):
         """Configura a interface do widget."""
         main_layout = QVBoxLayout(self)
@@ -249,99 +344,63 @@ class AdvancedTimerWidget(QWidget):
     
     def toggle_timer(self):
         """Inicia ou pausa o timer."""
-        if self.timer.isActive():
-            self.timer.stop()
-            self.start_btn.setText("Retomar")
-            self.eta_label.setText("Pausa - Término estimado: --:--")
-        else:
-            self.timer.start(1000)  # Atualizar a cada segundo
+        self.service.toggle()
+    
+    def show_running(self, running):
+        """Atualiza botão e estimativa quando o timer inicia ou pausa."""
+        if running:
             self.start_btn.setText("Pausar")
             
             # Atualizar estimativa de término
             self.update_eta()
+        elif self.service.progress() > 0:
+            self.start_btn.setText("Retomar")
+            self.eta_label.setText("Pausa - Término estimado: --:--")
+        else:
+            self.start_btn.setText("Iniciar")
+            self.eta_label.setText("Término estimado: --:--")
     
-    def update_timer(self):
-        """Atualiza o timer a cada segundo."""
-        self.time_remaining -= 1
-        
+    @property
+    def time_remaining(self):
+        return self.service.remaining_seconds()
+    
+    def update_timer(self, remaining):
+        """Atualiza a tela quando o segundo exibido muda."""
         # Atualizar progresso visual
-        progress = 100 - (self.time_remaining * 100 / self.total_time)
+        progress = self.service.progress() * 100
         self.progress_bar.set_value(progress)
         
         # Formatar e exibir tempo restante
-        minutes = self.time_remaining // 60
-        seconds = self.time_remaining % 60
+        minutes = remaining // 60
+        seconds = remaining % 60
         time_text = f"{minutes:02d}:{seconds:02d}"
         self.progress_bar.time_text = time_text
-        self.progress_bar.update()
-        
-        # Verificar se o timer acabou
-        if self.time_remaining <= 0:
-            self.timer.stop()
-            self.timer_completed()
     
-    def reset_timer(self):
-        """Reseta o timer para os valores iniciais com base no modo atual."""
-        self.timer.stop()
-        
-        if self.mode == "work":
-            self.time_remaining = self.work_time
-            self.total_time = self.work_time
-            self.mode_label.setText("Pomodoro")
+    def show_phase(self, mode):
+        """Ajusta título e cor ao modo atual (work, break, long_break)."""
+        self.mode_label.setText(self.service.PHASE_LABELS[mode])
+        if mode == "work":
             self.progress_bar.set_progress_color(QColor("#4169E1"))  # Azul
-        elif self.mode == "break":
-            self.time_remaining = self.break_time
-            self.total_time = self.break_time
-            self.mode_label.setText("Pausa Curta")
+        elif mode == "break":
             self.progress_bar.set_progress_color(QColor("#43b581"))  # Verde
         else:  # long_break
-            self.time_remaining = self.long_break_time
-            self.total_time = self.long_break_time
-            self.mode_label.setText("Pausa Longa")
             self.progress_bar.set_progress_color(QColor("#7289da"))  # Lilás
-        
-        # Atualizar interface
-        minutes = self.time_remaining // 60
-        seconds = self.time_remaining % 60
-        time_text = f"{minutes:02d}:{seconds:02d}"
-        self.progress_bar.time_text = time_text
-        self.progress_bar.set_value(0)
-        self.progress_bar.update()
-        
-        self.start_btn.setText("Iniciar")
-        self.eta_label.setText("Término estimado: --:--")
+        self.update_timer(self.service.remaining_seconds())
+    
+    def show_count(self, count):
+        self.pomodoro_display.setText(str(count))
+    
+    def reset_timer(self):
+        """Reseta o timer para o início do modo atual."""
+        self.service.reset()
     
     def skip_timer(self):
         """Pula o timer atual e passa para o próximo estado."""
-        self.timer.stop()
-        self.timer_completed()
-    
-    def timer_completed(self):
-        """Processa o término do timer e configura o próximo."""
-        # Emitir sinal de término
-        self.timerFinished.emit(self.mode)
-        
-        # Se era um ciclo de trabalho, incrementar contador de pomodoros
-        if self.mode == "work":
-            self.pomodoro_count += 1
-            self.pomodoro_display.setText(str(self.pomodoro_count))
-            
-            # Decidir qual pausa vem a seguir
-            if self.pomodoro_count % self.long_break_interval == 0:
-                self.mode = "long_break"
-            else:
-                self.mode = "break"
-        else:
-            # Se era uma pausa, voltar para o modo de trabalho
-            self.mode = "work"
-        
-        # Resetar e iniciar automaticamente o próximo timer
-        self.reset_timer()
-        self.toggle_timer()
+        self.service.skip()
     
     def update_eta(self):
         """Atualiza a estimativa de término."""
-        if not self.timer.isActive():
+        if not self.service.is_running:
             return
             
         current_time = datetime.now()
@@ -349,32 +408,24 @@ class AdvancedTimerWidget(QWidget):
         self.eta_label.setText(f"Término estimado: {eta.strftime('%H:%M')}")
     
     def load_settings(self):
-        """Carrega as configurações do timer para o usuário atual."""
-        # Aqui você pode implementar a lógica para carregar configurações 
-        # personalizadas do banco de dados
-        
-        # Por enquanto, vamos usar as configurações padrão
-        self.work_time_input.setValue(self.work_time // 60)
-        self.break_time_input.setValue(self.break_time // 60)
-        self.long_break_time_input.setValue(self.long_break_time // 60)
-        self.long_break_interval_input.setValue(self.long_break_interval)
+        """Carrega as configurações do timer do usuário atual."""
+        self.work_time_input.setValue(self.service.phase_duration("work") // 60)
+        self.break_time_input.setValue(self.service.phase_duration("break") // 60)
+        self.long_break_time_input.setValue(self.service.phase_duration("long_break") // 60)
+        self.long_break_interval_input.setValue(self.service.long_break_interval)
     
     def save_settings(self):
         """Salva as configurações do timer."""
-        # Atualizar configurações
-        self.work_time = self.work_time_input.value() * 60
-        self.break_time = self.break_time_input.value() * 60
-        self.long_break_time = self.long_break_time_input.value() * 60
-        self.long_break_interval = self.long_break_interval_input.value()
-        
-        # Resetar timer com novas configurações
-        self.reset_timer()
+        self.service.update_config(
+            work_time=self.work_time_input.value(),
+            break_time=self.break_time_input.value(),
+            long_break_time=self.long_break_time_input.value(),
+            long_break_interval=self.long_break_interval_input.value()
+        )
+        self.update_timer(self.service.remaining_seconds())
         
         # Mostrar confirmação
         QMessageBox.information(
             self, "Configurações Salvas",
             "As configurações do timer foram atualizadas."
         )
-        
-        # Aqui você pode implementar a lógica para salvar as configurações 
-        # no banco de dados para o usuário atual 
\ No newline at end of file
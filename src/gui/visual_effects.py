@@ -1,34 +1,221 @@
 from PySide6.QtWidgets import *
 from PySide6.QtCore import *
 from PySide6.QtGui import *
-import random
-import math
-import time
+import logging
+from src.gui.particles import ParticleWidget
+from src.gui.frame_driver import get_governor
 
 class AnimatedTabWidget(QTabWidget):
-    """TabWidget com transições animadas entre abas."""
+    """TabWidget com transições animadas entre abas.
+    
+    Abas adicionadas com ``add_lazy_tab`` começam como um placeholder e só
+    constroem o conteúdo (pela factory) na primeira vez em que são
+    exibidas, ou antes, em um momento ocioso, se marcadas para prefetch.
+    """
+    
+    # Intervalo entre as construções antecipadas, para não travar a interface
+    PREFETCH_INTERVAL_MS = 200
     
     def __init__(self, parent=None):
         super().__init__(parent)
         self.current_index = 0
-        self.animation = QPropertyAnimation(self, b"windowOpacity")
-        self.animation.setDuration(300)
+        self.fade = None  # (página, inscrição no relógio de quadros)
+        self.logger = logging.getLogger('animated_tab_widget')
         
+        # placeholder -> (factory, prefetch)
+        self._factories = {}
+        
+        self.currentChanged.connect(self.ensure_built)
         self.currentChanged.connect(self.animate_tab_change)
+    
+    def add_lazy_tab(self, factory, label: str, prefetch: bool = False) -> int:
+        """Adiciona uma aba cujo conteúdo é criado por ``factory()`` sob demanda."""
+        placeholder = QWidget()
+        layout = QVBoxLayout(placeholder)
+        layout.setContentsMargins(0, 0, 0, 0)
+        
+        loading = QLabel("Carregando...")
+        loading.setAlignment(Qt.AlignCenter)
+        layout.addWidget(loading)
+        
+        self._factories[placeholder] = (factory, prefetch)
+        return self.addTab(placeholder, label)
+    
+    def ensure_built(self, index: int):
+        """Constrói o conteúdo da aba, se ainda for um placeholder."""
+        placeholder = self.widget(index)
+        entry = self._factories.pop(placeholder, None)
+        if entry is None:
+            return
         
+        factory, _ = entry
+        layout = placeholder.layout()
+        while layout.count():
+            item = layout.takeAt(0)
+            if item.widget():
+                item.widget().deleteLater()
+        
+        try:
+            layout.addWidget(factory())
+        except Exception as e:
+            self.logger.error(f"Erro ao criar a aba '{self.tabText(index)}': {e}")
+            error = QLabel(f"Não foi possível carregar esta aba.\n{e}")
+            error.setAlignment(Qt.AlignCenter)
+            layout.addWidget(error)
+    
+    def start_prefetch(self, delay_ms: int = 0):
+        """Constrói as abas marcadas para prefetch, uma por vez, com a interface ociosa."""
+        QTimer.singleShot(delay_ms, self._prefetch_next)
+    
+    def _prefetch_next(self):
+        for index in range(self.count()):
+            entry = self._factories.get(self.widget(index))
+            if entry and entry[1]:
+                self.ensure_built(index)
+                QTimer.singleShot(self.PREFETCH_INTERVAL_MS, self._prefetch_next)
+                return
+        
+    # Duração do fade-in da aba recém-selecionada
+    FADE_SECONDS = 0.3
+    
     def animate_tab_change(self, index):
-        """Anima a troca de aba."""
+        """Anima a troca de aba com um fade-in da nova página."""
+        self._end_fade()
+        page = self.widget(index)
+        if page is None:
+            return
+        
+        effect = QGraphicsOpacityEffect(page)
+        effect.setOpacity(0.3)
+        page.setGraphicsEffect(effect)
+        progress = {'elapsed': 0.0}
+        
+        def step(dt):
+            progress['elapsed'] += dt
+            t = min(1.0, progress['elapsed'] / self.FADE_SECONDS)
+            # OutCubic
+            effect.setOpacity(0.3 + 0.7 * (1 - (1 - t) ** 3))
+            if t >= 1.0:
+                self._end_fade()
+                return False
+            return True
+        
+        subscription = get_governor().subscribe('tab_fade', step, visible=self.isVisible)
+        self.fade = (page, subscription)
+    
+    def _end_fade(self):
+        """Remove o efeito de opacidade (custoso se deixado na página)."""
+        if self.fade is None:
+            return
+        page, subscription = self.fade
+        self.fade = None
+        get_governor().unsubscribe(subscription)
+        page.setGraphicsEffect(None)
+        
+class Toast(QFrame):
+    """Notificação flutuante reutilizável (criada uma vez e reciclada pelo pool)."""
+    
+    WIDTH = 300
+    HEIGHT = 100
+    MARGIN = 20
+    
+    released = Signal(object)
+    
+    def __init__(self, parent):
+        super().__init__(parent)
+        self.setObjectName("notification")
+        self.setFixedWidth(self.WIDTH)
+        self.slot = 0
+        self.key = None
+        self.count = 0
+        self.closing = False
+        
+        # Layout
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(15, 15, 15, 15)
+        
+        # Título
+        self.title_label = QLabel()
+        self.title_label.setObjectName("notificationTitle")
+        layout.addWidget(self.title_label)
+        
+        # Mensagem
+        self.message_label = QLabel()
+        self.message_label.setWordWrap(True)
+        self.message_label.setObjectName("notificationMessage")
+        layout.addWidget(self.message_label)
+        
+        # Animação e timer de exibição reaproveitados entre as notificações
+        self.animation = QPropertyAnimation(self, b"geometry", self)
+        self.animation.setDuration(300)
+        self.animation.finished.connect(self._on_animation_finished)
+        self.hide_timer = QTimer(self)
+        self.hide_timer.setSingleShot(True)
+        self.hide_timer.timeout.connect(self.dismiss)
+        self.hide()
+    
+    def _rect(self, visible: bool) -> QRect:
+        width = self.parent().width()
+        x = width - self.WIDTH - self.MARGIN if visible else width
+        y = self.MARGIN + self.slot * (self.HEIGHT + 10)
+        return QRect(x, y, self.WIDTH, self.HEIGHT)
+    
+    def present(self, key, title, message, count, slot, duration_ms):
+        """Exibe o conteúdo com a animação de entrada."""
+        self.key = key
+        self.slot = slot
+        self.closing = False
+        self.set_content(title, message, count)
+        
+        self.setGeometry(self._rect(False))
+        self.show()
+        self.raise_()
         self.animation.stop()
-        self.animation.setStartValue(0.3)
-        self.animation.setEndValue(1.0)
+        self.animation.setStartValue(self._rect(False))
+        self.animation.setEndValue(self._rect(True))
+        self.animation.setEasingCurve(QEasingCurve.OutCubic)
         self.animation.start()
-        
+        self.hide_timer.start(duration_ms)
+    
+    def set_content(self, title, message, count):
+        self.count = count
+        self.title_label.setText(f"{title} (x{count})" if count > 1 else title)
+        self.message_label.setText(message)
+    
+    def extend(self, title, message, count, duration_ms):
+        """Uma notificação repetida apenas atualiza o contador e o tempo de exibição."""
+        self.set_content(title, message, count)
+        self.hide_timer.start(duration_ms)
+    
+    def dismiss(self):
+        """Animação de saída; ao terminar o toast volta ao pool."""
+        self.closing = True
+        self.hide_timer.stop()
+        self.animation.stop()
+        self.animation.setStartValue(self.geometry())
+        self.animation.setEndValue(self._rect(False))
+        self.animation.setEasingCurve(QEasingCurve.InCubic)
+        self.animation.start()
+    
+    def _on_animation_finished(self):
+        if self.closing:
+            self.hide()
+            self.key = None
+            self.released.emit(self)
+
 class SimpleEffects:
     """Classe para efeitos visuais e notificações."""
     
+    # Toasts pré-construídos por janela; exibidos empilhados
+    TOAST_POOL_SIZE = 3
+    TOAST_DURATION_MS = 5000
+    # Pendências acima disso viram uma única notificação de resumo
+    SUMMARY_THRESHOLD = 3
+    
     def __init__(self):
         self.notification_queue = []
-        self.current_notification = None
+        self.toast_pools = {}
+        self.logger = logging.getLogger('simple_effects')
         
     def show_level_up(self, parent, level):
         """Mostra animação de level up com confete."""
@@ -104,270 +291,106 @@ class SimpleEffects:
         confetti = ConfettiEffect(parent)
         confetti.show()
         
+    def show_notification(self, parent, title, message, icon="info"):
+        """Mostra uma notificação flutuante (enfileirada e agrupada com repetidas)."""
+        self.queue_notification(parent, title, message, icon)
+    
     def queue_notification(self, parent, title, message, icon="info"):
-        """Adiciona uma notificação à fila."""
+        """Adiciona uma notificação à fila, agrupando as repetidas."""
+        key = (title, message)
+        
+        # Repetição de uma notificação já exibida: só atualiza o contador
+        for toast in self._pool(parent):
+            if toast.isVisible() and not toast.closing and toast.key == key:
+                toast.extend(title, message, toast.count + 1, self.TOAST_DURATION_MS)
+                return
+        
+        # Repetição de uma pendente: soma na mesma entrada
+        for notif in self.notification_queue:
+            if notif["parent"] is parent and (notif["title"], notif["message"]) == key:
+                notif["count"] += 1
+                return
+        
         self.notification_queue.append({
             "parent": parent,
             "title": title,
             "message": message,
-            "icon": icon
+            "icon": icon,
+            "count": 1
         })
-        
-        if not self.current_notification:
-            self._show_next_notification()
+        self._show_next_notification()
+    
+    def _pool(self, parent):
+        """Toasts da janela ``parent``, criados na primeira notificação."""
+        pool = self.toast_pools.get(parent)
+        if pool is None:
+            pool = []
+            for _ in range(self.TOAST_POOL_SIZE):
+                toast = Toast(parent)
+                toast.released.connect(lambda _: self._show_next_notification())
+                pool.append(toast)
+            self.toast_pools[parent] = pool
+            parent.destroyed.connect(lambda *_: self._forget_parent(parent))
+        return pool
+    
+    def _forget_parent(self, parent):
+        """Descarta os toasts e as notificações pendentes de uma janela destruída."""
+        self.toast_pools.pop(parent, None)
+        # Sem isso, _show_next_notification recriaria toasts em um widget já destruído
+        self.notification_queue = [
+            notif for notif in self.notification_queue if notif["parent"] is not parent
+        ]
+        self._show_next_notification()
     
     def _show_next_notification(self):
-        """Mostra a próxima notificação na fila."""
-        if not self.notification_queue:
-            self.current_notification = None
-            return
+        """Ocupa os toasts livres com as próximas notificações da fila."""
+        while self.notification_queue:
+            parent = self.notification_queue[0]["parent"]
+            pool = self._pool(parent)
+            busy = {toast.slot for toast in pool if toast.isVisible()}
+            free = [toast for toast in pool if not toast.isVisible()]
+            if not free:
+                return
             
-        notif = self.notification_queue.pop(0)
-        self.current_notification = self._create_notification(
-            notif["parent"],
-            notif["title"],
-            notif["message"],
-            notif["icon"]
-        )
-        
-    def _create_notification(self, parent, title, message, icon):
-        """Cria e mostra uma notificação flutuante."""
-        notif = QFrame(parent)
-        notif.setObjectName("notification")
-        notif.setFixedWidth(300)
-        
-        # Configurar notificação para ficar em cima da janela principal
-        parent_geometry = parent.geometry()
-        notif.setGeometry(
-            parent_geometry.width() - 320,
-            20,
-            300,
-            100
-        )
-        
-        # Layout
-        layout = QVBoxLayout(notif)
-        layout.setContentsMargins(15, 15, 15, 15)
-        
-        # Título
-        title_label = QLabel(title)
-        title_label.setObjectName("notificationTitle")
-        layout.addWidget(title_label)
-        
-        # Mensagem
-        message_label = QLabel(message)
-        message_label.setWordWrap(True)
-        message_label.setObjectName("notificationMessage")
-        layout.addWidget(message_label)
-        
-        # Mostrar notificação
-        notif.show()
-        
-        # Animação de entrada
-        animation = QPropertyAnimation(notif, b"geometry")
-        animation.setDuration(300)
-        start_rect = QRect(
-            parent_geometry.width(),
-            20,
-            300,
-            100
-        )
-        end_rect = QRect(
-            parent_geometry.width() - 320,
-            20,
-            300,
-            100
-        )
-        animation.setStartValue(start_rect)
-        animation.setEndValue(end_rect)
-        animation.setEasingCurve(QEasingCurve.OutCubic)
-        animation.start()
-        
-        # Timer para remover a notificação
-        QTimer.singleShot(5000, lambda: self._remove_notification(notif))
-        
-        return notif
-        
-    def _remove_notification(self, notif):
-        """Remove uma notificação com animação."""
-        parent_geometry = notif.parent().geometry()
-        
-        animation = QPropertyAnimation(notif, b"geometry")
-        animation.setDuration(300)
-        start_rect = notif.geometry()
-        end_rect = QRect(
-            parent_geometry.width(),
-            20,
-            300,
-            100
-        )
-        animation.setStartValue(start_rect)
-        animation.setEndValue(end_rect)
-        animation.setEasingCurve(QEasingCurve.InCubic)
-        animation.finished.connect(lambda: self._cleanup_notification(notif))
-        animation.start()
-        
-    def _cleanup_notification(self, notif):
-        """Limpa a notificação e mostra a próxima."""
-        notif.deleteLater()
-        self.current_notification = None
-        QTimer.singleShot(300, self._show_next_notification)
-
-class ConfettiWidget(QWidget):
+            pending = [n for n in self.notification_queue if n["parent"] is parent]
+            if len(pending) > self.SUMMARY_THRESHOLD:
+                # Rajada: juntar todas as pendências desta janela em um resumo
+                self.notification_queue = [n for n in self.notification_queue if n["parent"] is not parent]
+                total = sum(n["count"] for n in pending)
+                titles = list(dict.fromkeys(n["title"] for n in pending))
+                notif = {
+                    "title": f"{total} notificações",
+                    "message": ", ".join(titles[:4]) + ("..." if len(titles) > 4 else ""),
+                    "count": 1
+                }
+            else:
+                notif = self.notification_queue.pop(0)
+            
+            slot = min(set(range(self.TOAST_POOL_SIZE)) - busy)
+            free[0].present(
+                (notif["title"], notif["message"]), notif["title"], notif["message"],
+                notif["count"], slot, self.TOAST_DURATION_MS
+            )
+    
+class ConfettiWidget(ParticleWidget):
     """Widget que exibe confetes caindo."""
     
     def __init__(self, parent=None):
-        super().__init__(parent)
+        super().__init__(parent, count=100, duration=5)
         self.parent = parent
         self.setGeometry(0, 0, parent.width(), parent.height())
-        
-        # Definir cores dos confetes
-        self.colors = [
-            QColor(255, 0, 0),    # Vermelho
-            QColor(0, 255, 0),    # Verde
-            QColor(0, 0, 255),    # Azul
-            QColor(255, 255, 0),  # Amarelo
-            QColor(255, 0, 255),  # Magenta
-            QColor(0, 255, 255),  # Ciano
-            QColor(255, 165, 0),  # Laranja
-            QColor(128, 0, 128)   # Roxo
-        ]
-        
-        # Inicializar confetes
-        self.confetti = []
-        self.timer = QTimer(self)
-        self.timer.timeout.connect(self.update_confetti)
-        
-        # Tornar o widget transparente
-        self.setAttribute(Qt.WA_TransparentForMouseEvents)
-        self.setAttribute(Qt.WA_NoSystemBackground)
-        self.setAttribute(Qt.WA_TranslucentBackground)
-        
-    def start(self):
-        """Inicia a animação de confetes."""
-        for _ in range(100):
-            self.confetti.append({
-                'x': random.randint(0, self.width()),
-                'y': random.randint(-50, 0),
-                'speed': random.uniform(1, 5),
-                'size': random.randint(5, 15),
-                'color': random.choice(self.colors),
-                'angle': random.uniform(0, 360),
-                'rotation_speed': random.uniform(-5, 5)
-            })
-        
-        self.timer.start(30)  # Atualizar a cada 30ms
-        
-    def update_confetti(self):
-        """Atualiza a posição dos confetes."""
-        for conf in self.confetti:
-            conf['y'] += conf['speed']
-            conf['x'] += math.sin(conf['angle'] * math.pi / 180) * 2
-            conf['angle'] += conf['rotation_speed']
-            
-            # Resetar confetes que saíram da tela
-            if conf['y'] > self.height():
-                conf['y'] = random.randint(-50, 0)
-                conf['x'] = random.randint(0, self.width())
-        
-        self.update()
-        
-        # Parar a animação após 5 segundos
-        if not hasattr(self, 'start_time'):
-            self.start_time = time.time()
-        elif time.time() - self.start_time > 5:
-            self.timer.stop()
-            self.hide()
-            
-    def paintEvent(self, event):
-        """Desenha os confetes na tela."""
-        painter = QPainter(self)
-        painter.setRenderHint(QPainter.Antialiasing)
-        
-        for conf in self.confetti:
-            painter.save()
-            painter.translate(conf['x'], conf['y'])
-            painter.rotate(conf['angle'])
-            painter.setBrush(conf['color'])
-            painter.setPen(Qt.NoPen)
-            painter.drawRect(-conf['size'] / 2, -conf['size'] / 2, conf['size'], conf['size'] / 2)
-            painter.restore()
 
-class ConfettiEffect(QWidget):
+class ConfettiEffect(ParticleWidget):
     """Efeito de confete para celebrações."""
     
     def __init__(self, parent=None):
-        super().__init__(parent)
+        super().__init__(parent, count=100, duration=3)
         self.setGeometry(0, 0, parent.width() if parent else 400, parent.height() if parent else 300)
         
-        # Definir cores dos confetes
-        self.colors = [
-            QColor(255, 0, 0),    # Vermelho
-            QColor(0, 255, 0),    # Verde
-            QColor(0, 0, 255),    # Azul
-            QColor(255, 255, 0),  # Amarelo
-            QColor(255, 0, 255),  # Magenta
-            QColor(0, 255, 255),  # Ciano
-            QColor(255, 165, 0),  # Laranja
-            QColor(128, 0, 128)   # Roxo
-        ]
-        
-        # Inicializar confetes
-        self.confetti = []
-        for _ in range(100):
-            self.confetti.append({
-                'x': random.randint(0, self.width()),
-                'y': random.randint(-50, 0),
-                'speed': random.uniform(1, 5),
-                'size': random.randint(5, 15),
-                'color': random.choice(self.colors),
-                'angle': random.uniform(0, 360),
-                'rotation_speed': random.uniform(-5, 5)
-            })
-        
-        # Configurar timer para atualização
-        self.timer = QTimer(self)
-        self.timer.timeout.connect(self.update_confetti)
-        self.timer.start(30)
-        
         # Configurações da janela
-        self.setAttribute(Qt.WA_TransparentForMouseEvents)
-        self.setAttribute(Qt.WA_NoSystemBackground)
-        self.setAttribute(Qt.WA_TranslucentBackground)
         self.setWindowFlags(Qt.FramelessWindowHint | Qt.Window | Qt.WindowStaysOnTopHint)
-        
-        # Tempo de início para calcular duração
-        self.start_time = time.time()
-        
-    def update_confetti(self):
-        """Atualiza a posição dos confetes."""
-        for conf in self.confetti:
-            conf['y'] += conf['speed']
-            conf['x'] += math.sin(conf['angle'] * math.pi / 180) * 2
-            conf['angle'] += conf['rotation_speed']
-            
-            # Resetar confetes que saírem da tela
-            if conf['y'] > self.height():
-                conf['y'] = random.randint(-50, 0)
-                conf['x'] = random.randint(0, self.width())
-        
-        self.update()
-        
-        # Encerrar após 3 segundos
-        if time.time() - self.start_time > 3:
-            self.timer.stop()
-            self.close()
-            
-    def paintEvent(self, event):
-        """Desenha os confetes na tela."""
-        painter = QPainter(self)
-        painter.setRenderHint(QPainter.Antialiasing)
-        
-        for conf in self.confetti:
-            painter.save()
-            painter.translate(conf['x'], conf['y'])
-            painter.rotate(conf['angle'])
-            painter.setBrush(conf['color'])
-            painter.setPen(Qt.NoPen)
-            painter.drawRect(-conf['size'] / 2, -conf['size'] / 2, conf['size'], conf['size'] / 2)
-            painter.restore() 
\ No newline at end of file
+        self.start()
+    
+    def finished(self):
+        """Encerra a janela do efeito."""
+        self.close()
@@ -1,39 +1,71 @@
 import sys
-from PySide6.QtWidgets import QApplication
-from src.gui.login import LoginWindow
-from src.gui.main_window import MainWindow
-from src.database.database import init_db, get_data_dir
-from src.services.session_manager import SessionManager
 import os
+import json
 from datetime import datetime
-from src.database.migrate import migrate_database
+from src.utils.startup import StartupTimer
+
+# Cronômetro da inicialização (inclui as importações abaixo)
+startup = StartupTimer()
+
+with startup.phase('imports'):
+    from PySide6.QtWidgets import QApplication
+    from PySide6.QtCore import QTimer
+    from src.gui.login import LoginWindow
+    from src.gui.main_window import MainWindow
+    from src.database.database import init_db, get_data_dir
+    from src.database.maintenance import get_scheduler
+    from src.services.session_manager import SessionManager
+    from src.services.backup_service import BackupService
+    from src.config.settings import BACKUP, MAINTENANCE
+    from src.utils import password_hasher
 
 def main():
+    # Com --measure-startup a aplicação fecha após exibir a primeira janela
+    measure = '--measure-startup' in sys.argv
+    
     try:
-        # Garantir que o diretório de dados existe
-        data_dir = get_data_dir()
-        os.makedirs(data_dir, exist_ok=True)
+        # Inicializar banco de dados (migrações e dados iniciais só na primeira execução)
+        with startup.phase('database'):
+            init_db()
+        
+        # Calibrar o custo do bcrypt (só na primeira execução; o resultado fica salvo)
+        with startup.phase('password_hasher'):
+            password_hasher.get_rounds()
         
-        # Inicializar banco de dados e realizar migrações
-        init_db()
-        migrate_database()
+        # Cópias de segurança e manutenção do banco em segundo plano
+        with startup.phase('background_services'):
+            if BACKUP['enabled']:
+                BackupService().start()
+            if MAINTENANCE['enabled']:
+                get_scheduler().start()
         
         # Iniciar aplicação
-        app = QApplication(sys.argv)
+        with startup.phase('qt_app'):
+            app = QApplication(sys.argv)
+            app.setStyle('Fusion')
         
         # Verificar sessão existente
-        session_manager = SessionManager()
-        user_id = session_manager.get_active_session()
+        with startup.phase('session_restore'):
+            user_id = SessionManager().get_active_session()
         
-        if user_id:
-            # Se existe sessão válida, abrir direto a janela principal
-            window = MainWindow(user_id)
+        with startup.phase('first_window'):
+            if user_id:
+                # Se existe sessão válida, abrir direto a janela principal
+                window = MainWindow(user_id)
+            else:
+                # Se não existe sessão, mostrar login
+                window = LoginWindow()
             window.show()
-        else:
-            # Se não existe sessão, mostrar login
-            login = LoginWindow()
-            login.show()
-            
+        
+        def on_first_frame():
+            summary = startup.report()
+            if measure:
+                print(json.dumps(summary))
+                app.quit()
+        
+        # Executado quando o loop de eventos processa a primeira janela
+        QTimer.singleShot(0, on_first_frame)
+        
         sys.exit(app.exec())
         
     except Exception as e:
@@ -44,4 +76,4 @@ def main():
         raise e
 
 if __name__ == "__main__":
-    main() 
\ No newline at end of file
+    main() 
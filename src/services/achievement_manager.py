@@ -1,13 +1,13 @@
 from datetime import datetime, timedelta
 from src.database.models import (
-    Achievement, UserAchievement, UserLevel, 
-    AchievementType, StudySession, Task
+    User, Achievement, UserAchievement, UserLevel, 
+    AchievementType, StudySession, Task, PomodoroSession
 )
 from src.database.database import get_session
-from sqlalchemy import and_, func
+from src.database.archive import all_time
+from src.database.write_behind import get_write_queue
+from sqlalchemy import and_, func, cast, Integer
 import math
-from src.services.pomodoro import PomodoroTimer
-from src.services.task_manager import TaskManager
 import logging
 
 class AchievementManager:
@@ -15,7 +15,7 @@ class AchievementManager:
     
     def __init__(self, user_id: int):
         self.user_id = user_id
-        self.session = get_session()
+        self.session = get_session(user_id)
         self.logger = logging.getLogger('achievement_manager')
         self._ensure_user_level()
         self.setup_default_achievements()
@@ -144,6 +144,8 @@ class AchievementManager:
     def check_achievements(self):
         """Verifica todas as conquistas pendentes para o usuário."""
         try:
+            # Roda na thread da interface: em vez de esperar a fila gravar,
+            # soma o que ainda está nela (sessões, tarefas, conquistas)
             user = self.session.query(User).get(self.user_id)
             if not user:
                 return []
@@ -152,7 +154,7 @@ class AchievementManager:
             earned_achievements_ids = [
                 ua.achievement_id for ua in 
                 self.session.query(UserAchievement).filter_by(user_id=self.user_id).all()
-            ]
+            ] + get_write_queue().pending(self.user_id, 'achievement')
             
             pending_achievements = self.session.query(Achievement).filter(
                 ~Achievement.id.in_(earned_achievements_ids) if earned_achievements_ids else True
@@ -169,14 +171,17 @@ class AchievementManager:
                         achievement_id=achievement.id,
                         earned_at=datetime.now()
                     )
-                    self.session.add(user_achievement)
+                    get_write_queue().submit(
+                        lambda session, ua=user_achievement: session.add(ua),
+                        self.user_id,
+                        pending=('achievement', achievement.id)
+                    )
                     
-                    # Conceder XP
-                    self.award_xp(achievement.xp_reward)
+                    # Conceder XP (no mesmo lote da conquista)
+                    self.award_xp_async(achievement.xp_reward)
                     
                     newly_earned.append(achievement)
             
-            self.session.commit()
             return newly_earned
             
         except Exception as e:
@@ -187,38 +192,58 @@ class AchievementManager:
     def check_achievement_completion(self, achievement):
         """Verifica se uma conquista específica foi completada."""
         try:
+            # Os totais incluem o banco de arquivo (registros antigos)
+            pomodoros = all_time(PomodoroSession)
+            completed_pomodoros = and_(
+                pomodoros.c.user_id == self.user_id,
+                pomodoros.c.completed == True
+            )
+            
             if achievement.type == 'pomodoro_count':
                 # Verificar número de pomodoros completos
-                count = self.session.query(PomodoroTimer.completed_sessions).filter_by(
-                    user_id=self.user_id
+                count = self.session.query(func.count()).select_from(pomodoros).filter(
+                    completed_pomodoros
                 ).scalar() or 0
                 
-                return count >= achievement.requirement
+                return count + len(self._pending_pomodoros()) >= achievement.requirement
                 
             elif achievement.type == 'study_time':
                 # Verificar tempo total de estudo (em minutos)
-                total_time = self.session.query(PomodoroTimer.total_study_time).filter_by(
-                    user_id=self.user_id
+                total_time = self.session.query(func.sum(cast(func.round(
+                    (func.julianday(pomodoros.c.end_time) -
+                     func.julianday(pomodoros.c.start_time)) * 1440
+                ), Integer))).select_from(pomodoros).filter(
+                    completed_pomodoros
                 ).scalar() or 0
+                total_time += sum(
+                    round((row['end_time'] - row['start_time']).total_seconds() / 60)
+                    for row in self._pending_pomodoros()
+                )
                 
                 return total_time >= achievement.requirement
                 
             elif achievement.type == 'task_complete':
                 # Verificar número de tarefas completas
-                count = self.session.query(TaskManager.completed_tasks).filter_by(
-                    user_id=self.user_id, 
-                    completed=True
-                ).count()
+                tasks = all_time(Task)
+                count = self.session.query(func.count()).select_from(tasks).filter(
+                    tasks.c.user_id == self.user_id,
+                    tasks.c.completed == True
+                ).scalar() or 0
+                
+                # Conclusões ainda na fila (ignorando as já gravadas)
+                pending = set(get_write_queue().pending(self.user_id, 'task_complete'))
+                if pending:
+                    pending -= {
+                        task_id for task_id, in self.session.query(Task.id).filter(
+                            Task.id.in_(pending), Task.completed == True
+                        )
+                    }
                 
-                return count >= achievement.requirement
+                return count + len(pending) >= achievement.requirement
                 
             elif achievement.type == 'streak_days':
                 # Verificar dias consecutivos de estudo
-                streak = self.session.query(PomodoroTimer.current_streak).filter_by(
-                    user_id=self.user_id
-                ).scalar() or 0
-                
-                return streak >= achievement.requirement
+                return self._current_streak(pomodoros, completed_pomodoros) >= achievement.requirement
             
             return False
             
@@ -226,45 +251,110 @@ class AchievementManager:
             self.logger.error(f"Erro ao verificar conclusão de conquista: {e}")
             return False
     
+    def _pending_pomodoros(self):
+        """Pomodoros completos ainda na fila de gravação (ignorando os já gravados)."""
+        pending = [
+            row for row in get_write_queue().pending(self.user_id, 'pomodoro')
+            if row['completed']
+        ]
+        if not pending:
+            return []
+        saved = {
+            start for start, in self.session.query(PomodoroSession.start_time).filter(
+                PomodoroSession.user_id == self.user_id,
+                PomodoroSession.start_time.in_([row['start_time'] for row in pending])
+            )
+        }
+        return [row for row in pending if row['start_time'] not in saved]
+    
+    def _current_streak(self, pomodoros, condition):
+        """Dias seguidos com pomodoros completos, terminando hoje ou ontem."""
+        day = func.date(pomodoros.c.start_time)
+        days = {
+            value for value, in
+            self.session.query(day).select_from(pomodoros).filter(condition).distinct()
+        }
+        days.update(row['start_time'].date().isoformat() for row in self._pending_pomodoros())
+        
+        current = datetime.now().date()
+        if current.isoformat() not in days:
+            current -= timedelta(days=1)
+        streak = 0
+        while current.isoformat() in days:
+            streak += 1
+            current -= timedelta(days=1)
+        return streak
+    
     def award_xp(self, xp_amount):
-        """Concede XP ao usuário e atualiza seu nível."""
+        """Concede XP ao usuário e atualiza seu nível.
+
+        Retorna ``(subiu_de_nivel, nivel_atual)`` sem esperar a gravação:
+        o resultado é calculado a partir do nível gravado mais o XP que
+        ainda está na fila, como ``apply`` de ``award_xp_async`` fará.
+        """
         try:
+            user_level = self.session.query(UserLevel).filter_by(user_id=self.user_id).first()
+            level = user_level.current_level if user_level else 1
+            xp = user_level.current_xp if user_level else 0
+            for amount in get_write_queue().pending(self.user_id, 'xp'):
+                level, xp = self._add_xp(level, xp, amount)
+            previous_level = level
+            level, xp = self._add_xp(level, xp, xp_amount)
+            
+            self.award_xp_async(xp_amount)
+            return level > previous_level, level
+        except Exception as e:
+            self.logger.error(f"Erro ao conceder XP: {e}")
+            return False, 0
+    
+    def award_xp_async(self, xp_amount):
+        """Enfileira a concessão de XP na fila em segundo plano.
+
+        O Future retornado resolve para ``(subiu_de_nivel, nivel_atual)``
+        após o commit.
+        """
+        user_id = self.user_id
+        
+        def apply(session):
             # Buscar o nível atual do usuário
-            user_level = self.session.query(UserLevel).filter_by(
-                user_id=self.user_id
+            user_level = session.query(UserLevel).filter_by(
+                user_id=user_id
             ).first()
             
             # Se não existir registro, criar um
             if not user_level:
                 user_level = UserLevel(
-                    user_id=self.user_id,
+                    user_id=user_id,
                     current_level=1,
                     current_xp=0,
                     total_xp=0
                 )
-                self.session.add(user_level)
-                self.session.flush()
+                session.add(user_level)
+                session.flush()
             
-            # Atualizar XP
+            # Atualizar XP e verificar se subiu de nível
             previous_level = user_level.current_level
-            user_level.current_xp += xp_amount
             user_level.total_xp += xp_amount
-            
-            # Verificar se subiu de nível
-            # Fórmula: xp_para_proximo_nivel = nivel_atual * 100
-            while user_level.current_xp >= user_level.current_level * 100:
-                user_level.current_xp -= user_level.current_level * 100
-                user_level.current_level += 1
-            
-            self.session.commit()
+            user_level.current_level, user_level.current_xp = AchievementManager._add_xp(
+                user_level.current_level, user_level.current_xp, xp_amount
+            )
             
             # Retornar se houve level up
             return user_level.current_level > previous_level, user_level.current_level
-            
-        except Exception as e:
-            self.session.rollback()
-            self.logger.error(f"Erro ao conceder XP: {e}")
-            return False, 0
+        
+        return get_write_queue().submit(apply, user_id, pending=('xp', xp_amount))
+    
+    @staticmethod
+    def _add_xp(level: int, xp: int, amount: int):
+        """Soma XP e sobe de nível; retorna ``(nivel, xp_no_nivel)``.
+
+        Fórmula: xp_para_proximo_nivel = nivel_atual * 100
+        """
+        xp += amount
+        while xp >= level * 100:
+            xp -= level * 100
+            level += 1
+        return level, xp
     
     def get_user_level(self):
         """Retorna as informações de nível do usuário."""
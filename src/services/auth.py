@@ -1,14 +1,56 @@
-import bcrypt
-from sqlalchemy.orm import Session
+from sqlalchemy import event, Update, Delete
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session, make_transient_to_detached
 from sqlalchemy.exc import IntegrityError
 from src.database.models import User, AppConfig, PomodoroConfig
 from src.database.database import get_session
 from src.config.settings import AUTH
+from src.utils import password_hasher
 import re
+import threading
+import logging
+
+# Colunas dos usuários já carregados, por id; cada leitura monta um objeto
+# novo, então quem altera o usuário recebido não altera o dos outros
+_user_cache = {}
+_cache_lock = threading.Lock()
+
+def invalidate_user(user_id: int = None):
+    """Remove um usuário do cache (ou todos, sem ``user_id``)."""
+    with _cache_lock:
+        if user_id is None:
+            _user_cache.clear()
+        else:
+            _user_cache.pop(user_id, None)
+
+@event.listens_for(User, 'after_update')
+@event.listens_for(User, 'after_delete')
+def _invalidate_on_change(mapper, connection, target):
+    """Qualquer alteração em um usuário invalida a sua entrada no cache."""
+    invalidate_user(target.id)
+
+# UPDATE/DELETE em massa não passam pelos eventos do mapper, e não dá para
+# saber quais linhas mudaram sem reler a tabela: esvaziam o cache todo
+
+@event.listens_for(Session, 'do_orm_execute')
+def _invalidate_on_bulk_change(orm_execute_state):
+    """Atualizações em massa pela sessão (``query.update``, ``update(User)``)."""
+    if (orm_execute_state.is_update or orm_execute_state.is_delete) \
+            and orm_execute_state.bind_mapper is User.__mapper__:
+        invalidate_user()
+
+@event.listens_for(Engine, 'after_execute')
+def _invalidate_on_core_change(conn, clauseelement, multiparams, params, execution_options, result):
+    """Comandos do Core na tabela de usuários (``conn.execute(update(users))``)."""
+    if isinstance(clauseelement, (Update, Delete)) and clauseelement.table is User.__table__:
+        invalidate_user()
 
 class AuthService:
+    """Ponto único de autenticação: busca por username, verificação e cache de usuários."""
+
     def __init__(self):
         self.session: Session = get_session()
+        self.logger = logging.getLogger('auth_service')
 
     def validate_password(self, password: str) -> tuple[bool, str]:
         """Valida a força da senha de acordo com os requisitos."""
@@ -18,13 +60,13 @@ class AuthService:
         if AUTH['REQUIRE_SPECIAL_CHARS']:
             if not re.search(r"[!@#$%^&*(),.?\":{}|<>]", password):
                 return False, "A senha deve conter pelo menos um caractere especial"
-            
+        
         if not re.search(r"[A-Z]", password):
             return False, "A senha deve conter pelo menos uma letra maiúscula"
-            
+        
         if not re.search(r"[0-9]", password):
             return False, "A senha deve conter pelo menos um número"
-            
+        
         return True, "Senha válida"
 
     def register(self, username: str, email: str, password: str) -> tuple[bool, str]:
@@ -33,16 +75,16 @@ class AuthService:
         is_valid, message = self.validate_password(password)
         if not is_valid:
             return False, message
-
+        
         try:
             # Hash da senha
-            password_hash = bcrypt.hashpw(password.encode('utf-8'), bcrypt.gensalt())
+            password_hash = password_hasher.hash_password(password)
             
             # Criar novo usuário
             new_user = User(
                 username=username,
                 email=email,
-                password_hash=password_hash.decode('utf-8')
+                password_hash=password_hash
             )
             self.session.add(new_user)
             
@@ -55,7 +97,7 @@ class AuthService:
             
             self.session.commit()
             return True, "Usuário registrado com sucesso"
-            
+        
         except IntegrityError:
             self.session.rollback()
             return False, "Username ou email já existe"
@@ -63,23 +105,76 @@ class AuthService:
             self.session.rollback()
             return False, f"Erro ao registrar usuário: {str(e)}"
 
+    def _check_credentials(self, username: str, password: str):
+        """Busca o usuário pelo username e verifica a senha.
+
+        Retorna ``(user, motivo)``; ``user`` é None quando a autenticação falha.
+        """
+        user = self.session.query(User).filter(User.username == username).first()
+        if not user:
+            return None, "Usuário não encontrado"
+        
+        if not password_hasher.verify_password(password, user.password_hash):
+            return None, "Senha incorreta"
+        
+        # Atualizar o hash se o custo do bcrypt mudou
+        if password_hasher.needs_rehash(user.password_hash):
+            user.password_hash = password_hasher.hash_password(password)
+            self.session.commit()
+            self.session.refresh(user)
+            self.logger.debug(f"Hash da senha atualizado para usuário: {username}")
+        
+        return self._cache(user), None
+
+    def authenticate(self, username: str, password: str):
+        """Retorna o usuário autenticado ou None."""
+        try:
+            user, reason = self._check_credentials(username, password)
+            if not user:
+                self.logger.debug(f"Falha no login de {username}: {reason}")
+            return user
+        except Exception as e:
+            self.session.rollback()
+            self.logger.error(f"Erro ao autenticar: {e}")
+            return None
+
     def login(self, username: str, password: str) -> tuple[bool, dict]:
         """Autentica um usuário no sistema."""
         try:
-            user = self.session.query(User).filter(User.username == username).first()
-            
+            user, reason = self._check_credentials(username, password)
             if not user:
-                return False, {'message': "Usuário não encontrado"}
-                
-            if bcrypt.checkpw(password.encode('utf-8'), 
-                            user.password_hash.encode('utf-8')):
-                return True, {'message': "Login realizado com sucesso", 'user_id': user.id}
-            else:
-                return False, {'message': "Senha incorreta"}
-                
+                return False, {'message': reason}
+            return True, {'message': "Login realizado com sucesso", 'user_id': user.id}
+        
         except Exception as e:
+            self.session.rollback()
             return False, {'message': f"Erro ao realizar login: {str(e)}"}
 
+    def get_user(self, user_id: int):
+        """Retorna o usuário pelo id, consultando o banco só na primeira vez."""
+        with _cache_lock:
+            values = _user_cache.get(user_id)
+        if values is not None:
+            return self._detached(values)
+        
+        user = self.session.get(User, user_id)
+        return self._cache(user) if user else None
+
+    def _cache(self, user):
+        """Guarda as colunas do usuário no cache e o desanexa da sessão."""
+        values = {column.key: getattr(user, column.key) for column in User.__table__.columns}
+        self.session.expunge(user)
+        with _cache_lock:
+            _user_cache[user.id] = values
+        return user
+
+    @staticmethod
+    def _detached(values: dict) -> User:
+        """Novo objeto desanexado com os valores do cache (como se viesse do banco)."""
+        user = User(**values)
+        make_transient_to_detached(user)
+        return user
+
     def __del__(self):
         """Fecha a sessão do banco de dados quando o serviço for destruído."""
-        self.session.close() 
\ No newline at end of file
+        self.session.close()
@@ -1,35 +1,24 @@
-from src.database.models import User
-from src.database.database import get_session
+from src.services.auth import AuthService
 from src.services.session_manager import SessionManager
 import logging
 
 class AuthManager:
+    """Login da interface: autentica pelo AuthService e mantém a sessão salva."""
+    
     def __init__(self):
         self.session_manager = SessionManager()
-        self.db_session = get_session()
+        self.auth_service = AuthService()
         self.logger = logging.getLogger('auth_manager')
         
     def login(self, username: str, password: str):
         """Realiza o login do usuário."""
-        try:
-            self.logger.debug(f"Tentativa de login para usuário: {username}")
-            
-            user = self.db_session.query(User).filter_by(username=username).first()
-            if not user:
-                self.logger.debug(f"Usuário não encontrado: {username}")
-                return None
-                
-            if user.verify_password(password):
-                self.logger.debug(f"Login bem sucedido para usuário: {username}")
-                self.session_manager.save_session(user.id)
-                return user
-            else:
-                self.logger.debug(f"Senha incorreta para usuário: {username}")
-                return None
-                
-        except Exception as e:
-            self.logger.error(f"Erro no login: {e}")
-            return None
+        self.logger.debug(f"Tentativa de login para usuário: {username}")
+        
+        user = self.auth_service.authenticate(username, password)
+        if user:
+            self.logger.debug(f"Login bem sucedido para usuário: {username}")
+            self.session_manager.save_session(user.id)
+        return user
         
     def logout(self):
         """Realiza o logout do usuário."""
@@ -41,8 +30,4 @@ class AuthManager:
         
     def get_user(self, user_id: int):
         """Retorna o usuário pelo ID."""
-        return self.db_session.query(User).get(user_id)
-        
-    def __del__(self):
-        """Fecha a sessão do banco de dados."""
-        self.db_session.close() 
\ No newline at end of file
+        return self.auth_service.get_user(user_id)
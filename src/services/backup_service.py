@@ -0,0 +1,119 @@
+from datetime import datetime
+import glob
+import gzip
+import os
+import shutil
+import sqlite3
+import threading
+import logging
+from src.database.database import get_data_dir, DATABASE_URL, ARCHIVE_PATH
+from src.config.settings import BACKUP, SHARDING
+
+class BackupService:
+    """Cópias de segurança dos bancos SQLite com a aplicação em uso.
+
+    Usa a API de backup do SQLite em lotes de ``pages_per_step`` páginas,
+    com uma pausa entre os lotes: cada lote segura o banco por poucos
+    milissegundos, então as gravações do timer não ficam bloqueadas.
+    As cópias são compactadas com gzip e só as ``keep`` mais recentes de
+    cada banco são mantidas.
+    """
+
+    def __init__(self, backup_dir: str = None):
+        self.backup_dir = backup_dir or os.path.join(get_data_dir(), BACKUP['directory'])
+        self.logger = logging.getLogger('backup_service')
+        self._stop = threading.Event()
+        self._thread = None
+        os.makedirs(self.backup_dir, exist_ok=True)
+
+    def start(self):
+        """Inicia as cópias periódicas em uma thread em segundo plano."""
+        if self._thread and self._thread.is_alive():
+            return
+
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name='backup', daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """Interrompe as cópias periódicas."""
+        self._stop.set()
+
+    def _run(self):
+        while not self._stop.wait(BACKUP['interval_minutes'] * 60):
+            try:
+                self.backup_now()
+            except Exception as e:
+                self.logger.error(f"Erro no backup agendado: {e}")
+
+    def databases(self) -> dict:
+        """Bancos a copiar, por nome da cópia."""
+        databases = {'animeproductivity': DATABASE_URL.replace('sqlite:///', '', 1)}
+        if os.path.exists(ARCHIVE_PATH):
+            databases['archive'] = ARCHIVE_PATH
+
+        for path in glob.glob(os.path.join(get_data_dir(), SHARDING['directory'], '*.db')):
+            user_id = os.path.splitext(os.path.basename(path))[0]
+            databases[f"user_{user_id}"] = path
+
+        return databases
+
+    def backup_now(self) -> list:
+        """Copia todos os bancos agora; retorna os arquivos gerados."""
+        timestamp = datetime.now().strftime('%Y%m%d-%H%M%S')
+        snapshots = []
+
+        for name, path in self.databases().items():
+            if not os.path.exists(path):
+                continue
+            try:
+                snapshot = self._backup_database(path, f"{name}-{timestamp}.db.gz")
+                snapshots.append(snapshot)
+                self._rotate(name)
+            except Exception as e:
+                self.logger.error(f"Erro ao copiar {path}: {e}")
+
+        self.logger.info(f"Backup concluído: {len(snapshots)} banco(s)")
+        return snapshots
+
+    def _backup_database(self, path, filename):
+        """Copia um banco em lotes de páginas e compacta o resultado."""
+        snapshot = os.path.join(self.backup_dir, filename)
+        temp_path = snapshot[:-len('.gz')] + '.tmp'
+
+        source = sqlite3.connect(path)
+        target = sqlite3.connect(temp_path)
+        try:
+            source.backup(
+                target,
+                pages=BACKUP['pages_per_step'],
+                sleep=BACKUP['step_sleep_ms'] / 1000
+            )
+        finally:
+            target.close()
+            source.close()
+
+        try:
+            with open(temp_path, 'rb') as raw, gzip.open(snapshot, 'wb', compresslevel=6) as compressed:
+                shutil.copyfileobj(raw, compressed)
+        finally:
+            os.remove(temp_path)
+
+        return snapshot
+
+    def _rotate(self, name):
+        """Remove as cópias mais antigas de um banco."""
+        snapshots = sorted(glob.glob(os.path.join(self.backup_dir, f"{name}-*.db.gz")))
+        for old in snapshots[:-BACKUP['keep']]:
+            os.remove(old)
+
+    def restore(self, snapshot: str, path: str):
+        """Descompacta uma cópia sobre ``path`` (com a aplicação fechada)."""
+        with gzip.open(snapshot, 'rb') as compressed, open(path, 'wb') as raw:
+            shutil.copyfileobj(compressed, raw)
+        self.logger.info(f"Banco restaurado de {snapshot}")
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    for snapshot in BackupService().backup_now():
+        print(snapshot)
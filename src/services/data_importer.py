@@ -0,0 +1,227 @@
+import csv
+import json
+import os
+import sys
+from datetime import datetime
+from itertools import islice
+from src.database.models import PomodoroSession, StudySession, Task
+from src.database.database import engine
+from src.services.stats_rollup import StatsRollup
+from src.database.maintenance import DatabaseMaintenance, notify_bulk_change
+import logging
+
+class DataImporter:
+    """Importa histórico de estudo de outros aplicativos (CSV, JSONL ou Parquet).
+
+    Cada linha descreve um registro de um dos tipos abaixo, indicado pela
+    coluna ``type`` (ou pelo parâmetro ``kind`` quando o arquivo não a possui):
+
+    - ``pomodoro``: start_time, end_time, completed
+    - ``study``: subject, duration (minutos), start_time, end_time
+    - ``task``: title, description, deadline, completed, completion_date, created_at
+    """
+
+    CHUNK_SIZE = 10000
+    MAX_ERRORS = 20
+
+    TABLES = {
+        'pomodoro': PomodoroSession.__table__,
+        'study': StudySession.__table__,
+        'task': Task.__table__
+    }
+
+    TRUE_VALUES = {'1', 'true', 't', 'yes', 'y', 'sim', 's'}
+
+    def __init__(self, user_id: int, chunk_size: int = CHUNK_SIZE):
+        self.user_id = user_id
+        self.chunk_size = chunk_size
+        self.logger = logging.getLogger('data_importer')
+
+    def import_file(self, path: str, kind: str = None) -> dict:
+        """Importa um arquivo e atualiza o resumo diário do usuário."""
+        result = {name: 0 for name in self.TABLES}
+        result['rejected'] = 0
+        result['errors'] = []
+
+        rows = self._read_rows(path)
+        records = self._validate(rows, kind, result)
+        self._insert(records, result)
+
+        StatsRollup().refresh([self.user_id])
+
+        # Atualiza as estatísticas do planejador após a carga em massa
+        # (pelo agendador, quando o app está aberto; senão, agora)
+        if not notify_bulk_change():
+            DatabaseMaintenance().analyze()
+
+        self.logger.info(
+            f"Importação de {path} concluída: "
+            f"{result['pomodoro']} pomodoros, {result['study']} sessões, "
+            f"{result['task']} tarefas, {result['rejected']} rejeitadas"
+        )
+        return result
+
+    # Leitura
+
+    def _read_rows(self, path):
+        """Escolhe o leitor adequado pela extensão do arquivo."""
+        extension = os.path.splitext(path)[1].lower()
+        if extension == '.csv':
+            return self._read_csv(path)
+        if extension in ('.jsonl', '.ndjson'):
+            return self._read_jsonl(path)
+        if extension == '.parquet':
+            return self._read_parquet(path)
+        raise ValueError(f"Formato de arquivo não suportado: {extension}")
+
+    def _read_csv(self, path):
+        with open(path, newline='', encoding='utf-8') as f:
+            yield from csv.DictReader(f)
+
+    def _read_jsonl(self, path):
+        with open(path, encoding='utf-8') as f:
+            for line in f:
+                line = line.strip()
+                if line:
+                    try:
+                        yield json.loads(line)
+                    except json.JSONDecodeError as e:
+                        # Entregue como linha inválida para ser contada em _validate
+                        yield ValueError(f"JSON inválido ({e.msg})")
+
+    def _read_parquet(self, path):
+        try:
+            import pyarrow.parquet as pq
+        except ImportError:
+            raise ImportError("A importação de Parquet requer o pacote 'pyarrow'")
+
+        parquet_file = pq.ParquetFile(path)
+        for batch in parquet_file.iter_batches(batch_size=self.chunk_size):
+            yield from batch.to_pylist()
+
+    # Validação
+
+    def _validate(self, rows, kind, result):
+        """Converte as linhas em registros prontos para inserção."""
+        builders = {
+            'pomodoro': self._build_pomodoro,
+            'study': self._build_study,
+            'task': self._build_task
+        }
+
+        for line_number, row in enumerate(rows, start=1):
+            try:
+                if isinstance(row, Exception):
+                    raise row
+                if not isinstance(row, dict):
+                    raise ValueError("a linha não é um objeto JSON")
+                row_kind = (row.get('type') or kind or '').strip().lower()
+                if row_kind not in builders:
+                    raise ValueError(f"tipo de registro inválido: '{row_kind}'")
+                yield row_kind, builders[row_kind](row)
+            except (ValueError, TypeError, KeyError) as e:
+                result['rejected'] += 1
+                if len(result['errors']) < self.MAX_ERRORS:
+                    result['errors'].append(f"Linha {line_number}: {e}")
+
+    def _build_pomodoro(self, row):
+        start_time = self._parse_datetime(row.get('start_time'), required=True)
+        end_time = self._parse_datetime(row.get('end_time'))
+        if end_time and end_time < start_time:
+            raise ValueError("end_time anterior a start_time")
+
+        completed = row.get('completed')
+        return {
+            'user_id': self.user_id,
+            'start_time': start_time,
+            'end_time': end_time,
+            'completed': self._parse_bool(completed) if completed not in (None, '') else end_time is not None
+        }
+
+    def _build_study(self, row):
+        start_time = self._parse_datetime(row.get('start_time'), required=True)
+        end_time = self._parse_datetime(row.get('end_time'))
+
+        duration = row.get('duration')
+        if duration not in (None, ''):
+            duration = int(float(duration))
+        elif end_time:
+            duration = int((end_time - start_time).total_seconds() // 60)
+        else:
+            raise ValueError("duration ou end_time é obrigatório")
+        if duration < 0:
+            raise ValueError("duration negativa")
+
+        return {
+            'user_id': self.user_id,
+            'subject': (row.get('subject') or '')[:100] or None,
+            'duration': duration,
+            'start_time': start_time,
+            'end_time': end_time
+        }
+
+    def _build_task(self, row):
+        title = row.get('title')
+        if not title:
+            raise ValueError("title é obrigatório")
+
+        created_at = self._parse_datetime(row.get('created_at')) or datetime.now()
+        completion_date = self._parse_datetime(row.get('completion_date'))
+        completed = row.get('completed')
+        return {
+            'user_id': self.user_id,
+            'title': title,
+            'description': row.get('description') or None,
+            'deadline': self._parse_datetime(row.get('deadline')),
+            'completed': self._parse_bool(completed) if completed not in (None, '') else completion_date is not None,
+            'completion_date': completion_date,
+            'created_at': created_at,
+            'updated_at': completion_date or created_at
+        }
+
+    def _parse_datetime(self, value, required=False):
+        if value is None or value == '':
+            if required:
+                raise ValueError("data obrigatória ausente")
+            return None
+        if not isinstance(value, datetime):
+            value = datetime.fromisoformat(str(value).strip())
+        if value.tzinfo is not None:
+            # Datas com fuso são convertidas para o horário local, como o resto do app
+            value = value.astimezone().replace(tzinfo=None)
+        return value
+
+    def _parse_bool(self, value):
+        if isinstance(value, bool):
+            return value
+        return str(value).strip().lower() in self.TRUE_VALUES
+
+    # Inserção
+
+    def _insert(self, records, result):
+        """Insere os registros em lotes, cada lote em sua própria transação."""
+        buffers = {name: [] for name in self.TABLES}
+
+        while True:
+            chunk = list(islice(records, self.chunk_size))
+            if not chunk:
+                break
+
+            for row_kind, record in chunk:
+                buffers[row_kind].append(record)
+
+            with engine.begin() as conn:
+                for name, buffer in buffers.items():
+                    if buffer:
+                        conn.execute(self.TABLES[name].insert(), buffer)
+                        result[name] += len(buffer)
+                        buffer.clear()
+
+if __name__ == "__main__":
+    if len(sys.argv) < 3:
+        print("Uso: python -m src.services.data_importer <user_id> <arquivo> [tipo]")
+        sys.exit(1)
+
+    importer = DataImporter(int(sys.argv[1]))
+    summary = importer.import_file(sys.argv[2], sys.argv[3] if len(sys.argv) > 3 else None)
+    print(json.dumps(summary, indent=4, ensure_ascii=False))
@@ -1,7 +1,3 @@
-from google.oauth2.credentials import Credentials
-from google_auth_oauthlib.flow import InstalledAppFlow
-from google.auth.transport.requests import Request
-from googleapiclient.discovery import build
 from datetime import datetime, timedelta
 import os.path
 import pickle
@@ -9,6 +5,12 @@ from src.database.models import Task
 from src.database.database import get_session
 from src.config.settings import GOOGLE_API
 from typing import Dict, List
+from src.utils.lazy_import import lazy_import
+
+# Clientes da API do Google, importados só na sincronização
+google_requests = lazy_import('google.auth.transport.requests')
+google_auth_flow = lazy_import('google_auth_oauthlib.flow')
+discovery = lazy_import('googleapiclient.discovery')
 
 class GoogleCalendarService:
     def __init__(self, user_id):
@@ -17,7 +19,7 @@ class GoogleCalendarService:
         self.creds = None
         self.credentials_file = 'credentials.json'
         self.token_file = f'token_{user_id}.pickle'
-        self.session = get_session()
+        self.session = get_session(user_id)
         self.service = None
         
     def authenticate(self):
@@ -29,19 +31,19 @@ class GoogleCalendarService:
                     
             if not self.creds or not self.creds.valid:
                 if self.creds and self.creds.expired and self.creds.refresh_token:
-                    self.creds.refresh(Request())
+                    self.creds.refresh(google_requests.Request())
                 else:
                     if not os.path.exists(self.credentials_file):
                         return False
                         
-                    flow = InstalledAppFlow.from_client_secrets_file(
+                    flow = google_auth_flow.InstalledAppFlow.from_client_secrets_file(
                         self.credentials_file, self.SCOPES)
                     self.creds = flow.run_local_server(port=0)
                     
                 with open(self.token_file, 'wb') as token:
                     pickle.dump(self.creds, token)
                     
-            self.service = build('calendar', 'v3', credentials=self.creds)
+            self.service = discovery.build('calendar', 'v3', credentials=self.creds)
             return True
             
         except Exception as e:
@@ -2,16 +2,17 @@ import time
 from datetime import datetime
 from src.database.models import PomodoroSession, PomodoroConfig, User
 from src.database.database import get_session
+from src.database.write_behind import get_write_queue
+from src.services.timer_engine import TimerEngine
 from plyer import notification
 
 class PomodoroTimer:
     def __init__(self, user_id):
         self.user_id = user_id
-        self.session = get_session()
+        self.session = get_session(user_id)
         self.config = self._load_config()
-        self.time_remaining = self.config.work_time * 60  # Converter minutos para segundos
-        self.total_time = self.config.work_time * 60
-        self.is_running = False
+        # Contagem ancorada no relógio monotônico (minutos convertidos para segundos)
+        self.engine = TimerEngine(self.config.work_time * 60)
         
     def _load_config(self):
         """Carrega ou cria configuração do Pomodoro."""
@@ -25,47 +26,81 @@ class PomodoroTimer:
             )
             self.session.add(config)
             self.session.commit()
+            self.session.refresh(config)
+        # Desanexada: alterações são gravadas pela fila, não por esta sessão
+        self.session.expunge(config)
         return config
+    
+    @property
+    def time_remaining(self) -> int:
+        """Segundos restantes, calculados a partir do relógio."""
+        return self.engine.remaining_seconds()
+    
+    @property
+    def total_time(self) -> int:
+        return self.engine.duration
+    
+    @total_time.setter
+    def total_time(self, seconds: int):
+        self.engine.duration = seconds
+    
+    @property
+    def is_running(self) -> bool:
+        return self.engine.is_running
+    
+    @is_running.setter
+    def is_running(self, running: bool):
+        if running:
+            self.engine.start()
+        else:
+            self.engine.pause()
         
     def update_config(self, work_time=None, break_time=None, long_break_time=None):
         """Atualiza as configurações do timer."""
+        changes = {}
         if work_time is not None:
-            self.config.work_time = work_time
-            self.total_time = work_time * 60
-            if not self.is_running:
-                self.time_remaining = self.total_time
+            changes['work_time'] = work_time
+            if self.is_running:
+                self.total_time = work_time * 60
+            else:
+                self.engine.reset(work_time * 60)
                 
         if break_time is not None:
-            self.config.break_time = break_time
+            changes['break_time'] = break_time
             
         if long_break_time is not None:
-            self.config.long_break_time = long_break_time
-            
-        self.session.commit()
+            changes['long_break_time'] = long_break_time
+        
+        for name, value in changes.items():
+            setattr(self.config, name, value)
+        
+        if changes:
+            get_write_queue().submit(
+                lambda session: session.query(PomodoroConfig).filter_by(
+                    user_id=self.user_id
+                ).update(changes),
+                self.user_id
+            )
         
     def start(self):
         """Inicia o timer."""
-        self.is_running = True
+        self.engine.start()
         
     def pause(self):
         """Pausa o timer."""
-        self.is_running = False
+        self.engine.pause()
         
     def reset(self):
         """Reseta o timer."""
-        self.time_remaining = self.total_time
-        self.is_running = False
+        self.engine.reset()
         
     def get_remaining_time(self):
         """Retorna o tempo restante em segundos."""
         return self.time_remaining
         
     def update(self):
-        """Atualiza o timer."""
-        if self.is_running and self.time_remaining > 0:
-            self.time_remaining -= 1
-            return True
-        return False
+        """Indica se o timer ainda está contando (o tempo vem do relógio)."""
+        return self.is_running and not self.engine.is_finished()
         
     def _get_or_create_config(self) -> PomodoroConfig:
         """Obtém ou cria uma configuração do Pomodoro para o usuário."""
@@ -87,6 +122,32 @@ class PomodoroTimer:
         """Para o timer atual."""
         self.is_running = False
         
+    def save_session(self, start_time: datetime, end_time: datetime, completed: bool = True):
+        """Grava um ciclo de trabalho encerrado (ignora se já foi gravado).
+
+        A gravação vai para a fila em segundo plano; o Future retornado é
+        resolvido após o commit.
+        """
+        user_id = self.user_id
+        
+        def apply(session):
+            exists = session.query(PomodoroSession.id).filter_by(
+                user_id=user_id, start_time=start_time
+            ).first()
+            if not exists:
+                session.add(PomodoroSession(
+                    user_id=user_id,
+                    start_time=start_time,
+                    end_time=end_time,
+                    completed=completed
+                ))
+        
+        return get_write_queue().submit(apply, user_id, pending=('pomodoro', {
+            'start_time': start_time,
+            'end_time': end_time,
+            'completed': completed
+        }))
+        
     def _complete_session(self):
         """Completa uma sessão Pomodoro."""
         if self.current_session:
@@ -106,11 +167,8 @@ class PomodoroTimer:
         
     def get_time_str(self) -> str:
         """Retorna o tempo restante formatado."""
-        minutes = self.time_remaining // 60
-        seconds = self.time_remaining % 60
-        return f"{minutes:02d}:{seconds:02d}"
+        return self.engine.format()
         
     def get_progress(self) -> float:
         """Retorna o progresso atual (0.0 a 1.0)."""
-        total_time = self.total_time
-        return 1 - (self.time_remaining / total_time) 
\ No newline at end of file
+        return self.engine.progress() 
\ No newline at end of file
@@ -1,23 +1,28 @@
-from reportlab.lib import colors
-from reportlab.lib.pagesizes import letter
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle, Image
-from reportlab.graphics.shapes import Drawing
-from reportlab.graphics.charts.linecharts import HorizontalLineChart
 from datetime import datetime, timedelta
-from sqlalchemy import and_
+from sqlalchemy import and_, select
 from src.database.models import PomodoroSession, Task, User
 from src.database.database import get_session
+from src.database.archive import all_time
+from src.database.instrumentation import action
+from src.utils.lazy_import import lazy_import
 import os
 
+# O reportlab só é importado quando um relatório é gerado
+colors = lazy_import('reportlab.lib.colors')
+pagesizes = lazy_import('reportlab.lib.pagesizes')
+reportlab_styles = lazy_import('reportlab.lib.styles')
+platypus = lazy_import('reportlab.platypus')
+shapes = lazy_import('reportlab.graphics.shapes')
+linecharts = lazy_import('reportlab.graphics.charts.linecharts')
+
 class ReportGenerator:
     def __init__(self, user_id: int):
         self.user_id = user_id
-        self.session = get_session()
-        self.styles = getSampleStyleSheet()
+        self.session = get_session(user_id)
+        self.styles = reportlab_styles.getSampleStyleSheet()
         
         # Criar estilo personalizado para títulos de anime
-        self.styles.add(ParagraphStyle(
+        self.styles.add(reportlab_styles.ParagraphStyle(
             name='AnimeTitle',
             parent=self.styles['Heading1'],
             fontName='Helvetica-Bold',
@@ -26,11 +31,37 @@ class ReportGenerator:
             spaceAfter=30
         ))
         
+    def _sessions_between(self, start_date, end_date):
+        """Sessões Pomodoro do período, incluindo as já arquivadas."""
+        pomodoros = all_time(PomodoroSession)
+        return self.session.execute(select(pomodoros).where(and_(
+            pomodoros.c.user_id == self.user_id,
+            pomodoros.c.start_time >= start_date,
+            pomodoros.c.start_time < end_date
+        ))).all()
+        
+    def _completed_tasks_between(self, start_date, end_date):
+        """Tarefas concluídas no período, incluindo as já arquivadas."""
+        tasks = all_time(Task)
+        return self.session.execute(select(tasks).where(and_(
+            tasks.c.user_id == self.user_id,
+            tasks.c.completed == True,
+            tasks.c.completion_date >= start_date,
+            tasks.c.completion_date <= end_date
+        ))).all()
+        
+    @staticmethod
+    def _minutes(session) -> float:
+        """Duração de uma sessão em minutos (0 se ainda não terminou)."""
+        if not session.end_time:
+            return 0
+        return (session.end_time - session.start_time).total_seconds() / 60
+        
     def generate_weekly_report(self, output_path: str):
         """Gera um relatório semanal em PDF."""
-        doc = SimpleDocTemplate(
+        doc = platypus.SimpleDocTemplate(
             output_path,
-            pagesize=letter,
+            pagesize=pagesizes.letter,
             rightMargin=72,
             leftMargin=72,
             topMargin=72,
@@ -40,17 +71,18 @@ class ReportGenerator:
         # Lista de elementos do PDF
         elements = []
         
-        # Adicionar cabeçalho
-        self._add_header(elements)
-        
-        # Adicionar resumo da semana
-        self._add_weekly_summary(elements)
-        
-        # Adicionar gráfico de produtividade
-        self._add_productivity_chart(elements)
-        
-        # Adicionar lista de tarefas concluídas
-        self._add_completed_tasks(elements)
+        with action('weekly_report'):
+            # Adicionar cabeçalho
+            self._add_header(elements)
+            
+            # Adicionar resumo da semana
+            self._add_weekly_summary(elements)
+            
+            # Adicionar gráfico de produtividade
+            self._add_productivity_chart(elements)
+            
+            # Adicionar lista de tarefas concluídas
+            self._add_completed_tasks(elements)
         
         # Gerar o PDF
         doc.build(elements)
@@ -59,11 +91,11 @@ class ReportGenerator:
         """Adiciona o cabeçalho do relatório."""
         # Logo ou imagem temática
         if os.path.exists('assets/logo.png'):
-            elements.append(Image('assets/logo.png', width=200, height=100))
-            elements.append(Spacer(1, 20))
+            elements.append(platypus.Image('assets/logo.png', width=200, height=100))
+            elements.append(platypus.Spacer(1, 20))
         
         # Título
-        title = Paragraph(
+        title = platypus.Paragraph(
             "Relatório Semanal de Produtividade",
             self.styles['AnimeTitle']
         )
@@ -72,12 +104,12 @@ class ReportGenerator:
         # Período do relatório
         end_date = datetime.now()
         start_date = end_date - timedelta(days=7)
-        period = Paragraph(
+        period = platypus.Paragraph(
             f"Período: {start_date.strftime('%d/%m/%Y')} - {end_date.strftime('%d/%m/%Y')}",
             self.styles['Normal']
         )
         elements.append(period)
-        elements.append(Spacer(1, 30))
+        elements.append(platypus.Spacer(1, 30))
         
     def _add_weekly_summary(self, elements):
         """Adiciona o resumo da semana."""
@@ -85,23 +117,12 @@ class ReportGenerator:
         end_date = datetime.now()
         start_date = end_date - timedelta(days=7)
         
-        pomodoro_sessions = self.session.query(PomodoroSession).filter(
-            PomodoroSession.user_id == self.user_id,
-            PomodoroSession.start_time >= start_date,
-            PomodoroSession.start_time <= end_date
-        ).all()
-        
-        completed_tasks = self.session.query(Task).filter(
-            Task.user_id == self.user_id,
-            Task.status == 'completed',
-            Task.created_at >= start_date,
-            Task.created_at <= end_date
-        ).all()
+        pomodoro_sessions = self._sessions_between(start_date, end_date)
         
         # Calcular estatísticas
-        total_duration = sum(
-            session.duration for session in pomodoro_sessions if session.completed
-        )
+        total_duration = round(sum(
+            self._minutes(session) for session in pomodoro_sessions if session.completed
+        ))
         
         completed_sessions = len([s for s in pomodoro_sessions if s.completed])
         
@@ -112,8 +133,8 @@ class ReportGenerator:
             ['Tempo Total (minutos)', str(total_duration)]
         ]
         
-        pomodoro_table = Table(pomodoro_data, colWidths=[200, 100])
-        pomodoro_table.setStyle(TableStyle([
+        pomodoro_table = platypus.Table(pomodoro_data, colWidths=[200, 100])
+        pomodoro_table.setStyle(platypus.TableStyle([
             ('BACKGROUND', (0, 0), (-1, 0), colors.grey),
             ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
             ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
@@ -128,12 +149,12 @@ class ReportGenerator:
         ]))
         
         elements.append(pomodoro_table)
-        elements.append(Spacer(1, 20))
+        elements.append(platypus.Spacer(1, 20))
         
     def _add_productivity_chart(self, elements):
         """Adiciona um gráfico de produtividade diária."""
         # Criar o gráfico
-        drawing = Drawing(400, 200)
+        drawing = shapes.Drawing(400, 200)
         
         # Dados do gráfico
         end_date = datetime.now()
@@ -148,17 +169,11 @@ class ReportGenerator:
             next_date = current_date + timedelta(days=1)
             
             # Buscar sessões do dia
-            sessions = self.session.query(PomodoroSession).filter(
-                and_(
-                    PomodoroSession.user_id == self.user_id,
-                    PomodoroSession.start_time >= current_date,
-                    PomodoroSession.start_time < next_date
-                )
-            ).all()
+            sessions = self._sessions_between(current_date, next_date)
             
             # Calcular horas
             hours = sum(
-                session.duration / 60
+                self._minutes(session) / 60
                 for session in sessions
                 if session.completed
             )
@@ -168,7 +183,7 @@ class ReportGenerator:
             current_date = next_date
         
         # Configurar o gráfico
-        chart = HorizontalLineChart()
+        chart = linecharts.HorizontalLineChart()
         chart.x = 50
         chart.y = 50
         chart.height = 125
@@ -183,28 +198,21 @@ class ReportGenerator:
         
         drawing.add(chart)
         elements.append(drawing)
-        elements.append(Spacer(1, 30))
+        elements.append(platypus.Spacer(1, 30))
         
     def _add_completed_tasks(self, elements):
         """Adiciona a lista de tarefas concluídas."""
-        elements.append(Paragraph(
+        elements.append(platypus.Paragraph(
             "Tarefas Concluídas",
             self.styles['Heading2']
         ))
-        elements.append(Spacer(1, 12))
+        elements.append(platypus.Spacer(1, 12))
         
         # Buscar tarefas concluídas
         end_date = datetime.now()
         start_date = end_date - timedelta(days=7)
         
-        tasks = self.session.query(Task).filter(
-            and_(
-                Task.user_id == self.user_id,
-                Task.status == 'completed',
-                Task.created_at >= start_date,
-                Task.created_at <= end_date
-            )
-        ).all()
+        tasks = self._completed_tasks_between(start_date, end_date)
         
         # Criar tabela de tarefas
         if tasks:
@@ -218,11 +226,11 @@ class ReportGenerator:
                 task_data.append([
                     task.title,
                     task.description[:50] + '...' if task.description else '',
-                    task.created_at.strftime('%d/%m/%Y')
+                    task.completion_date.strftime('%d/%m/%Y')
                 ])
             
-            task_table = Table(task_data, colWidths=[150, 200, 100])
-            task_table.setStyle(TableStyle([
+            task_table = platypus.Table(task_data, colWidths=[150, 200, 100])
+            task_table.setStyle(platypus.TableStyle([
                 ('BACKGROUND', (0, 0), (-1, 0), colors.grey),
                 ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
                 ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
@@ -238,7 +246,7 @@ class ReportGenerator:
             
             elements.append(task_table)
         else:
-            elements.append(Paragraph(
+            elements.append(platypus.Paragraph(
                 "Nenhuma tarefa concluída neste período.",
                 self.styles['Normal']
             ))
@@ -1,8 +1,7 @@
 import json
 import os
 from datetime import datetime, timedelta
-from src.database.models import User
-from src.database.database import get_session, get_data_dir
+from src.database.database import get_data_dir
 import logging
 
 class SessionManager:
@@ -54,10 +53,9 @@ class SessionManager:
                 self.clear_session()
                 return None
                 
-            # Verificar se o usuário ainda existe
-            db_session = get_session()
-            user = db_session.query(User).get(session_data['user_id'])
-            db_session.close()
+            # Verificar se o usuário ainda existe (no máximo uma leitura pela chave primária)
+            from src.services.auth import AuthService
+            user = AuthService().get_user(session_data['user_id'])
             
             if not user:
                 logging.debug("Usuário não encontrado")
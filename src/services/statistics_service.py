@@ -0,0 +1,83 @@
+from datetime import datetime
+from sqlalchemy import func
+from src.database.models import PomodoroSession, Task, UserLevel
+from src.database.database import get_session
+from src.database.archive import all_time
+
+class StatisticsService:
+    """Consultas de estatísticas gerais de produtividade do usuário."""
+
+    def __init__(self, user_id: int):
+        self.user_id = user_id
+        self.session = get_session(user_id)
+
+    def get_snapshot(self) -> dict:
+        """Retorna os números exibidos na janela de estatísticas."""
+        today = datetime.now().date()
+
+        # Pomodoros completados hoje
+        pomodoros_today = self.session.query(PomodoroSession).filter(
+            PomodoroSession.user_id == self.user_id,
+            PomodoroSession.start_time >= today,
+            PomodoroSession.completed == True
+        ).count()
+
+        # Tarefas completadas hoje
+        tasks_today = self.session.query(Task).filter(
+            Task.user_id == self.user_id,
+            Task.completed == True,
+            Task.completion_date >= today
+        ).count()
+
+        # Tempo total focado, incluindo sessões arquivadas
+        pomodoros = all_time(PomodoroSession)
+        total_pomodoros = self.session.query(func.count()).select_from(pomodoros).filter(
+            pomodoros.c.user_id == self.user_id,
+            pomodoros.c.completed == True
+        ).scalar()
+
+        return {
+            'pomodoros_today': pomodoros_today,
+            'tasks_today': tasks_today,
+            'total_minutes': total_pomodoros * 25  # 25 minutos por pomodoro
+        }
+
+    def get_period_data(self, start_date, end_date) -> dict:
+        """Retorna os dados dos gráficos do painel de estatísticas para um período."""
+        sessions = self.session.query(
+            PomodoroSession.start_time, PomodoroSession.end_time
+        ).filter(
+            PomodoroSession.user_id == self.user_id,
+            PomodoroSession.completed == True,
+            PomodoroSession.start_time >= start_date,
+            PomodoroSession.start_time <= end_date
+        ).order_by(PomodoroSession.start_time).all()
+
+        tasks = self.session.query(Task.completed, Task.deadline).filter(
+            Task.user_id == self.user_id,
+            Task.created_at >= start_date,
+            Task.created_at <= end_date
+        ).all()
+
+        user_level = self.session.query(UserLevel.current_level).filter_by(
+            user_id=self.user_id
+        ).scalar()
+
+        return {
+            'study_sessions': [
+                {
+                    'date': start,
+                    'duration': int((end - start).total_seconds() // 60) if end else 25
+                }
+                for start, end in sessions
+            ],
+            'tasks': [
+                {'completed': completed, 'deadline': deadline}
+                for completed, deadline in tasks
+            ],
+            'level': user_level or 1
+        }
+
+    def __del__(self):
+        """Fecha a sessão do banco de dados."""
+        self.session.close()
@@ -0,0 +1,93 @@
+from datetime import date
+from sqlalchemy import select, delete, func, and_, cast, Integer
+from src.database.models import PomodoroSession, StudySession, Task, DailyStats
+from src.database.database import engine
+from src.database.archive import all_time
+import logging
+
+class StatsRollup:
+    """Mantém a tabela de resumo diário (daily_stats) a partir das tabelas base."""
+
+    def __init__(self):
+        self.logger = logging.getLogger('stats_rollup')
+
+    def refresh(self, user_ids):
+        """Recalcula o resumo diário dos usuários informados em uma única passada."""
+        user_ids = list(user_ids)
+        if not user_ids:
+            return 0
+
+        try:
+            with engine.begin() as conn:
+                totals = {}
+                for (user_id, day), values in self._collect(conn, user_ids):
+                    if day is None:
+                        continue
+                    row = totals.setdefault((user_id, day), {
+                        'user_id': user_id,
+                        'day': date.fromisoformat(day),
+                        'pomodoros': 0,
+                        'focus_minutes': 0,
+                        'study_minutes': 0,
+                        'tasks_completed': 0
+                    })
+                    row.update(values)
+
+                conn.execute(delete(DailyStats.__table__).where(
+                    DailyStats.user_id.in_(user_ids)
+                ))
+                if totals:
+                    conn.execute(DailyStats.__table__.insert(), list(totals.values()))
+
+            self.logger.info(f"Resumo diário atualizado: {len(totals)} dias")
+            return len(totals)
+
+        except Exception as e:
+            self.logger.error(f"Erro ao atualizar resumo diário: {e}")
+            raise
+
+    def _collect(self, conn, user_ids):
+        """Agrega cada tabela base uma única vez, agrupando por usuário e dia.
+
+        As tabelas incluem o banco de arquivo, para que o resumo continue
+        completo depois que registros antigos forem arquivados.
+        """
+        pomodoro = all_time(PomodoroSession)
+        pomodoro_day = func.date(pomodoro.c.start_time)
+        focus = func.sum(cast(func.round(
+            (func.julianday(pomodoro.c.end_time) -
+             func.julianday(pomodoro.c.start_time)) * 1440
+        ), Integer))
+        pomodoros = select(
+            pomodoro.c.user_id, pomodoro_day, func.count(), focus
+        ).where(and_(
+            pomodoro.c.user_id.in_(user_ids),
+            pomodoro.c.completed == True
+        )).group_by(pomodoro.c.user_id, pomodoro_day)
+
+        for user_id, day, count, minutes in conn.execute(pomodoros):
+            yield (user_id, day), {'pomodoros': count, 'focus_minutes': minutes or 0}
+
+        study = all_time(StudySession)
+        study_day = func.date(study.c.start_time)
+        study_minutes = select(
+            study.c.user_id, study_day, func.sum(study.c.duration)
+        ).where(
+            study.c.user_id.in_(user_ids)
+        ).group_by(study.c.user_id, study_day)
+
+        for user_id, day, minutes in conn.execute(study_minutes):
+            yield (user_id, day), {'study_minutes': minutes or 0}
+
+        task = all_time(Task)
+        task_day = func.date(task.c.completion_date)
+        tasks = select(
+            task.c.user_id, task_day, func.count()
+        ).where(and_(
+            task.c.user_id.in_(user_ids),
+            task.c.completed == True,
+            task.c.completion_date.isnot(None)
+        )).group_by(task.c.user_id, task_day)
+
+        for user_id, day, count in conn.execute(tasks):
+            yield (user_id, day), {'tasks_completed': count}
@@ -1,15 +1,17 @@
 from datetime import datetime, timedelta
 import random
-import numpy as np
 from src.database.models import StudySession, UserLevel
 from src.database.database import get_session
+from src.utils.lazy_import import lazy_import
+
+np = lazy_import('numpy')
 
 class StudyRecommender:
     """Sistema de recomendação inteligente de tópicos de estudo."""
     
     def __init__(self, user_id):
         self.user_id = user_id
-        self.session = get_session()
+        self.session = get_session(user_id)
         
         # Tópicos de matemática para recomendação
         self.study_topics = {
@@ -207,4 +209,8 @@ class StudyRecommender:
                 "topics": day_recommendations
             }
         
-        return plan 
\ No newline at end of file
+        return plan
+    
+    def __del__(self):
+        """Fecha a sessão do banco de dados."""
+        self.session.close()
@@ -2,11 +2,13 @@ from datetime import datetime, date
 from sqlalchemy import and_
 from src.database.models import Task
 from src.database.database import get_session
+from src.database.write_behind import get_write_queue
 
 class TaskManager:
     def __init__(self, user_id):
         self.user_id = user_id
-        self.session = get_session()
+        self.session = get_session(user_id)
+        self._queued = []  # (Future, tarefa) das conclusões enviadas à fila
         
     def add_task(self, title: str, description: str = None, deadline: str = None):
         """Adiciona uma nova tarefa."""
@@ -43,6 +45,7 @@ class TaskManager:
             
     def get_today_tasks(self):
         """Retorna as tarefas do dia."""
+        self._expire_written()
         today = date.today()
         tomorrow = date.today().replace(day=today.day + 1)
         
@@ -55,14 +58,39 @@ class TaskManager:
         ).all()
         
     def complete_task(self, task_id: int):
-        """Marca uma tarefa como concluída."""
+        """Marca uma tarefa como concluída (gravada pela fila em segundo plano)."""
+        self._expire_written()
         task = self.session.query(Task).get(task_id)
-        if task and task.user_id == self.user_id:
-            task.completed = True
-            task.completion_date = datetime.now()
-            self.session.commit()
-            return True
-        return False
+        if not task or task.user_id != self.user_id:
+            return False
+        
+        completion_date = datetime.now()
+        
+        def apply(session):
+            session.query(Task).filter_by(id=task_id).update(
+                {'completed': True, 'completion_date': completion_date}
+            )
+        
+        future = get_write_queue().submit(apply, self.user_id, pending=('task_complete', task_id))
+        self._queued.append((future, task))
+        return True
+    
+    def _expire_written(self):
+        """Expira as tarefas cujas conclusões enfileiradas já foram gravadas.
+
+        A fila grava em outra sessão, e esta continuaria devolvendo o
+        estado antigo do mapa de identidade. Roda antes de cada leitura,
+        na thread dona da sessão (o callback do Future rodaria na thread
+        da fila, e a sessão não é thread-safe).
+        """
+        queued = []
+        for future, task in self._queued:
+            if future.done():
+                if task in self.session:
+                    self.session.expire(task)
+            else:
+                queued.append((future, task))
+        self._queued = queued
         
     def delete_task(self, task_id: int):
         """Remove uma tarefa."""
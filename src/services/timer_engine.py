@@ -0,0 +1,78 @@
+import math
+import time
+
+class TimerEngine:
+    """Contagem regressiva ancorada em um prazo de ``time.monotonic()``.
+
+    O tempo restante é sempre calculado a partir do relógio, nunca
+    decrementado a cada callback: atrasos do loop de eventos apenas adiam
+    a atualização da tela, sem acumular desvio no timer.
+    """
+
+    def __init__(self, duration: float = 0, clock=time.monotonic):
+        self.clock = clock
+        self.duration = duration
+        self.deadline = None  # Prazo monotônico enquanto o timer está rodando
+        self.paused_remaining = duration
+
+    @property
+    def is_running(self) -> bool:
+        return self.deadline is not None
+
+    def start(self):
+        """Inicia (ou retoma) a contagem a partir do tempo restante."""
+        if self.deadline is None:
+            self.deadline = self.clock() + self.paused_remaining
+
+    def pause(self):
+        """Pausa a contagem guardando o tempo restante."""
+        if self.deadline is not None:
+            self.paused_remaining = self.remaining()
+            self.deadline = None
+
+    def reset(self, duration: float = None, remaining: float = None):
+        """Para o timer e volta à duração inicial (ou a uma nova duração).
+
+        ``remaining`` permite restaurar um ciclo já iniciado.
+        """
+        if duration is not None:
+            self.duration = duration
+        self.deadline = None
+        self.paused_remaining = self.duration if remaining is None else remaining
+
+    def remaining(self) -> float:
+        """Segundos restantes (fracionários)."""
+        if self.deadline is None:
+            return self.paused_remaining
+        return max(0.0, self.deadline - self.clock())
+
+    def remaining_seconds(self) -> int:
+        """Segundos restantes como exibidos na tela (arredondados para cima)."""
+        return math.ceil(self.remaining())
+
+    def is_finished(self) -> bool:
+        return self.remaining() <= 0
+
+    def progress(self) -> float:
+        """Fração já decorrida, de 0 a 1."""
+        if self.duration <= 0:
+            return 1.0
+        return 1.0 - self.remaining() / self.duration
+
+    def ms_until_change(self, step: int = 1) -> int:
+        """Milissegundos até o valor exibido (em passos de ``step`` segundos) mudar."""
+        remaining = self.remaining()
+        if remaining <= 0:
+            return 0
+        # A tela mostra ceil(restante); ela muda ao cruzar o múltiplo de step abaixo
+        next_value = (math.ceil(remaining / step) - 1) * step
+        return max(1, math.ceil((remaining - next_value) * 1000))
+
+    def ms_until_finish(self) -> int:
+        """Milissegundos até o fim da contagem."""
+        return math.ceil(self.remaining() * 1000)
+
+    def format(self) -> str:
+        """Tempo restante no formato MM:SS."""
+        minutes, seconds = divmod(self.remaining_seconds(), 60)
+        return f"{minutes:02d}:{seconds:02d}"
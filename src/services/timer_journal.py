@@ -0,0 +1,124 @@
+from collections import namedtuple
+import os
+import struct
+import sys
+import time
+import logging
+from src.database.database import get_data_dir
+from src.config.settings import TIMER_JOURNAL
+
+# Eventos registrados no diário
+START, PAUSE, RESUME, END, ABORT = 1, 2, 3, 4, 5
+EVENT_NAMES = {START: 'start', PAUSE: 'pause', RESUME: 'resume', END: 'end', ABORT: 'abort'}
+
+MODES = ('work', 'break', 'long_break')
+
+# evento, modo, pomodoros concluídos, início do ciclo, instante do evento,
+# segundos restantes e duração do ciclo (horários em time.time())
+RECORD = struct.Struct('<BBH4xdddd')
+
+JournalRecord = namedtuple(
+    'JournalRecord',
+    ['event', 'mode', 'count', 'started_at', 'event_at', 'remaining', 'duration']
+)
+
+class TimerJournal:
+    """Diário somente de acréscimo com o estado do timer Pomodoro.
+
+    Cada registro tem tamanho fixo e carrega o estado completo do timer,
+    então retomar exige ler apenas o último registro (O(1), qualquer que
+    seja o tamanho do arquivo). Só as mudanças de ciclo chamam fsync;
+    pausas e retomadas vão para o sistema operacional com flush, o que
+    basta para sobreviver ao encerramento forçado do processo.
+    """
+
+    def __init__(self, user_id, path: str = None):
+        directory = os.path.join(get_data_dir(), TIMER_JOURNAL['directory'])
+        self.path = path or os.path.join(directory, f"timer_{user_id}.bin")
+        self.logger = logging.getLogger('timer_journal')
+        self._file = None
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+
+    def append(self, event: int, mode: str, count: int, started_at: float,
+               remaining: float, duration: float, sync: bool = False):
+        """Acrescenta um registro; ``sync`` força o fsync (mudança de ciclo)."""
+        record = RECORD.pack(
+            event, MODES.index(mode), min(count, 0xFFFF), started_at,
+            time.time(), remaining, duration
+        )
+        try:
+            if self._file is None:
+                self._file = open(self.path, 'ab')
+            self._file.write(record)
+            self._file.flush()
+            if sync:
+                os.fsync(self._file.fileno())
+                if self._file.tell() >= TIMER_JOURNAL['max_records'] * RECORD.size:
+                    self.compact()
+        except OSError as e:
+            self.logger.error(f"Erro ao gravar o diário do timer: {e}")
+
+    def _last_bytes(self):
+        """Bytes do último registro completo (um registro parcial no fim é ignorado)."""
+        try:
+            with open(self.path, 'rb') as f:
+                size = f.seek(0, os.SEEK_END)
+                offset = (size // RECORD.size - 1) * RECORD.size
+                if offset < 0:
+                    return None
+                f.seek(offset)
+                return f.read(RECORD.size)
+        except FileNotFoundError:
+            return None
+
+    def last(self):
+        """Retorna o último registro, ou None se o diário estiver vazio."""
+        data = self._last_bytes()
+        if data is None:
+            return None
+
+        event, mode, count, started_at, event_at, remaining, duration = RECORD.unpack(data)
+        if event not in EVENT_NAMES or mode >= len(MODES):
+            self.logger.warning("Último registro do diário do timer inválido; ignorando")
+            return None
+        return JournalRecord(EVENT_NAMES[event], MODES[mode], count,
+                             started_at, event_at, remaining, duration)
+
+    def records(self):
+        """Percorre todos os registros completos (para inspeção)."""
+        try:
+            with open(self.path, 'rb') as f:
+                while True:
+                    data = f.read(RECORD.size)
+                    if len(data) < RECORD.size:
+                        break
+                    event, mode, *rest = RECORD.unpack(data)
+                    yield JournalRecord(EVENT_NAMES.get(event, '?'), MODES[mode % len(MODES)], *rest)
+        except FileNotFoundError:
+            return
+
+    def compact(self):
+        """Reescreve o diário só com o último registro."""
+        self.close()
+        data = self._last_bytes()
+        if data is None:
+            return
+        temp_path = self.path + '.tmp'
+        with open(temp_path, 'wb') as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_path, self.path)
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+if __name__ == "__main__":
+    # Uso: python -m src.services.timer_journal <user_id>
+    journal = TimerJournal(int(sys.argv[1]) if len(sys.argv) > 1 else 1)
+    for record in journal.records():
+        print(f"{time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(record.event_at))} "
+              f"{record.event:<7}{record.mode:<11}restante={record.remaining:.0f}s "
+              f"ciclo={record.duration:.0f}s pomodoros={record.count}")
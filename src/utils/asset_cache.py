@@ -0,0 +1,228 @@
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from io import BytesIO
+import hashlib
+import json
+import logging
+import os
+import sys
+import threading
+import time
+import urllib.request
+from PIL import Image
+from src.database.database import get_data_dir
+from src.config.settings import ASSETS
+
+class MemoryCache:
+    """LRU de imagens decodificadas, limitado pelo tamanho dos pixels."""
+
+    def __init__(self, budget_bytes: int):
+        self.budget = budget_bytes
+        self.entries = OrderedDict()
+        self.bytes = 0
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            entry = self.entries.get(key)
+            if entry is None:
+                return None
+            self.entries.move_to_end(key)
+            return entry[0]
+
+    def put(self, key, image: Image.Image):
+        nbytes = image.width * image.height * len(image.getbands())
+        if nbytes > self.budget:
+            return
+        with self._lock:
+            old = self.entries.pop(key, None)
+            if old is not None:
+                self.bytes -= old[1]
+            self.entries[key] = (image, nbytes)
+            self.bytes += nbytes
+            while self.bytes > self.budget:
+                _, (_, size) = self.entries.popitem(last=False)
+                self.bytes -= size
+
+class DiskStore:
+    """Arquivos baixados, guardados pelo hash do conteúdo.
+
+    ``objects/`` contém os bytes nomeados pelo SHA-256 (URLs diferentes
+    com a mesma imagem ocupam um só arquivo) e ``urls/`` aponta cada URL
+    para o hash do seu conteúdo.
+    """
+
+    def __init__(self, directory: str):
+        self.directory = directory
+        self.objects_dir = os.path.join(directory, 'objects')
+        self.urls_dir = os.path.join(directory, 'urls')
+        os.makedirs(self.objects_dir, exist_ok=True)
+        os.makedirs(self.urls_dir, exist_ok=True)
+
+    def _url_path(self, url: str) -> str:
+        return os.path.join(self.urls_dir, hashlib.sha1(url.encode()).hexdigest())
+
+    def _object_path(self, digest: str) -> str:
+        return os.path.join(self.objects_dir, digest[:2], digest)
+
+    def read(self, url: str):
+        """Bytes já baixados de ``url``, ou None."""
+        try:
+            with open(self._url_path(url)) as f:
+                digest = f.read().strip()
+            with open(self._object_path(digest), 'rb') as f:
+                return f.read()
+        except OSError:
+            return None
+
+    def write(self, url: str, data: bytes):
+        digest = hashlib.sha256(data).hexdigest()
+        path = self._object_path(digest)
+        if not os.path.exists(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            self._replace(path, data)
+        self._replace(self._url_path(url), digest.encode())
+
+    def _replace(self, path: str, data: bytes):
+        # Gravar ao lado e renomear: leitores nunca veem um arquivo pela metade
+        temp_path = f"{path}.{threading.get_ident()}.tmp"
+        with open(temp_path, 'wb') as f:
+            f.write(data)
+        os.replace(temp_path, path)
+
+class AssetCache:
+    """Imagens remotas em dois níveis (memória e disco) com downloads em segundo plano.
+
+    ``fetch(url)`` devolve um Future e nunca bloqueia: acertos na memória
+    já vêm resolvidos e o resto roda no pool de threads (leitura do
+    disco, download e decodificação). Pedidos simultâneos da mesma URL
+    compartilham o mesmo Future, então cada imagem é baixada uma só vez.
+    Falhas ficam guardadas por ``failure_ttl`` segundos, para que uma URL
+    inexistente não seja pedida de novo a cada chamada da interface.
+    """
+
+    def __init__(self, directory: str = None, memory_bytes: int = None,
+                 workers: int = None, timeout: float = None, failure_ttl: float = None):
+        self.memory = MemoryCache(memory_bytes or ASSETS['memory_mb'] * 1024 * 1024)
+        self.disk = DiskStore(directory or os.path.join(get_data_dir(), ASSETS['directory']))
+        self.timeout = timeout or ASSETS['timeout_seconds']
+        self.failure_ttl = ASSETS['failure_ttl_seconds'] if failure_ttl is None else failure_ttl
+        self.executor = ThreadPoolExecutor(max_workers=workers or ASSETS['workers'],
+                                           thread_name_prefix='assets')
+        self.logger = logging.getLogger('assets')
+        self.downloads = 0
+        self._inflight = {}
+        self._running = set()
+        self._failures = {}  # url -> (expira_em, exceção)
+        self._lock = threading.Lock()
+
+    def cached(self, url: str):
+        """Imagem em memória, sem tocar no disco nem na rede."""
+        return self.memory.get(url)
+
+    def fetch(self, url: str) -> Future:
+        """Future com a imagem de ``url`` (carregada em segundo plano)."""
+        future, owner = self._request(url)
+        if owner:
+            self.executor.submit(self._resolve, url, future)
+        return future
+
+    def get(self, url: str, timeout: float = None) -> Image.Image:
+        """Versão bloqueante de ``fetch``, para threads de trabalho."""
+        future, _ = self._request(url)
+        # Fazer o trabalho aqui mesmo se ele ainda estiver na fila do pool;
+        # se outra thread já o estiver executando, _resolve retorna e esperamos
+        self._resolve(url, future)
+        return future.result(timeout)
+
+    def submit(self, fn, *args) -> Future:
+        """Executa ``fn`` no pool de downloads (ex.: consultas a APIs)."""
+        return self.executor.submit(fn, *args)
+
+    def fetch_json(self, url: str):
+        """Baixa e interpreta um JSON (sem cache: respostas de API mudam)."""
+        return json.loads(self._download(url))
+
+    def _request(self, url: str):
+        image = self.memory.get(url)
+        if image is not None:
+            future = Future()
+            future.set_result(image)
+            return future, False
+        with self._lock:
+            failure = self._failures.get(url)
+            if failure is not None:
+                expires, error = failure
+                if time.monotonic() < expires:
+                    future = Future()
+                    future.set_exception(error)
+                    return future, False
+                del self._failures[url]
+            future = self._inflight.get(url)
+            if future is not None:
+                return future, False
+            future = Future()
+            self._inflight[url] = future
+            return future, True
+
+    def _resolve(self, url: str, future: Future):
+        # O primeiro a chegar (pool ou get() bloqueante) faz o trabalho
+        with self._lock:
+            if url in self._running or future.done():
+                return
+            self._running.add(url)
+        try:
+            future.set_result(self._load(url))
+        except Exception as e:
+            self.logger.error(f"Erro ao carregar {url}: {e}")
+            with self._lock:
+                self._failures[url] = (time.monotonic() + self.failure_ttl, e)
+            future.set_exception(e)
+        finally:
+            with self._lock:
+                self._running.discard(url)
+                self._inflight.pop(url, None)
+
+    def _load(self, url: str) -> Image.Image:
+        data = self.disk.read(url)
+        if data is None:
+            data = self._download(url)
+            with self._lock:
+                self.downloads += 1
+            try:
+                self.disk.write(url, data)
+            except OSError as e:
+                self.logger.error(f"Erro ao gravar {url} no cache: {e}")
+        image = Image.open(BytesIO(data))
+        image.load()  # Decodificar aqui, fora da thread da interface
+        self.memory.put(url, image)
+        return image
+
+    def _download(self, url: str) -> bytes:
+        request = urllib.request.Request(url, headers={'User-Agent': 'AnimeProductivity'})
+        with urllib.request.urlopen(request, timeout=self.timeout) as response:
+            return response.read()
+
+_cache = None
+_cache_lock = threading.Lock()
+
+def get_asset_cache() -> AssetCache:
+    """Cache de imagens compartilhado pelo processo."""
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            _cache = AssetCache()
+        return _cache
+
+if __name__ == "__main__":
+    if len(sys.argv) < 2:
+        print("Uso: python -m src.utils.asset_cache URL [URL ...]")
+        sys.exit(1)
+    cache = get_asset_cache()
+    for url, future in [(url, cache.fetch(url)) for url in sys.argv[1:]]:
+        try:
+            image = future.result()
+            print(f"{url}: {image.width}x{image.height} {image.mode}")
+        except Exception as e:
+            print(f"{url}: erro ({e})")
+    print(f"Downloads: {cache.downloads}")
@@ -1,11 +1,9 @@
-import os
-import requests
-import base64
+import asyncio
+from concurrent.futures import Future
 from PIL import Image
-from io import BytesIO
-from pathlib import Path
-import json
 import customtkinter as ctk
+from src.utils.asset_cache import get_asset_cache
+from src.config.settings import ASSETS
 
 class AssetManager:
     def __init__(self):
@@ -38,46 +36,51 @@ class AssetManager:
             "formula": "📐"
         }
         
-        # URLs das APIs
+        # URLs das APIs (configuráveis em ASSETS)
         self.apis = {
-            "waifu": "https://api.waifu.pics/sfw/",
-            "icons8": "https://api.icons8.com/api/iconsets/v4/icons"
+            "waifu": ASSETS['waifu_url'],
+            "icons8": ASSETS['icons_url']
         }
+        self.cache = get_asset_cache()
         
     def get_emoji(self, name: str) -> str:
         """Retorna o emoji correspondente ao nome."""
         return self.emojis.get(name, "❓")
         
     async def get_anime_image(self, category: str = "wave") -> Image.Image:
-        """Obtém uma imagem anime da API Waifu.pics."""
+        """Obtém uma imagem anime da API Waifu.pics sem bloquear o loop de eventos."""
         try:
-            url = f"{self.apis['waifu']}{category}"
-            response = requests.get(url)
-            if response.status_code == 200:
-                img_url = response.json()["url"]
-                img_response = requests.get(img_url)
-                return Image.open(BytesIO(img_response.content))
+            return await asyncio.wrap_future(self.fetch_anime_image(category))
         except Exception as e:
             print(f"Erro ao obter imagem anime: {e}")
             return self._get_default_image()
             
-    def get_icon(self, name: str, size: int = 32) -> ctk.CTkImage:
-        """Obtém um ícone do Icons8 ou cache."""
-        cache_path = self.cache_dir / f"icon_{name}_{size}.png"
+    def fetch_anime_image(self, category: str = "wave") -> Future:
+        """Future com uma imagem anime (consulta e download no pool do cache)."""
+        return self.cache.submit(self._load_anime_image, category)
         
-        if cache_path.exists():
-            return ctk.CTkImage(Image.open(cache_path), size=(size, size))
+    def _load_anime_image(self, category: str) -> Image.Image:
+        img_url = self.cache.fetch_json(f"{self.apis['waifu']}{category}")["url"]
+        return self.cache.get(img_url)
             
-        try:
-            # Usar CDN gratuito do Icons8
-            url = f"https://img.icons8.com/{size}/000000/{name}.png"
-            response = requests.get(url)
-            if response.status_code == 200:
-                img = Image.open(BytesIO(response.content))
-                img.save(cache_path)
-                return ctk.CTkImage(img, size=(size, size))
-        except:
-            return self._get_default_icon(size)
+    def icon_url(self, name: str, size: int = 32) -> str:
+        """URL do ícone no CDN do Icons8."""
+        return f"{self.apis['icons8'].rstrip('/')}/{size}/000000/{name}.png"
+        
+    def get_icon(self, name: str, size: int = 32) -> ctk.CTkImage:
+        """Obtém um ícone do cache; se ainda não estiver lá, inicia o download.
+        
+        Nunca bloqueia a interface: enquanto o download não termina,
+        devolve o ícone padrão.
+        """
+        future = self.cache.fetch(self.icon_url(name, size))
+        if future.done() and future.exception() is None:
+            return ctk.CTkImage(future.result(), size=(size, size))
+        return self._get_default_icon(size)
+        
+    def prefetch_icons(self, names, size: int = 32):
+        """Baixa ícones em segundo plano para que ``get_icon`` os encontre prontos."""
+        return [self.cache.fetch(self.icon_url(name, size)) for name in names]
             
     def _get_default_image(self) -> Image.Image:
         """Cria uma imagem padrão."""
@@ -0,0 +1,269 @@
+import argparse
+import json
+import logging
+import os
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Tamanhos padrão do dataset (total de sessões e tarefas)
+DEFAULT_SIZES = [1000, 100000, 1000000]
+
+# Linhas de histórico por usuário sintético
+ROWS_PER_USER = 2000
+
+HOT_PATHS = [
+    'check_achievements',
+    'get_daily_recommendation',
+    'generate_weekly_report',
+    'statistics_snapshot',
+    'login'
+]
+
+PROJECT_DIR = Path(__file__).resolve().parent.parent.parent
+
+def _hot_paths(user_id, username, password, work_dir):
+    """Retorna as funções medidas; importadas aqui para respeitar o diretório de dados."""
+    from src.services.achievement_manager import AchievementManager
+    from src.services.study_recommender import StudyRecommender
+    from src.services.report_generator import ReportGenerator
+    from src.services.statistics_service import StatisticsService
+    from src.services.auth_manager import AuthManager
+
+    report_path = os.path.join(work_dir, 'weekly_report.pdf')
+    return {
+        'check_achievements': lambda: AchievementManager(user_id).check_achievements(),
+        'get_daily_recommendation': lambda: StudyRecommender(user_id).get_daily_recommendation(),
+        'generate_weekly_report': lambda: ReportGenerator(user_id).generate_weekly_report(report_path),
+        'statistics_snapshot': lambda: StatisticsService(user_id).get_snapshot(),
+        'login': lambda: AuthManager().login(username, password)
+    }
+
+class BenchmarkFailure(Exception):
+    """Um caminho crítico devolveu um resultado errado ou registrou um erro."""
+
+class ErrorLog(logging.Handler):
+    """Guarda os erros registrados durante uma medição.
+
+    Os serviços capturam as próprias exceções e só as registram no log
+    (retornando uma lista vazia, por exemplo); sem isso, um caminho
+    quebrado seria medido como se fosse rápido.
+    """
+
+    def __init__(self):
+        super().__init__(logging.ERROR)
+        self.records = []
+
+    def emit(self, record):
+        self.records.append(record)
+
+    def __enter__(self):
+        self.records = []
+        logging.getLogger().addHandler(self)
+        return self
+
+    def __exit__(self, *exc):
+        logging.getLogger().removeHandler(self)
+        if self.records and exc[0] is None:
+            raise BenchmarkFailure(self.records[0].getMessage())
+
+def _expect(condition, message: str):
+    if not condition:
+        raise BenchmarkFailure(message)
+
+def _checks(user_id, username, work_dir):
+    """Retorna a validação do resultado de cada caminho crítico."""
+    from src.database.models import Achievement, UserAchievement
+    from src.database.write_behind import get_write_queue
+    from src.services.achievement_manager import AchievementManager
+
+    report_path = os.path.join(work_dir, 'weekly_report.pdf')
+
+    def check_achievements(result):
+        _expect(isinstance(result, list), f"check_achievements retornou {type(result).__name__}")
+        # Nenhuma conquista completada pode ficar sem ser concedida
+        get_write_queue().flush()
+        manager = AchievementManager(user_id)
+        try:
+            earned = {
+                ua.achievement_id for ua in
+                manager.session.query(UserAchievement).filter_by(user_id=user_id)
+            }
+            missing = [
+                achievement.name for achievement in manager.session.query(Achievement)
+                if achievement.id not in earned and manager.check_achievement_completion(achievement)
+            ]
+        finally:
+            manager.session.close()
+        _expect(not missing, f"conquistas completadas e não concedidas: {missing}")
+
+    def get_daily_recommendation(result):
+        _expect(isinstance(result, list) and len(result) == 3,
+                f"esperadas 3 recomendações, recebido {result!r}")
+        _expect(all(item.get('area') and item.get('topic') for item in result),
+                f"recomendação sem área ou tópico: {result!r}")
+
+    def generate_weekly_report(result):
+        _expect(os.path.exists(report_path), "o relatório semanal não foi gerado")
+        with open(report_path, 'rb') as f:
+            _expect(f.read(5) == b'%PDF-', "o relatório semanal não é um PDF")
+        os.remove(report_path)  # A próxima repetição precisa gerar o seu
+
+    def statistics_snapshot(result):
+        _expect(set(result) == {'pomodoros_today', 'tasks_today', 'total_minutes'},
+                f"estatísticas incompletas: {result!r}")
+        _expect(result['total_minutes'] > 0, "o dataset tem pomodoros, mas o total é zero")
+
+    def login(result):
+        _expect(result is not None and result.id == user_id,
+                f"login de {username} falhou")
+
+    return {
+        'check_achievements': check_achievements,
+        'get_daily_recommendation': get_daily_recommendation,
+        'generate_weekly_report': generate_weekly_report,
+        'statistics_snapshot': statistics_snapshot,
+        'login': login
+    }
+
+def generate_dataset(rows: int) -> dict:
+    """Gera o dataset de ``rows`` linhas no diretório de dados atual."""
+    from src.utils.data_generator import DatasetGenerator
+
+    generator = DatasetGenerator(users=max(1, rows // ROWS_PER_USER))
+    return generator.generate(total_rows=rows)
+
+def bench_paths(work_dir: str) -> dict:
+    """Retorna ``{caminho: (função, validação)}`` para o usuário do benchmark."""
+    from src.utils.data_generator import DatasetGenerator
+
+    user_id = _first_user_id()
+    paths = _hot_paths(user_id, "bench_user_0", DatasetGenerator.PASSWORD, work_dir)
+    checks = _checks(user_id, "bench_user_0", work_dir)
+    return {name: (paths[name], checks[name]) for name in HOT_PATHS}
+
+def run_worker(rows: int, repeat: int) -> dict:
+    """Gera o dataset no diretório de dados atual e mede cada caminho crítico."""
+    started = time.perf_counter()
+    dataset = generate_dataset(rows)
+    generation_time = time.perf_counter() - started
+
+    work_dir = os.environ.get('ANIMEPRODUCTIVITY_DATA_DIR', tempfile.gettempdir())
+    paths = bench_paths(work_dir)
+
+    results = {}
+    for name in HOT_PATHS:
+        function, check = paths[name]
+        timings = []
+        try:
+            for _ in range(repeat):
+                with ErrorLog():
+                    start = time.perf_counter()
+                    result = function()
+                    timings.append((time.perf_counter() - start) * 1000)
+                    check(result)
+            results[name] = {
+                'min_ms': min(timings),
+                'median_ms': statistics.median(timings)
+            }
+        except Exception as e:
+            results[name] = {'error': f"{type(e).__name__}: {e}"}
+
+    return {
+        'rows': rows,
+        'dataset': dataset,
+        'generation_s': generation_time,
+        'results': results
+    }
+
+def _first_user_id():
+    from sqlalchemy import select
+    from src.database.database import engine
+    from src.database.models import User
+
+    with engine.connect() as conn:
+        return conn.execute(
+            select(User.id).where(User.username == "bench_user_0")
+        ).scalar()
+
+def run(sizes, repeat: int = 5, keep: bool = False) -> list:
+    """Executa cada tamanho em um processo separado, com seu próprio banco."""
+    reports = []
+    for rows in sizes:
+        data_dir = tempfile.mkdtemp(prefix=f"bench_{rows}_")
+        env = dict(os.environ, ANIMEPRODUCTIVITY_DATA_DIR=data_dir)
+        print(f"Gerando e medindo dataset com {rows} linhas em {data_dir}...", flush=True)
+
+        try:
+            process = subprocess.run(
+                [sys.executable, '-m', 'src.utils.benchmark',
+                 '--worker', str(rows), '--repeat', str(repeat)],
+                cwd=PROJECT_DIR, env=env, capture_output=True, text=True
+            )
+            if process.returncode != 0:
+                print(process.stderr, file=sys.stderr)
+                continue
+
+            reports.append(json.loads(process.stdout.strip().splitlines()[-1]))
+        finally:
+            if not keep:
+                shutil.rmtree(data_dir, ignore_errors=True)
+
+    return reports
+
+def print_table(reports):
+    """Imprime a mediana (ms) de cada caminho crítico por tamanho de dataset."""
+    header = f"{'Caminho':<28}" + "".join(f"{report['rows']:>14,}" for report in reports)
+    print()
+    print(header)
+    print("-" * len(header))
+    for name in HOT_PATHS:
+        cells = []
+        for report in reports:
+            result = report['results'][name]
+            cells.append(f"{'erro':>14}" if 'error' in result else f"{result['median_ms']:>12.1f}ms")
+        print(f"{name:<28}" + "".join(cells))
+    print()
+    for report in reports:
+        print(f"{report['rows']:,} linhas: dataset gerado em {report['generation_s']:.1f}s "
+              f"({report['dataset']['users']} usuários, {report['dataset']['days']} dias)")
+        for name, result in report['results'].items():
+            if 'error' in result:
+                print(f"  {name}: {result['error']}")
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark dos caminhos críticos dos serviços")
+    parser.add_argument('--sizes', type=int, nargs='+', default=DEFAULT_SIZES,
+                        help="Tamanhos do dataset (linhas de histórico)")
+    parser.add_argument('--repeat', type=int, default=5, help="Repetições por medição")
+    parser.add_argument('--keep', action='store_true', help="Mantém os bancos gerados")
+    parser.add_argument('--json', action='store_true', help="Imprime o resultado em JSON")
+    parser.add_argument('--worker', type=int, help=argparse.SUPPRESS)
+    parser.add_argument('--generate', type=int, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        print(json.dumps(run_worker(args.worker, args.repeat)))
+        return
+    if args.generate:
+        print(json.dumps(generate_dataset(args.generate)))
+        return
+
+    reports = run(args.sizes, args.repeat, args.keep)
+    if args.json:
+        print(json.dumps(reports, indent=4))
+    else:
+        print_table(reports)
+
+    # Resultado errado em qualquer caminho (ou tamanho que nem rodou) é falha
+    failed = len(reports) < len(args.sizes) or any(
+        'error' in result for report in reports for result in report['results'].values()
+    )
+    sys.exit(1 if failed else 0)
+
+if __name__ == "__main__":
+    main()
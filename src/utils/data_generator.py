@@ -0,0 +1,277 @@
+import math
+import random
+import sys
+from datetime import datetime, date, time, timedelta
+from sqlalchemy import select, delete
+from src.database.models import (
+    User, PomodoroSession, StudySession, Task,
+    Achievement, UserAchievement, UserLevel
+)
+from src.database.database import engine, init_db
+from src.services.stats_rollup import StatsRollup
+from src.database.maintenance import DatabaseMaintenance, notify_bulk_change
+from src.utils import password_hasher
+import logging
+
+class DatasetGenerator:
+    """Gera um banco com vários usuários e anos de histórico sintético.
+
+    As distribuições imitam o uso real: dias úteis mais ativos que fins de
+    semana, blocos de pomodoros em horários preferidos de cada usuário,
+    algumas sessões interrompidas e tarefas concluídas dias após a criação.
+    """
+
+    CHUNK_SIZE = 10000
+    PASSWORD = "benchmark123"
+
+    SUBJECTS = ["Álgebra", "Geometria", "Cálculo", "Estatística", "Matemática Discreta"]
+
+    # Início (hora) dos blocos de estudo: manhã, tarde e noite
+    BLOCKS = (8, 14, 19)
+
+    # Média aproximada de linhas geradas por usuário por dia
+    ROWS_PER_USER_DAY = 4
+
+    def __init__(self, users: int = 10, seed: int = 42, chunk_size: int = CHUNK_SIZE):
+        self.users = users
+        self.chunk_size = chunk_size
+        self.random = random.Random(seed)
+        self.logger = logging.getLogger('data_generator')
+
+    def generate(self, days: int = 365 * 2, total_rows: int = None) -> dict:
+        """Popula o banco; com ``total_rows`` o número de dias é calculado para atingi-lo."""
+        init_db()
+
+        if total_rows:
+            days = max(1, math.ceil(total_rows / (self.users * self.ROWS_PER_USER_DAY)))
+
+        user_ids = self._create_users()
+        achievements = self._load_achievements(user_ids[0])
+        start_day = date.today() - timedelta(days=days)
+
+        counts = {'pomodoro': 0, 'study': 0, 'task': 0, 'achievements': 0}
+        buffers = {'pomodoro': [], 'study': [], 'task': []}
+        tables = {
+            'pomodoro': PomodoroSession.__table__,
+            'study': StudySession.__table__,
+            'task': Task.__table__
+        }
+
+        for user_id in user_ids:
+            profile = self._user_profile()
+            progress = {'pomodoro_count': 0, 'study_time': 0, 'task_complete': 0,
+                        'streak_days': 0, 'current_streak': 0}
+            earned = []
+            pending = sorted(achievements, key=lambda a: a['requirement'])
+
+            for offset in range(days):
+                day = start_day + timedelta(days=offset)
+                rows = self._generate_day(user_id, day, profile)
+
+                for kind, row in rows:
+                    buffers[kind].append(row)
+                    counts[kind] += 1
+
+                self._update_progress(progress, rows)
+                for achievement in list(pending):
+                    if progress.get(achievement['type'], 0) >= achievement['requirement']:
+                        pending.remove(achievement)
+                        earned.append((achievement, datetime.combine(day, time(22, 0))))
+
+                if total_rows and sum(counts[k] for k in buffers) >= total_rows:
+                    break
+
+                if sum(len(b) for b in buffers.values()) >= self.chunk_size:
+                    self._flush(buffers, tables)
+
+            self._flush(buffers, tables)
+            counts['achievements'] += self._award(user_id, earned)
+
+            if total_rows and sum(counts[k] for k in buffers) >= total_rows:
+                user_ids = user_ids[:user_ids.index(user_id) + 1]
+                break
+
+        StatsRollup().refresh(user_ids)
+
+        # Estatísticas do planejador atualizadas após a carga em massa
+        if not notify_bulk_change():
+            DatabaseMaintenance().analyze()
+        counts['users'] = len(user_ids)
+        counts['days'] = days
+        self.logger.info(f"Dataset gerado: {counts}")
+        return counts
+
+    def _create_users(self):
+        """Cria os usuários do benchmark (todos com a mesma senha)."""
+        password_hash = password_hasher.hash_password(self.PASSWORD)
+        users = User.__table__
+
+        with engine.begin() as conn:
+            existing = set(conn.execute(select(users.c.username)).scalars())
+            rows = [
+                {
+                    'username': f"bench_user_{i}",
+                    'email': f"bench_user_{i}@example.com",
+                    'password_hash': password_hash,
+                    'access_level': 0,
+                    'created_at': datetime.now()
+                }
+                for i in range(self.users)
+                if f"bench_user_{i}" not in existing
+            ]
+            if rows:
+                conn.execute(users.insert(), rows)
+
+            return list(conn.execute(
+                select(users.c.id).where(users.c.username.like("bench_user_%")).order_by(users.c.id)
+            ).scalars())[:self.users]
+
+    def _load_achievements(self, user_id):
+        """Garante as conquistas padrão e as retorna como dicionários."""
+        from src.services.achievement_manager import AchievementManager
+        AchievementManager(user_id)
+
+        with engine.connect() as conn:
+            return [dict(row._mapping) for row in conn.execute(select(
+                Achievement.id, Achievement.type, Achievement.requirement, Achievement.xp_reward
+            ))]
+
+    def _user_profile(self):
+        """Sorteia os hábitos de estudo de um usuário."""
+        rnd = self.random
+        return {
+            'weekday_activity': rnd.uniform(0.6, 0.95),
+            'weekend_activity': rnd.uniform(0.2, 0.6),
+            'pomodoros_per_day': rnd.uniform(2, 8),
+            'block_weights': [rnd.random() for _ in self.BLOCKS],
+            'completion_rate': rnd.uniform(0.8, 0.97),
+            'tasks_per_day': rnd.uniform(0.3, 1.5),
+            'subjects': rnd.sample(self.SUBJECTS, rnd.randint(2, len(self.SUBJECTS)))
+        }
+
+    def _generate_day(self, user_id, day, profile):
+        """Gera as sessões e tarefas de um usuário em um dia."""
+        rnd = self.random
+        rows = []
+
+        activity = profile['weekend_activity'] if day.weekday() >= 5 else profile['weekday_activity']
+        if rnd.random() < activity:
+            pomodoros = max(1, self._poisson(profile['pomodoros_per_day']))
+            block = rnd.choices(self.BLOCKS, weights=profile['block_weights'])[0]
+            start = datetime.combine(day, time(block)) + timedelta(minutes=rnd.randint(0, 90))
+            subject = rnd.choice(profile['subjects'])
+            session_start = start
+
+            for _ in range(pomodoros):
+                completed = rnd.random() < profile['completion_rate']
+                length = 25 if completed else rnd.randint(3, 24)
+                rows.append(('pomodoro', {
+                    'user_id': user_id,
+                    'start_time': start,
+                    'end_time': start + timedelta(minutes=length),
+                    'completed': completed
+                }))
+                start += timedelta(minutes=length + (15 if rnd.random() < 0.2 else 5))
+
+            rows.append(('study', {
+                'user_id': user_id,
+                'subject': subject,
+                'duration': int((start - session_start).total_seconds() // 60),
+                'start_time': session_start,
+                'end_time': start
+            }))
+
+        for _ in range(self._poisson(profile['tasks_per_day'])):
+            created_at = datetime.combine(day, time(rnd.randint(7, 22), rnd.randint(0, 59)))
+            completed = rnd.random() < 0.75
+            completion_date = created_at + timedelta(hours=rnd.randint(1, 96)) if completed else None
+            rows.append(('task', {
+                'user_id': user_id,
+                'title': f"Revisar {rnd.choice(self.SUBJECTS)}",
+                'description': "Tarefa gerada para benchmark",
+                'deadline': created_at + timedelta(days=rnd.randint(1, 7)),
+                'completed': completed,
+                'completion_date': completion_date,
+                'created_at': created_at,
+                'updated_at': completion_date or created_at
+            }))
+
+        return rows
+
+    def _update_progress(self, progress, rows):
+        """Acumula os totais usados para conceder conquistas retroativamente."""
+        studied = False
+        for kind, row in rows:
+            if kind == 'pomodoro' and row['completed']:
+                progress['pomodoro_count'] += 1
+                studied = True
+            elif kind == 'study':
+                progress['study_time'] += row['duration']
+            elif kind == 'task' and row['completed']:
+                progress['task_complete'] += 1
+
+        progress['current_streak'] = progress['current_streak'] + 1 if studied else 0
+        progress['streak_days'] = max(progress['streak_days'], progress['current_streak'])
+
+    def _award(self, user_id, earned):
+        """Registra as conquistas obtidas e o nível correspondente.
+
+        Conquistas que o usuário já tem (de uma execução anterior) não são
+        inseridas de novo, mas continuam contando para o XP total.
+        """
+        with engine.begin() as conn:
+            owned = dict(conn.execute(
+                select(Achievement.id, Achievement.xp_reward)
+                .join(UserAchievement, UserAchievement.achievement_id == Achievement.id)
+                .where(UserAchievement.user_id == user_id)
+            ).all())
+            new = [
+                (achievement, earned_at) for achievement, earned_at in earned
+                if achievement['id'] not in owned
+            ]
+
+            xp_rewards = dict(owned)
+            xp_rewards.update({achievement['id']: achievement['xp_reward'] for achievement, _ in earned})
+            total_xp = sum(xp_rewards.values())
+            level, current_xp = 1, total_xp
+            while current_xp >= level * 100:
+                current_xp -= level * 100
+                level += 1
+
+            if new:
+                conn.execute(UserAchievement.__table__.insert(), [
+                    {'user_id': user_id, 'achievement_id': achievement['id'], 'earned_at': earned_at}
+                    for achievement, earned_at in new
+                ])
+            conn.execute(delete(UserLevel.__table__).where(UserLevel.user_id == user_id))
+            conn.execute(UserLevel.__table__.insert(), [{
+                'user_id': user_id,
+                'current_level': level,
+                'current_xp': current_xp,
+                'total_xp': total_xp
+            }])
+
+        return len(new)
+
+    def _flush(self, buffers, tables):
+        """Grava os registros acumulados em uma única transação."""
+        with engine.begin() as conn:
+            for kind, buffer in buffers.items():
+                if buffer:
+                    conn.execute(tables[kind].insert(), buffer)
+                    buffer.clear()
+
+    def _poisson(self, mean):
+        """Amostra de uma distribuição de Poisson (método de Knuth)."""
+        limit = math.exp(-mean)
+        k, p = 0, 1.0
+        while True:
+            p *= self.random.random()
+            if p <= limit:
+                return k
+            k += 1
+
+if __name__ == "__main__":
+    users = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+    days = int(sys.argv[2]) if len(sys.argv) > 2 else 365 * 2
+    print(DatasetGenerator(users).generate(days=days))
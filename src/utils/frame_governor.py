@@ -0,0 +1,142 @@
+import time
+import logging
+from src.config.settings import ANIMATION
+
+class FrameStats:
+    """Tempo gasto por uma animação em cada quadro."""
+
+    def __init__(self):
+        self.frames = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+
+    def record(self, ms: float):
+        self.frames += 1
+        self.total_ms += ms
+        self.max_ms = max(self.max_ms, ms)
+
+    def as_dict(self) -> dict:
+        return {
+            'frames': self.frames,
+            'avg_ms': round(self.total_ms / self.frames, 3) if self.frames else 0.0,
+            'max_ms': round(self.max_ms, 3)
+        }
+
+class Subscription:
+    def __init__(self, name, callback, visible, stats):
+        self.name = name
+        self.callback = callback
+        self.visible = visible
+        self.stats = stats
+        self.active = True
+
+class FrameGovernor:
+    """Relógio único que entrega quadros a todas as animações inscritas.
+
+    Um só temporizador (do Qt ou do Tk, via ``driver``) dispara no máximo
+    ``max_fps`` vezes por segundo e chama cada animação com o tempo
+    decorrido. Sem janelas visíveis ou sem inscritos, não agenda nada: a
+    taxa cai a zero até o driver chamar ``wake()``.
+
+    O driver precisa oferecer ``schedule(delay_ms, fn)`` e ``is_visible()``.
+    """
+
+    def __init__(self, driver, max_fps: int = None):
+        self.driver = driver
+        self.max_fps = max_fps or ANIMATION['max_fps']
+        self.logger = logging.getLogger('frame_governor')
+        self.subscriptions = []
+        self.stats = {}
+        self.scheduled = False
+        self.last_frame = None
+
+    @property
+    def frame_interval(self) -> float:
+        return 1.0 / self.max_fps
+
+    def subscribe(self, name: str, callback, visible=None) -> Subscription:
+        """Inscreve ``callback(dt)``; ele retorna False para encerrar a animação.
+
+        ``visible``, se informado, é consultado a cada quadro: enquanto
+        retornar False a animação não é chamada.
+        """
+        subscription = Subscription(name, callback, visible, self.stats.setdefault(name, FrameStats()))
+        self.subscriptions.append(subscription)
+        self.wake()
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription):
+        subscription.active = False
+
+    def wake(self):
+        """Agenda o próximo quadro, se houver animações e janela visível."""
+        if self.scheduled or not self.subscriptions or not self.driver.is_visible():
+            return
+        self.scheduled = True
+        if self.last_frame is None:
+            delay = 0
+        else:
+            elapsed = time.perf_counter() - self.last_frame
+            delay = max(0.0, self.frame_interval - elapsed)
+        self.driver.schedule(int(delay * 1000), self.frame)
+
+    def frame(self):
+        """Executa um quadro de todas as animações ativas."""
+        self.scheduled = False
+        now = time.perf_counter()
+        # Depois de uma pausa (janela oculta), o passo é limitado
+        dt = min(now - (self.last_frame or now), ANIMATION['max_dt_ms'] / 1000)
+        self.last_frame = now
+
+        for subscription in list(self.subscriptions):
+            if not subscription.active:
+                continue
+            if subscription.visible is not None and not subscription.visible():
+                continue
+            start = time.perf_counter()
+            try:
+                keep = subscription.callback(dt)
+            except Exception as e:
+                self.logger.error(f"Erro na animação '{subscription.name}': {e}")
+                keep = False
+            subscription.stats.record((time.perf_counter() - start) * 1000)
+            if keep is False:
+                subscription.active = False
+
+        self.subscriptions = [s for s in self.subscriptions if s.active]
+        if not self.subscriptions:
+            self.last_frame = None
+        self.wake()
+
+    def frame_stats(self) -> dict:
+        """Estatísticas de tempo por quadro de cada animação (por nome)."""
+        return {name: stats.as_dict() for name, stats in self.stats.items()}
+
+class TkFrameDriver:
+    """Driver do FrameGovernor para Tk/customtkinter (usa ``after``)."""
+
+    def __init__(self, root):
+        self.root = root
+        # Voltar a animar quando a janela for restaurada
+        root.bind('<Map>', lambda event: governor_for_tk(root).wake(), add='+')
+
+    def schedule(self, delay_ms: int, fn):
+        self.root.after(max(1, delay_ms), fn)
+
+    def is_visible(self) -> bool:
+        try:
+            return bool(self.root.winfo_viewable()) and self.root.state() != 'iconic'
+        except Exception:
+            return False
+
+_tk_governors = {}
+
+def governor_for_tk(widget) -> FrameGovernor:
+    """Retorna o governador da raiz Tk de ``widget``."""
+    root = widget._root()
+    governor = _tk_governors.get(root)
+    if governor is None:
+        governor = FrameGovernor(None)
+        _tk_governors[root] = governor
+        governor.driver = TkFrameDriver(root)
+    return governor
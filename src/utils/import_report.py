@@ -0,0 +1,90 @@
+import argparse
+import os
+import subprocess
+import sys
+
+PROJECT_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Módulo que a inicialização importa até a janela principal
+DEFAULT_TARGET = 'src.gui.main_window'
+
+# Dependências pesadas carregadas sob demanda (via src.utils.lazy_import)
+HEAVY_MODULES = [
+    'numpy',
+    'matplotlib.pyplot',
+    'matplotlib.backends.backend_qt5agg',
+    'reportlab.platypus',
+    'reportlab.graphics.charts.linecharts',
+    'googleapiclient.discovery',
+    'google_auth_oauthlib.flow'
+]
+
+def measure(target, extra=()) -> dict:
+    """Importa ``target`` (e ``extra``, se instalados) em um processo novo com -X importtime.
+
+    Retorna {pacote de primeiro nível: microssegundos}, somando o tempo
+    próprio de todos os seus submódulos, mais a chave especial '__total__'.
+    """
+    code = "\n".join(
+        [f"import {target}"] +
+        [f"try:\n    import {module}\nexcept ImportError:\n    pass" for module in extra]
+    )
+    process = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', code],
+        cwd=PROJECT_DIR, capture_output=True, text=True
+    )
+
+    packages = {}
+    errors = []
+    for line in process.stderr.splitlines():
+        # Formato: "import time: <próprio> | <cumulativo> | <indentação><módulo>"
+        if not line.startswith('import time:'):
+            errors.append(line)
+            continue
+        if 'cumulative' in line:
+            continue
+        own, _, name = line[len('import time:'):].split('|')
+        package = name.strip().split('.')[0]
+        packages[package] = packages.get(package, 0) + int(own)
+
+    if process.returncode != 0 and errors:
+        packages['__error__'] = errors[-1]
+    packages['__total__'] = sum(packages.get(name, 0) for name in packages if not name.startswith('__'))
+    return packages
+
+def print_table(packages, top: int):
+    """Imprime os pacotes mais caros de importar."""
+    items = sorted(
+        ((name, us) for name, us in packages.items() if not name.startswith('__')),
+        key=lambda item: item[1], reverse=True
+    )
+    print(f"{'Pacote':<32}{'ms':>10}")
+    print("-" * 42)
+    for name, us in items[:top]:
+        print(f"{name:<32}{us / 1000:>10.1f}")
+    print("-" * 42)
+    print(f"{'Total':<32}{packages['__total__'] / 1000:>10.1f}")
+    if '__error__' in packages:
+        print(f"Erro na importação: {packages['__error__']}")
+
+def main():
+    parser = argparse.ArgumentParser(description="Relatório do tempo de importação (-X importtime)")
+    parser.add_argument('--target', default=DEFAULT_TARGET, help="Módulo medido")
+    parser.add_argument('--top', type=int, default=15, help="Pacotes exibidos")
+    parser.add_argument('--savings', action='store_true',
+                        help="Compara com a importação imediata das dependências pesadas")
+    args = parser.parse_args()
+
+    lazy = measure(args.target)
+    print(f"Importação de {args.target}:\n")
+    print_table(lazy, args.top)
+
+    if args.savings:
+        eager = measure(args.target, HEAVY_MODULES)
+        print(f"\nCom as dependências pesadas importadas na inicialização:\n")
+        print_table(eager, args.top)
+        saved = (eager['__total__'] - lazy['__total__']) / 1000
+        print(f"\nEconomia na inicialização: {saved:.1f}ms")
+
+if __name__ == "__main__":
+    main()
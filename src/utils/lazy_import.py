@@ -0,0 +1,49 @@
+import importlib
+import sys
+import threading
+import types
+
+class LazyModule(types.ModuleType):
+    """Módulo importado só no primeiro acesso a um atributo.
+
+    Permite declarar dependências pesadas (matplotlib, reportlab, APIs do
+    Google) no topo do arquivo sem pagar a importação na inicialização.
+    Um módulo ausente só gera erro quando for realmente usado.
+    """
+
+    def __init__(self, name: str):
+        super().__init__(name)
+        self.__dict__['_lazy_module'] = None
+        self.__dict__['_lazy_lock'] = threading.Lock()
+
+    def _load(self):
+        module = self.__dict__['_lazy_module']
+        if module is None:
+            with self.__dict__['_lazy_lock']:
+                module = self.__dict__['_lazy_module']
+                if module is None:
+                    module = importlib.import_module(self.__name__)
+                    self.__dict__['_lazy_module'] = module
+        return module
+
+    def __getattr__(self, attr):
+        return getattr(self._load(), attr)
+
+    def __dir__(self):
+        return dir(self._load())
+
+    def __repr__(self):
+        state = "carregado" if self.__dict__['_lazy_module'] is not None else "não carregado"
+        return f"<módulo preguiçoso '{self.__name__}' ({state})>"
+
+def lazy_import(name: str):
+    """Retorna o módulo ``name``, adiando a importação até o primeiro uso."""
+    if name in sys.modules:
+        return sys.modules[name]
+    return LazyModule(name)
+
+def is_loaded(module) -> bool:
+    """Indica se um módulo preguiçoso já foi importado."""
+    if isinstance(module, LazyModule):
+        return module.__dict__['_lazy_module'] is not None
+    return True
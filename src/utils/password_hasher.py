@@ -0,0 +1,83 @@
+import json
+import math
+import os
+import sys
+import threading
+import time
+import bcrypt
+import logging
+from src.database.database import get_data_dir
+from src.config.settings import PASSWORD_HASHING
+
+logger = logging.getLogger('password_hasher')
+
+_rounds = None
+_rounds_lock = threading.Lock()
+
+def _calibration_path():
+    return os.path.join(get_data_dir(), PASSWORD_HASHING['calibration_file'])
+
+def calibrate(target_ms: float = None) -> int:
+    """Mede o bcrypt nesta máquina e escolhe o custo mais alto dentro do tempo alvo.
+
+    Cada custo a mais dobra o tempo, então basta medir o custo mínimo.
+    """
+    target_ms = target_ms or PASSWORD_HASHING['target_ms']
+    min_rounds = PASSWORD_HASHING['min_rounds']
+
+    salt = bcrypt.gensalt(rounds=min_rounds)
+    start = time.perf_counter()
+    bcrypt.hashpw(b"calibration", salt)
+    elapsed_ms = (time.perf_counter() - start) * 1000
+
+    extra = int(math.floor(math.log2(target_ms / elapsed_ms))) if elapsed_ms < target_ms else 0
+    rounds = max(min_rounds, min(PASSWORD_HASHING['max_rounds'], min_rounds + extra))
+
+    try:
+        with open(_calibration_path(), 'w') as f:
+            json.dump({'rounds': rounds, 'measured_ms': elapsed_ms, 'target_ms': target_ms}, f)
+    except OSError as e:
+        logger.warning(f"Não foi possível salvar a calibração do bcrypt: {e}")
+
+    logger.info(f"Custo do bcrypt calibrado: {rounds} ({elapsed_ms:.1f}ms no custo {min_rounds})")
+    return rounds
+
+def get_rounds() -> int:
+    """Retorna o custo do bcrypt, calibrando na primeira execução."""
+    global _rounds
+    with _rounds_lock:
+        if _rounds is None:
+            try:
+                with open(_calibration_path(), 'r') as f:
+                    _rounds = int(json.load(f)['rounds'])
+            except (OSError, ValueError, KeyError):
+                _rounds = calibrate()
+        return _rounds
+
+def hash_password(password: str) -> str:
+    """Gera o hash bcrypt de uma senha com o custo calibrado."""
+    return bcrypt.hashpw(
+        password.encode('utf-8'),
+        bcrypt.gensalt(rounds=get_rounds())
+    ).decode('utf-8')
+
+def verify_password(password: str, password_hash: str) -> bool:
+    """Verifica uma senha contra o hash armazenado."""
+    try:
+        return bcrypt.checkpw(password.encode('utf-8'), password_hash.encode('utf-8'))
+    except Exception as e:
+        logger.error(f"Erro ao verificar senha: {e}")
+        return False
+
+def needs_rehash(password_hash: str) -> bool:
+    """Indica se o hash foi gerado com um custo diferente do atual."""
+    try:
+        # Formato: $2b$<custo>$<salt+hash>
+        return int(password_hash.split('$')[2]) != get_rounds()
+    except (IndexError, ValueError):
+        return True
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    target = float(sys.argv[1]) if len(sys.argv) > 1 else None
+    print(f"Custo escolhido: {calibrate(target)}")
@@ -0,0 +1,90 @@
+from contextlib import contextmanager
+from datetime import datetime
+import argparse
+import json
+import os
+import subprocess
+import sys
+import time
+import logging
+from src.config.settings import STARTUP
+
+PROJECT_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+class StartupTimer:
+    """Mede as fases da inicialização e compara o total com o orçamento."""
+
+    def __init__(self, budget_ms: float = None):
+        self.budget_ms = budget_ms or STARTUP['budget_ms']
+        self.logger = logging.getLogger('startup')
+        self.started = time.perf_counter()
+        self.phases = []
+
+    @contextmanager
+    def phase(self, name: str):
+        """Cronometra uma fase da inicialização."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phases.append((name, (time.perf_counter() - start) * 1000))
+
+    @property
+    def total_ms(self) -> float:
+        return (time.perf_counter() - self.started) * 1000
+
+    def report(self) -> dict:
+        """Registra as fases no log de inicialização e retorna o resumo."""
+        total = self.total_ms
+        summary = {
+            'total_ms': round(total, 1),
+            'budget_ms': self.budget_ms,
+            'phases': {name: round(ms, 1) for name, ms in self.phases}
+        }
+
+        phases = ", ".join(f"{name}={ms:.0f}ms" for name, ms in self.phases)
+        message = f"Inicialização em {total:.0f}ms ({phases})"
+        if total > self.budget_ms:
+            self.logger.warning(f"{message} - acima do orçamento de {self.budget_ms}ms")
+        else:
+            self.logger.info(message)
+
+        try:
+            from src.database.database import get_data_dir
+            with open(os.path.join(get_data_dir(), STARTUP['log_file']), 'a') as f:
+                f.write(f"[{datetime.now()}] {json.dumps(summary)}\n")
+        except OSError:
+            pass
+
+        return summary
+
+def measure_cold_start(runs: int = 3) -> list:
+    """Executa a aplicação em processos novos até a primeira janela e coleta os tempos."""
+    results = []
+    for _ in range(runs):
+        process = subprocess.run(
+            [sys.executable, '-m', 'src.main', '--measure-startup'],
+            cwd=PROJECT_DIR, capture_output=True, text=True
+        )
+        if process.returncode != 0:
+            raise RuntimeError(process.stderr.strip())
+        results.append(json.loads(process.stdout.strip().splitlines()[-1]))
+    return results
+
+def main():
+    parser = argparse.ArgumentParser(description="Mede a partida a frio da aplicação")
+    parser.add_argument('--runs', type=int, default=3, help="Número de execuções")
+    args = parser.parse_args()
+
+    results = measure_cold_start(args.runs)
+    for result in results:
+        phases = ", ".join(f"{name}={ms:.0f}ms" for name, ms in result['phases'].items())
+        print(f"{result['total_ms']:>8.0f}ms  {phases}")
+
+    worst = max(result['total_ms'] for result in results)
+    budget = results[0]['budget_ms']
+    print(f"Pior tempo: {worst:.0f}ms (orçamento: {budget}ms)")
+    sys.exit(0 if worst <= budget else 1)
+
+if __name__ == "__main__":
+    main()
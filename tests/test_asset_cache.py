@@ -0,0 +1,114 @@
+import os
+import shutil
+import tempfile
+import threading
+import unittest
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from io import BytesIO
+
+# Isolar o diretório de dados antes de importar os módulos do app
+os.environ.setdefault("ANIMEPRODUCTIVITY_DATA_DIR", tempfile.mkdtemp(prefix="assets-data-"))
+
+from PIL import Image
+from src.utils.asset_cache import AssetCache
+
+def _png(color):
+    buffer = BytesIO()
+    Image.new('RGB', (40, 30), color).save(buffer, 'PNG')
+    return buffer.getvalue()
+
+class StubHandler(BaseHTTPRequestHandler):
+    """Servidor HTTP local: /img/<nome>.png responde um PNG, o resto 404."""
+
+    hits = {}
+    gate = threading.Event()
+
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        StubHandler.hits[self.path] = StubHandler.hits.get(self.path, 0) + 1
+        # Segurar a resposta até o teste liberar (para os pedidos se sobreporem)
+        StubHandler.gate.wait(5)
+        if self.path.startswith('/img/') and self.path.endswith('.png'):
+            body = _png('red')
+            self.send_response(200)
+            self.send_header('Content-Type', 'image/png')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+        else:
+            self.send_response(404)
+            self.end_headers()
+
+class AssetCacheTest(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.server = ThreadingHTTPServer(('127.0.0.1', 0), StubHandler)
+        cls.base_url = f"http://127.0.0.1:{cls.server.server_port}"
+        cls.thread = threading.Thread(target=cls.server.serve_forever, daemon=True)
+        cls.thread.start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def setUp(self):
+        StubHandler.hits = {}
+        StubHandler.gate.set()
+        self.directory = tempfile.mkdtemp(prefix="asset-cache-")
+        self.cache = AssetCache(directory=self.directory, workers=4, timeout=5)
+
+    def tearDown(self):
+        self.cache.executor.shutdown(wait=True)
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+    def test_concurrent_fetches_are_coalesced(self):
+        url = f"{self.base_url}/img/coalesce.png"
+        StubHandler.gate.clear()
+        futures = [self.cache.fetch(url) for _ in range(10)]
+        StubHandler.gate.set()
+
+        images = [future.result(5) for future in futures]
+        self.assertEqual(StubHandler.hits, {'/img/coalesce.png': 1})
+        self.assertTrue(all(image.size == (40, 30) for image in images))
+        self.assertEqual(self.cache.downloads, 1)
+
+    def test_fresh_cache_reads_from_disk(self):
+        url = f"{self.base_url}/img/disk.png"
+        self.cache.fetch(url).result(5)
+
+        fresh = AssetCache(directory=self.directory, workers=1, timeout=5)
+        try:
+            image = fresh.fetch(url).result(5)
+        finally:
+            fresh.executor.shutdown(wait=True)
+        self.assertEqual(image.size, (40, 30))
+        self.assertEqual(fresh.downloads, 0)
+        self.assertEqual(StubHandler.hits, {'/img/disk.png': 1})
+
+    def test_not_found_becomes_failed_future_and_is_not_refetched(self):
+        url = f"{self.base_url}/missing"
+        for _ in range(3):
+            future = self.cache.fetch(url)
+            self.assertIsNotNone(future.exception(5))
+        self.assertEqual(StubHandler.hits, {'/missing': 1})
+
+    def test_get_does_not_wait_behind_busy_pool(self):
+        cache = AssetCache(directory=self.directory, workers=1, timeout=5)
+        try:
+            blocker = threading.Event()
+            cache.submit(blocker.wait, 5)
+            url = f"{self.base_url}/img/inline.png"
+            cache.fetch(url)  # Fica na fila atrás da tarefa bloqueada
+
+            image = cache.get(url, timeout=2)
+            self.assertEqual(image.size, (40, 30))
+            blocker.set()
+        finally:
+            cache.executor.shutdown(wait=True)
+
+if __name__ == "__main__":
+    unittest.main()
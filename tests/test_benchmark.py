@@ -0,0 +1,58 @@
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+
+# Isolar o diretório de dados antes de importar os módulos do app
+os.environ.setdefault("ANIMEPRODUCTIVITY_DATA_DIR", tempfile.mkdtemp(prefix="bench-data-"))
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+from src.database.database import DATA_DIR, engine
+from src.database.write_behind import get_write_queue
+from src.utils import benchmark as harness
+
+# Arquivos do banco trocados a cada tamanho de dataset
+DATABASES = ('animeproductivity.db', 'archive.db')
+
+@pytest.fixture(scope="module", params=harness.DEFAULT_SIZES, ids=lambda rows: f"{rows}_rows")
+def dataset(request, tmp_path_factory):
+    """Gera o dataset em outro processo e o coloca no lugar do banco em uso.
+
+    A engine aponta para um arquivo fixo desde a importação, então cada
+    tamanho é gerado à parte e copiado por cima do banco de teste.
+    """
+    if not os.path.realpath(DATA_DIR).startswith(os.path.realpath(tempfile.gettempdir())):
+        pytest.skip(f"{DATA_DIR} não é temporário; o benchmark substituiria o banco")
+
+    rows = request.param
+    generated = tmp_path_factory.mktemp(f"dataset_{rows}")
+    subprocess.run(
+        [sys.executable, '-m', 'src.utils.benchmark', '--generate', str(rows)],
+        cwd=harness.PROJECT_DIR, check=True, capture_output=True,
+        env=dict(os.environ, ANIMEPRODUCTIVITY_DATA_DIR=str(generated))
+    )
+
+    get_write_queue().flush()
+    engine.dispose()
+    for name in DATABASES:
+        source, target = generated / name, os.path.join(DATA_DIR, name)
+        if source.exists():
+            shutil.copyfile(source, target)
+        elif os.path.exists(target):
+            os.remove(target)
+    return rows
+
+@pytest.mark.parametrize("name", harness.HOT_PATHS)
+def test_hot_path(benchmark, dataset, name, tmp_path):
+    function, check = harness.bench_paths(str(tmp_path))[name]
+    benchmark.group = name
+    benchmark.extra_info['rows'] = dataset
+
+    # Erros registrados pelos serviços (que engolem as exceções) também falham
+    with harness.ErrorLog():
+        result = benchmark(function)
+        check(result)
@@ -0,0 +1,47 @@
+import os
+import tempfile
+import unittest
+
+# Isolar o diretório de dados antes de importar os módulos do app
+os.environ.setdefault("ANIMEPRODUCTIVITY_DATA_DIR", tempfile.mkdtemp(prefix="timer-data-"))
+
+import pytest
+
+QtCore = pytest.importorskip("PySide6.QtCore")
+
+from src.database.database import init_db
+from src.gui import timer_service
+from src.gui.timer_service import get_timer_service, release_timer_service
+
+class TimerServiceReleaseTest(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.app = QtCore.QCoreApplication.instance() or QtCore.QCoreApplication([])
+        init_db()
+
+    def test_release_stops_clock_and_closes_journal(self):
+        service = get_timer_service(1)
+        service.start()
+        self.assertTrue(service.clock.timer.isActive())
+
+        release_timer_service(1)
+
+        self.assertFalse(service.clock.timer.isActive())
+        self.assertIsNone(service.journal._file)
+        self.assertNotIn(1, timer_service._services)
+        # O ciclo continua valendo: não foi pausado no diário
+        self.assertTrue(service.clock.engine.is_running)
+
+    def test_login_again_creates_fresh_service(self):
+        first = get_timer_service(2)
+        release_timer_service(2)
+        second = get_timer_service(2)
+        self.assertIsNot(first, second)
+        release_timer_service(2)
+
+    def test_release_unknown_user_is_noop(self):
+        release_timer_service(999)
+
+if __name__ == "__main__":
+    unittest.main()